@@ -0,0 +1,440 @@
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tkinter as tk
+import tracemalloc
+import urllib.error
+import urllib.request
+
+try:
+    # only available on unix-like systems
+    import resource
+except ImportError:
+    resource = None
+
+from controllers.main_controller import MainController
+from controllers.battle_summary_controller import BattleSummaryController
+from pkmn import damage_cache
+from pkmn.damage_calc import DamageRange
+from routing import route_events, route_files
+from routing.router import Router
+from utils.constants import const
+from utils import setup, custom_logging
+from gui.pkmn_components.route_list import RouteList
+
+
+def load_route(controller:MainController, route_file_path, solo_mon=None, pkmn_version=None):
+    # saved routes are loaded as-is, base routes (e.g. the min_battles routes) need a solo mon to be run against
+    if solo_mon is None:
+        controller.load_route(route_file_path)
+    else:
+        controller.create_new_route(solo_mon, route_file_path, pkmn_version)
+
+
+def replay_route(controller:MainController, battle_controller:BattleSummaryController, route_file_path, solo_mon=None, pkmn_version=None):
+    # load the route (which calculates every route state), and then load every major fight into the battle summary
+    load_route(controller, route_file_path, solo_mon=solo_mon, pkmn_version=pkmn_version)
+
+    num_events = 0
+    num_battles = 0
+    for cur_event in controller.iter_events(enabled_only=True):
+        num_events += 1
+        if cur_event.event_definition.trainer_def is not None:
+            num_battles += 1
+            battle_controller.load_from_event(cur_event)
+
+    return num_events, num_battles
+
+
+def run_route_benchmark(route_file_path, solo_mon, pkmn_version, num_iterations):
+    controller = MainController()
+    battle_controller = BattleSummaryController(controller)
+
+    # warm up first, so one-time costs (e.g. lazily loaded data) don't skew the timings
+    start = time.perf_counter()
+    num_events, num_battles = replay_route(controller, battle_controller, route_file_path, solo_mon=solo_mon, pkmn_version=pkmn_version)
+    first_replay_time = time.perf_counter() - start
+    first_replay_cache_summary = damage_cache.get_cache_summary()
+
+    timings = []
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        replay_route(controller, battle_controller, route_file_path, solo_mon=solo_mon, pkmn_version=pkmn_version)
+        timings.append(time.perf_counter() - start)
+
+    if resource is not None:
+        # NOTE: grabbed before the tracemalloc pass, since tracing inflates the process memory usage
+        # ru_maxrss is reported in KiB on linux
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    else:
+        peak_rss = None
+
+    # memory is measured in a separate pass, as tracemalloc significantly slows everything down
+    tracemalloc.start()
+    load_route(controller, route_file_path, solo_mon=solo_mon, pkmn_version=pkmn_version)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    replay_route(controller, battle_controller, route_file_path, solo_mon=solo_mon, pkmn_version=pkmn_version)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings.sort()
+    print(f"route: {route_file_path} ({num_events} events, {num_battles} battles)")
+    print(f"first replay time (cold damage cache): {first_replay_time * 1000:.1f} ms")
+    print(f"damage cache after first replay:\n{first_replay_cache_summary}")
+    print(f"damage cache after all replays:\n{damage_cache.get_cache_summary()}")
+    print(f"replay time (best/median of {num_iterations}): {timings[0] * 1000:.1f} ms / {timings[len(timings) // 2] * 1000:.1f} ms")
+    print(f"memory retained by loaded route: {retained / 1024:.1f} KiB")
+    print(f"peak memory during replay: {peak / 1024:.1f} KiB")
+    if peak_rss is not None:
+        print(f"peak RSS of process: {peak_rss / 1024:.1f} MiB")
+
+
+def run_startup_benchmark(port, num_iterations, timeout):
+    # cold start the headless app in a fresh process each time, and time how long until it can answer requests
+    main_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.pyw")
+    url = f"http://127.0.0.1:{port}/get_version"
+
+    timings = []
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        app_process = subprocess.Popen(
+            [sys.executable, main_path, "--port", str(port)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            while True:
+                if app_process.poll() is not None:
+                    raise RuntimeError(f"App exited during startup with code: {app_process.returncode}")
+                if time.perf_counter() - start > timeout:
+                    raise RuntimeError(f"App did not respond within {timeout} seconds")
+
+                try:
+                    with urllib.request.urlopen(url, timeout=1) as response:
+                        if response.status == 200:
+                            break
+                except (urllib.error.URLError, ConnectionError):
+                    time.sleep(0.01)
+
+            timings.append(time.perf_counter() - start)
+        finally:
+            app_process.terminate()
+            app_process.wait()
+
+    timings.sort()
+    print(f"cold start to first /get_version response (best/median of {num_iterations}): {timings[0] * 1000:.1f} ms / {timings[len(timings) // 2] * 1000:.1f} ms")
+
+
+class _DictDamageRange:
+    # the original dict-backed representation of DamageRange, kept around only to compare against
+    def __init__(self, damage_vals:dict):
+        self.damage_vals = dict(damage_vals)
+        self.min_damage = min(self.damage_vals)
+        self.max_damage = max(self.damage_vals)
+        self.size = sum(self.damage_vals.values())
+
+    def add(self, other):
+        result_damage_vals = {}
+        for my_cur_damage, my_count in self.damage_vals.items():
+            for your_cur_damage, your_count in other.damage_vals.items():
+                cur_total_damage = my_cur_damage + your_cur_damage
+                if cur_total_damage not in result_damage_vals:
+                    result_damage_vals[cur_total_damage] = 0
+                result_damage_vals[cur_total_damage] += my_count * your_count
+        return _DictDamageRange(result_damage_vals)
+
+    def split_kills(self, hp_threshold):
+        kill_damage_vals = {}
+        non_kill_damage_vals = {}
+        for cur_damage, cur_count in self.damage_vals.items():
+            if cur_damage >= hp_threshold:
+                kill_damage_vals[cur_damage] = cur_count
+            else:
+                non_kill_damage_vals[cur_damage] = cur_count
+        return _DictDamageRange(kill_damage_vals), _DictDamageRange(non_kill_damage_vals)
+
+
+def run_damage_range_benchmark(num_iterations):
+    # a typical gen 1 roll spread, and psywave (which has many more possible values)
+    test_cases = [
+        ("gen 1 rolls", {31: 2, 32: 6, 33: 6, 34: 7, 35: 6, 36: 6, 37: 6}),
+        ("psywave", {x: 1 for x in range(1, 75)}),
+    ]
+
+    for test_name, damage_vals in test_cases:
+        split_threshold = (min(damage_vals) + max(damage_vals)) // 2
+        for impl_name, impl in [("dict", _DictDamageRange), ("array", DamageRange)]:
+            single_hit = impl(damage_vals)
+            double_hit = single_hit.add(single_hit)
+            timings = {
+                "create": timeit.timeit(lambda: impl(damage_vals), number=num_iterations),
+                "add 2 hits": timeit.timeit(lambda: single_hit.add(single_hit), number=num_iterations),
+                "add 3 hits": timeit.timeit(lambda: double_hit.add(single_hit), number=num_iterations),
+                "split": timeit.timeit(lambda: single_hit.split_kills(split_threshold), number=num_iterations),
+            }
+            rendered = ", ".join([f"{name}: {(total / num_iterations) * 1_000_000:.2f} us" for name, total in timings.items()])
+            print(f"{test_name} ({impl_name}): {rendered}")
+
+
+def get_min_battles_routes():
+    result = []
+    for cur_dir, _, cur_files in sorted(os.walk(const.POKEMON_RAW_DATA)):
+        if os.path.basename(cur_dir) != "min_battles":
+            continue
+        result.extend([os.path.join(cur_dir, x) for x in sorted(cur_files) if x.endswith(const.ROUTE_EXTENSION)])
+    return result
+
+
+def run_route_file_benchmark(num_iterations):
+    # saves and loads every bundled min_battles route in both formats
+    # the routes are re-serialized through the router first, so they match what the app actually saves
+    totals = {x: [0, 0, 0] for x in const.ALL_ROUTE_EXTENSIONS}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for route_path in get_min_battles_routes():
+            router = Router()
+            router.load(route_path)
+            rendered = []
+            for cur_ext in const.ALL_ROUTE_EXTENSIONS:
+                dest_path = os.path.join(temp_dir, f"route{cur_ext}")
+                save_time = timeit.timeit(lambda: route_files.write_route(dest_path, router.serialize()), number=num_iterations) / num_iterations
+                load_time = timeit.timeit(lambda: route_files.read_route(dest_path), number=num_iterations) / num_iterations
+                file_size = os.path.getsize(dest_path)
+                if route_files.read_route(dest_path) != router.serialize():
+                    raise ValueError(f"Route changed after saving and loading in format: {cur_ext}")
+
+                totals[cur_ext][0] += save_time
+                totals[cur_ext][1] += load_time
+                totals[cur_ext][2] += file_size
+                rendered.append(f"{cur_ext}: {file_size / 1024:.1f} KiB, save {save_time * 1000:.2f} ms, load {load_time * 1000:.2f} ms")
+
+            print(f"{os.path.relpath(route_path, const.POKEMON_RAW_DATA)} ({len(router.event_lookup)} events): {', '.join(rendered)}")
+
+    for cur_ext, (save_time, load_time, file_size) in totals.items():
+        print(f"total {cur_ext}: {file_size / 1024:.1f} KiB, save {save_time * 1000:.2f} ms, load {load_time * 1000:.2f} ms")
+
+
+def pad_route(controller:MainController, num_events):
+    # spreads notes events throughout the route until it has the requested number of events
+    raw_route = controller.get_raw_route()
+    base_events = list(controller.iter_events())
+    pad_idx = 0
+    while len(base_events) + pad_idx < num_events:
+        raw_route.add_event_object(
+            event_def=route_events.EventDefinition(notes=f"padding {pad_idx}"),
+            insert_after=base_events[pad_idx % len(base_events)].group_id,
+        )
+        pad_idx += 1
+
+
+def time_route_list_refresh(root:tk.Tk, route_list:RouteList, edit_fn, num_iterations, force_full):
+    edit_timings = []
+    refresh_timings = []
+    for _ in range(num_iterations):
+        start = time.perf_counter()
+        edit_fn()
+        edit_timings.append(time.perf_counter() - start)
+
+        # includes actually drawing the updated list
+        start = time.perf_counter()
+        route_list.refresh(force_full=force_full)
+        root.update()
+        refresh_timings.append(time.perf_counter() - start)
+
+    edit_timings.sort()
+    refresh_timings.sort()
+    return edit_timings[len(edit_timings) // 2], refresh_timings[0], refresh_timings[len(refresh_timings) // 2]
+
+
+def count_rows(route_list:RouteList, item_id=""):
+    children = route_list.get_children(item_id)
+    return len(children) + sum(count_rows(route_list, x) for x in children)
+
+
+def run_route_list_benchmark(route_file_path, solo_mon, pkmn_version, num_events, num_iterations):
+    # how long the route list takes to catch up after a single edit, updating only the changed rows vs redrawing everything
+    # for both the regular list, and the virtualized list which only has rows for what is visible
+    controller = MainController()
+    load_route(controller, route_file_path, solo_mon=solo_mon, pkmn_version=pkmn_version)
+    pad_route(controller, num_events)
+
+    all_events = list(controller.iter_events())
+    notes_event = all_events[len(all_events) // 2]
+    trainer_event = next(x for x in all_events[len(all_events) // 4:] if x.event_definition.trainer_def is not None)
+
+    def edit_notes():
+        new_def = route_events.EventDefinition.deserialize(notes_event.event_definition.serialize())
+        new_def.notes = "edited" if notes_event.event_definition.notes != "edited" else ""
+        controller.update_existing_event(notes_event.group_id, new_def)
+
+    def toggle_trainer():
+        # same as clicking the checkbox, which changes the state of every event after the trainer
+        trainer_event.set_enabled_status(not trainer_event.is_enabled())
+        controller.update_existing_event(trainer_event.group_id, trainer_event.event_definition)
+
+    print(f"route: {route_file_path} ({len(all_events)} events)")
+    for list_name, virtualized in [("regular", False), ("virtualized", True)]:
+        root = tk.Tk()
+        route_list = RouteList(controller, root, virtualized=virtualized)
+        scroll_bar = tk.Scrollbar(root, orient="vertical", command=route_list.yview)
+        scroll_bar.pack(side="right", fill=tk.BOTH)
+        route_list.pack(fill=tk.BOTH, expand=True, side="right")
+        route_list.set_scroll_bar(scroll_bar)
+
+        start = time.perf_counter()
+        route_list.refresh(force_full=True)
+        root.update()
+        print(f"{list_name} list: initial draw {(time.perf_counter() - start) * 1000:.1f} ms, {count_rows(route_list)} rows")
+
+        for edit_name, edit_fn in [("edit notes", edit_notes), ("toggle trainer", toggle_trainer)]:
+            for refresh_name, force_full in [("changed rows", False), ("full refresh", True)]:
+                edit_time, best_time, median_time = time_route_list_refresh(root, route_list, edit_fn, num_iterations, force_full)
+                print(f"{list_name} list, {edit_name}, {refresh_name}: edit {edit_time * 1000:.1f} ms, refresh (best/median of {num_iterations}): {best_time * 1000:.1f} ms / {median_time * 1000:.1f} ms")
+
+        # scrolling through the whole route a page at a time
+        start = time.perf_counter()
+        for _ in range(num_events // 20):
+            route_list.yview(tk.SCROLL, 1, tk.PAGES)
+            root.update()
+        print(f"{list_name} list: scrolling {num_events // 20} pages {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        root.destroy()
+
+
+def count_rendered(folder_obj:route_events.EventFolder, do_render):
+    # the same walk as refreshing the route list: every shown event, along with the contents of every shown folder
+    result = 0
+    for event_obj in folder_obj.children:
+        if not do_render(event_obj):
+            continue
+        result += 1
+        if isinstance(event_obj, route_events.EventFolder):
+            result += count_rendered(event_obj, do_render)
+    return result
+
+
+def run_route_search_benchmark(route_file_path, solo_mon, pkmn_version, num_events, num_iterations, search, filter_types):
+    # typing a search one character at a time, checking each event directly vs looking it up in the search index
+    controller = MainController()
+    load_route(controller, route_file_path, solo_mon=solo_mon, pkmn_version=pkmn_version)
+    pad_route(controller, num_events)
+    router = controller.get_raw_route()
+    # without a search, just time the filters on their own
+    searches = [search[:x] for x in range(1, len(search) + 1)] or [None]
+    notes_event = list(controller.iter_events())[num_events // 2]
+
+    def type_search(use_index):
+        result = []
+        for cur_search in searches:
+            if use_index:
+                search_results = router.get_search_results(search=cur_search, filter_types=filter_types)
+                result.append(count_rendered(router.root_folder, search_results.do_render))
+            else:
+                result.append(count_rendered(router.root_folder, lambda x: x.do_render(search=cur_search, filter_types=filter_types)))
+        return result
+
+    def edit_notes():
+        new_def = route_events.EventDefinition.deserialize(notes_event.event_definition.serialize())
+        new_def.notes = f"{search} edited" if notes_event.event_definition.notes != f"{search} edited" else ""
+        controller.update_existing_event(notes_event.group_id, new_def)
+
+    print(f"route: {route_file_path} ({len(router.event_lookup)} events), typing: {search}, filters: {filter_types}")
+    start = time.perf_counter()
+    router.get_search_results(search=search, filter_types=filter_types)
+    print(f"building the index: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    for test_name, use_index in [("checking every event", False), ("search index", True)]:
+        for edit_name, edit_fn in [("unchanged route", None), ("after each edit", edit_notes)]:
+            timings = []
+            for _ in range(num_iterations):
+                if edit_fn is not None:
+                    edit_fn()
+                start = time.perf_counter()
+                num_shown = type_search(use_index)
+                timings.append(time.perf_counter() - start)
+
+            if num_shown != type_search(not use_index):
+                raise ValueError(f"Search index shows different events than checking each event directly: {num_shown}")
+
+            timings.sort()
+            per_key = timings[len(timings) // 2] / len(searches)
+            print(f"{test_name}, {edit_name}: {per_key * 1000:.2f} ms per keystroke (median of {num_iterations}), events shown: {num_shown}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    route_parser = subparsers.add_parser("route", help="Replay a full route, including every battle summary")
+    route_parser.add_argument("-r", "--route_file", required=True)
+    route_parser.add_argument("-m", "--solo_mon", default=None, help="Treat the route file as a base route, and run it with this solo mon")
+    route_parser.add_argument("-v", "--version", default=None, help="Version to use for the base route. Required with --solo_mon")
+    route_parser.add_argument("-n", "--num_iterations", type=int, default=5)
+
+    damage_range_parser = subparsers.add_parser("damage_range", help="Compare the DamageRange representation against the old dict-backed one")
+    damage_range_parser.add_argument("-n", "--num_iterations", type=int, default=2000)
+
+    route_file_parser = subparsers.add_parser("route_files", help="Compare saving and loading the min_battles routes as indented json against the compact format")
+    route_file_parser.add_argument("-n", "--num_iterations", type=int, default=20)
+
+    route_list_parser = subparsers.add_parser("route_list", help="Time refreshing the route list after a single edit")
+    route_list_parser.add_argument("-r", "--route_file", required=True)
+    route_list_parser.add_argument("-m", "--solo_mon", default=None, help="Treat the route file as a base route, and run it with this solo mon")
+    route_list_parser.add_argument("-v", "--version", default=None, help="Version to use for the base route. Required with --solo_mon")
+    route_list_parser.add_argument("-e", "--num_events", type=int, default=1000, help="Pad the route with notes events until it has this many events")
+    route_list_parser.add_argument("-n", "--num_iterations", type=int, default=10)
+
+    route_search_parser = subparsers.add_parser("route_search", help="Time filtering the route list while typing a search")
+    route_search_parser.add_argument("-r", "--route_file", required=True)
+    route_search_parser.add_argument("-m", "--solo_mon", default=None, help="Treat the route file as a base route, and run it with this solo mon")
+    route_search_parser.add_argument("-v", "--version", default=None, help="Version to use for the base route. Required with --solo_mon")
+    route_search_parser.add_argument("-e", "--num_events", type=int, default=1000, help="Pad the route with notes events until it has this many events")
+    route_search_parser.add_argument("-s", "--search", default="trainer")
+    route_search_parser.add_argument("-f", "--filter_types", nargs="*", default=None, help="Only show these event types, e.g. \"Fight Trainer\"")
+    route_search_parser.add_argument("-n", "--num_iterations", type=int, default=10)
+
+    startup_parser = subparsers.add_parser("startup", help="Time a cold start of the headless app, until it responds to its first request")
+    startup_parser.add_argument("-p", "--port", type=int, default=5123)
+    startup_parser.add_argument("-n", "--num_iterations", type=int, default=5)
+    startup_parser.add_argument("-t", "--timeout", type=float, default=120)
+
+    args = parser.parse_args()
+
+    if args.benchmark == "route":
+        if args.solo_mon is not None and args.version is None:
+            parser.error("--version is required when using --solo_mon")
+
+        custom_logging.config_logging(const.GLOBAL_CONFIG_DIR)
+        setup.init_base_generations()
+
+        run_route_benchmark(args.route_file, args.solo_mon, args.version, args.num_iterations)
+    elif args.benchmark == "damage_range":
+        run_damage_range_benchmark(args.num_iterations)
+    elif args.benchmark == "route_files":
+        custom_logging.config_logging(const.GLOBAL_CONFIG_DIR)
+        setup.init_base_generations()
+
+        run_route_file_benchmark(args.num_iterations)
+    elif args.benchmark == "route_list":
+        if args.solo_mon is not None and args.version is None:
+            parser.error("--version is required when using --solo_mon")
+
+        custom_logging.config_logging(const.GLOBAL_CONFIG_DIR)
+        setup.init_base_generations()
+
+        run_route_list_benchmark(args.route_file, args.solo_mon, args.version, args.num_events, args.num_iterations)
+    elif args.benchmark == "route_search":
+        if args.solo_mon is not None and args.version is None:
+            parser.error("--version is required when using --solo_mon")
+
+        custom_logging.config_logging(const.GLOBAL_CONFIG_DIR)
+        setup.init_base_generations()
+
+        run_route_search_benchmark(args.route_file, args.solo_mon, args.version, args.num_events, args.num_iterations, args.search, args.filter_types or None)
+    elif args.benchmark == "startup":
+        run_startup_benchmark(args.port, args.num_iterations, args.timeout)
@@ -0,0 +1,24 @@
+import argparse
+import os
+import shutil
+
+from controllers.main_controller import MainController
+from utils.constants import const
+from utils import setup, custom_logging
+from pkmn import gen_factory
+
+
+if __name__ == "__main__":
+    # snapshots are also written automatically the first time each version is loaded
+    # this just does all of them up front, e.g. right after an install or a data update
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-c", "--clean", action="store_true", help="Delete all existing snapshots first")
+    args = parser.parse_args()
+
+    custom_logging.config_logging(const.GLOBAL_CONFIG_DIR)
+    if args.clean and os.path.exists(const.GEN_SNAPSHOT_DIR):
+        shutil.rmtree(const.GEN_SNAPSHOT_DIR)
+
+    setup.init_base_generations()
+    gen_factory._gen_factory.rebuild_all_snapshots()
+    print(f"Wrote snapshots to: {const.GEN_SNAPSHOT_DIR}")
@@ -54,13 +54,11 @@ def calc_speed_tiers(route_file_path, controller:MainController):
                     custom_nature=cur_nature
                 )
 
-                cur_event = controller.get_next_event(enabled_only=True)
-                while not (cur_event is None):
+                for cur_event in controller.iter_events(enabled_only=True):
                     if cur_event.is_major_fight():
                         if cur_base_speed == 5:
                             header_line.append(cur_event.event_definition.get_first_trainer_obj().name)
                         cur_data_line.append(cur_event.init_state.solo_pkmn.cur_stats.speed)
-                    cur_event = controller.get_next_event(cur_event_id=cur_event.group_id, enabled_only=True)
 
             out_path = os.path.join(result_dir, f"{cur_growth_rate}_{cur_nature_name}.csv")
             print(f"generating csv: {out_path}")
@@ -1,16 +1,21 @@
 from __future__ import annotations
 from dataclasses import dataclass, asdict
+import concurrent.futures
 import copy
 import logging
+import multiprocessing
+import threading
 from typing import Dict, List, Tuple
 from controllers.main_controller import MainController
-from pkmn.damage_calc import DamageRange, find_kill
-from pkmn.universal_data_objects import EnemyPkmn, FieldStatus, StageModifiers
+from pkmn import damage_cache
+from pkmn.damage_calc import DamageRange
+from pkmn.universal_data_objects import EnemyPkmn, FieldStatus, StageModifiers, StatBlock, NEUTRAL_STAGE_MODIFIERS
 from routing.full_route_state import RouteState
 from utils.config_manager import config
 
 from utils.constants import const
 from routing.route_events import EventDefinition, EventGroup, RareCandyEventDefinition, TrainerEventDefinition
+from pkmn import gen_factory
 from pkmn.gen_factory import current_gen_info
 
 logger = logging.getLogger(__name__)
@@ -59,6 +64,139 @@ class PkmnRenderInfo:
         return f"Lv {self.attacking_mon_level}: {self.attacking_mon_name} {verb} Lv {self.defending_mon_level}: {self.defending_mon_name} ({self.defending_mon_hp} HP)"
 
 
+@dataclass
+class MoveCalcJob:
+    # everything needed to calculate the damage ranges for a single move, independent of the controller
+    # NOTE: must stay picklable, as these are sent to the worker processes when running in parallel
+    version_name:str
+    move_name:str
+    attack_flavor:List[str]
+    attacking_mon:EnemyPkmn
+    attacking_mon_stats:StatBlock
+    crit_mon:EnemyPkmn
+    crit_mon_stats:StatBlock
+    defending_mon:EnemyPkmn
+    defending_mon_stats:StatBlock
+    attacking_stage_modifiers:StageModifiers
+    defending_stage_modifiers:StageModifiers
+    attacking_field_status:FieldStatus
+    defending_field_status:FieldStatus
+    custom_data_selection:str
+    weather:str
+    is_double_battle:bool
+    ignore_accuracy:bool
+    search_depth:int
+    force_full_search:bool
+    # only used when rendering the results
+    move_display_name:str
+    custom_data_options:List[str]
+
+@dataclass
+class MoveCalcResult:
+    min_damage:int
+    max_damage:int
+    crit_min_damage:int
+    crit_max_damage:int
+    kill_ranges:List[Tuple[int, float]]
+
+
+def calculate_move(job:MoveCalcJob) -> MoveCalcResult:
+    move = current_gen_info().move_db().get_move(job.move_name)
+    normal_ranges = damage_cache.calculate_damage(
+        current_gen_info(),
+        job.attacking_mon,
+        move,
+        job.defending_mon,
+        attacking_stage_modifiers=job.attacking_stage_modifiers,
+        defending_stage_modifiers=job.defending_stage_modifiers,
+        attacking_field=job.attacking_field_status,
+        defending_field=job.defending_field_status,
+        custom_move_data=job.custom_data_selection,
+        weather=job.weather,
+        is_double_battle=job.is_double_battle,
+        attacking_battle_stats=job.attacking_mon_stats,
+        defending_battle_stats=job.defending_mon_stats,
+    )
+    crit_ranges = damage_cache.calculate_damage(
+        current_gen_info(),
+        job.crit_mon,
+        move,
+        job.defending_mon,
+        attacking_stage_modifiers=job.attacking_stage_modifiers,
+        defending_stage_modifiers=job.defending_stage_modifiers,
+        attacking_field=job.attacking_field_status,
+        defending_field=job.defending_field_status,
+        custom_move_data=job.custom_data_selection,
+        is_crit=True,
+        weather=job.weather,
+        is_double_battle=job.is_double_battle,
+        attacking_battle_stats=job.crit_mon_stats,
+        defending_battle_stats=job.defending_mon_stats,
+    )
+    if normal_ranges is not None and crit_ranges is not None:
+        if job.ignore_accuracy:
+            accuracy = 100
+        else:
+            accuracy = current_gen_info().get_move_accuracy(job.attacking_mon, move, job.custom_data_selection, job.defending_mon, job.weather)
+            if accuracy is None:
+                accuracy = 100
+
+        accuracy = float(accuracy) / 100.0
+
+        kill_ranges = damage_cache.find_kill(
+            normal_ranges,
+            crit_ranges,
+            current_gen_info().get_crit_rate(job.attacking_mon, move, job.custom_data_selection),
+            accuracy,
+            job.defending_mon.cur_stats.hp,
+            attack_depth=job.search_depth,
+            force_full_search=job.force_full_search
+        )
+    else:
+        kill_ranges = []
+
+    return MoveCalcResult(
+        -1 if normal_ranges is None else normal_ranges.min_damage,
+        -1 if normal_ranges is None else normal_ranges.max_damage,
+        -1 if crit_ranges is None else crit_ranges.min_damage,
+        -1 if crit_ranges is None else crit_ranges.max_damage,
+        kill_ranges,
+    )
+
+
+def _init_calc_worker(version_name):
+    # worker processes are spawned fresh, and gens are only loaded once they're first used
+    # so load the version being calculated up front, instead of during the first refresh
+    from utils import setup
+    setup.init_base_generations()
+    try:
+        gen_factory._gen_factory.reload_all_custom_gens()
+    except Exception as e:
+        logger.error(f"Failed to load custom gens in battle summary worker")
+        logger.exception(e)
+
+    try:
+        gen_factory.change_version(version_name)
+    except Exception as e:
+        # not fatal, each job switches to its own version anyways
+        logger.error(f"Failed to pre-load version {version_name} in battle summary worker")
+        logger.exception(e)
+
+
+def _warm_up_calc_worker():
+    return None
+
+
+def _calculate_move_in_worker(job:MoveCalcJob) -> MoveCalcResult:
+    if current_gen_info().version_name() != job.version_name:
+        if gen_factory.specific_gen_info(job.version_name) is None:
+            # custom gen created after this worker started up
+            gen_factory._gen_factory.reload_all_custom_gens()
+        gen_factory.change_version(job.version_name)
+
+    return calculate_move(job)
+
+
 class BattleSummaryController:
     def __init__(self, main_controller:MainController):
         self._main_controller = main_controller
@@ -103,6 +241,16 @@ class BattleSummaryController:
         self._player_pkmn_matchup_data:List[PkmnRenderInfo] = []
         self._enemy_pkmn_matchup_data:List[PkmnRenderInfo] = []
 
+        # optional pool of worker processes, for running the calculations of a full refresh in parallel
+        # when enabled, refreshes finish asynchronously, and the refresh event is fired once all the results are in
+        self._calc_worker_pool:concurrent.futures.ProcessPoolExecutor = None
+        self._calc_worker_count = 0
+        # the version the workers loaded when they started
+        self._calc_worker_version = None
+        self._pending_calcs:List[concurrent.futures.Future] = []
+        self._refresh_lock = threading.Lock()
+        self._latest_refresh_id = 0
+
         self.load_empty()
 
 
@@ -138,6 +286,11 @@ class BattleSummaryController:
 
     def update_mimic_selection(self, new_value):
         self._mimic_selection = new_value
+        if self._is_refresh_pending():
+            # the pending refresh was started with the old selection, and would overwrite the update below once it finishes
+            self._full_refresh()
+            return
+
         target_found = False
         for mon_idx in range(len(self._original_enemy_mon_list)):
             if not target_found:
@@ -159,16 +312,19 @@ class BattleSummaryController:
 
     def update_custom_move_data(self, pkmn_idx, move_idx, is_player_mon, new_value):
         try:
-            if is_player_mon:
-                move_data = self._player_move_data
-                lookup_key = const.PLAYER_KEY
-            else:
-                move_data = self._enemy_move_data
-                lookup_key = const.ENEMY_KEY
+            lookup_key = const.PLAYER_KEY if is_player_mon else const.ENEMY_KEY
+            # the calculated move data may still be from a previous battle while a refresh is pending
+            # so the move is looked up from the mons themselves instead
+            move_name = self._get_displayed_move_name(pkmn_idx, move_idx, is_player_mon)
+            if move_name is None:
+                raise ValueError(f"No move in slot {move_idx} for mon {pkmn_idx}")
 
-            move_name = move_data[pkmn_idx][move_idx].name
             self._custom_move_data[pkmn_idx][lookup_key][move_name] = new_value
+            if self._is_refresh_pending():
+                self._full_refresh()
+                return
 
+            move_data = self._player_move_data if is_player_mon else self._enemy_move_data
             move_data[pkmn_idx][move_idx] = self._recalculate_single_move(pkmn_idx, is_player_mon, move_name)
             self._update_best_move_inplace(pkmn_idx, is_player_mon)
 
@@ -176,6 +332,20 @@ class BattleSummaryController:
             self._on_nonload_change()
         except Exception as e:
             logger.error(f"encountered error updating custom move data: {pkmn_idx, move_idx, is_player_mon, new_value}")
+            logger.exception(e)
+
+    def _get_displayed_move_name(self, mon_idx, move_idx, is_player_mon) -> str:
+        # the same move names as _full_refresh(), before mimic is resolved
+        if not is_player_mon:
+            cur_mon = self._original_enemy_mon_list[mon_idx]
+        elif self._is_player_transformed:
+            cur_mon = self._transformed_mon_list[mon_idx]
+        else:
+            cur_mon = self._original_player_mon_list[mon_idx]
+
+        if move_idx >= len(cur_mon.move_list):
+            return None
+        return cur_mon.move_list[move_idx] or const.STRUGGLE_MOVE_NAME
 
     def update_weather(self, new_weather):
         self._weather = new_weather
@@ -273,10 +443,12 @@ class BattleSummaryController:
         self._player_field_status = self._calc_field_status(True)
         self._enemy_stage_modifier = self._calc_stage_modifier(self._enemy_setup_move_list)
         self._enemy_field_status = self._calc_field_status(False)
-        self._player_pkmn_matchup_data = []
-        self._enemy_pkmn_matchup_data = []
-        self._player_move_data = []
-        self._enemy_move_data = []
+        player_pkmn_matchup_data = []
+        enemy_pkmn_matchup_data = []
+        # first idx: idx of pkmn in team
+        # second idx: idx of move for pkmn pair
+        player_move_jobs:List[List[MoveCalcJob]] = []
+        enemy_move_jobs:List[List[MoveCalcJob]] = []
         self._mimic_options = []
 
         can_mimic_yet = False
@@ -291,14 +463,14 @@ class BattleSummaryController:
             enemy_mon = self._original_enemy_mon_list[mon_idx]
             enemy_stats = enemy_mon.get_battle_stats(self._enemy_stage_modifier, mon_field=self._enemy_field_status)
 
-            self._player_pkmn_matchup_data.append(
+            player_pkmn_matchup_data.append(
                 PkmnRenderInfo(player_mon.name, player_mon.level, player_stats.speed, enemy_mon.name, enemy_mon.level, enemy_stats.speed, enemy_mon.cur_stats.hp)
             )
-            self._enemy_pkmn_matchup_data.append(
+            enemy_pkmn_matchup_data.append(
                 PkmnRenderInfo(enemy_mon.name, enemy_mon.level, enemy_stats.speed, player_mon.name, player_mon.level, player_stats.speed, player_mon.cur_stats.hp)
             )
-            self._player_move_data.append([])
-            self._enemy_move_data.append([])
+            player_move_jobs.append([])
+            enemy_move_jobs.append([])
 
             struggle_set = False
             for move_idx in range(4):
@@ -319,36 +491,184 @@ class BattleSummaryController:
                         struggle_set = True
                         move_name = const.STRUGGLE_MOVE_NAME
 
-                    cur_player_move_data = self._recalculate_single_move(mon_idx, True, move_name, move_display_name=move_display_name)
+                    cur_player_move_job = self._get_move_calc_job(mon_idx, True, move_name, move_display_name=move_display_name)
                 else:
-                    cur_player_move_data = None
+                    cur_player_move_job = None
 
                 # Now handle the enemy move calculation
                 if move_idx < len(enemy_mon.move_list):
                     move_name = enemy_mon.move_list[move_idx]
                     if move_name and move_name not in self._mimic_options:
                         self._mimic_options.append(move_name)
-                    cur_enemy_move_data = self._recalculate_single_move(mon_idx, False, move_name)
+                    cur_enemy_move_job = self._get_move_calc_job(mon_idx, False, move_name)
                 else:
-                    cur_enemy_move_data = None
+                    cur_enemy_move_job = None
+
+                player_move_jobs[mon_idx].append(cur_player_move_job)
+                enemy_move_jobs[mon_idx].append(cur_enemy_move_job)
+
+        with self._refresh_lock:
+            self._latest_refresh_id += 1
+            refresh_id = self._latest_refresh_id
+            # any calculations still pending are for an older refresh, and their results would just be thrown away
+            for cur_future in self._pending_calcs:
+                cur_future.cancel()
+            self._pending_calcs = []
+
+        worker_pool = self._get_calc_worker_pool()
+        if worker_pool is None:
+            self._finish_refresh(
+                refresh_id,
+                player_pkmn_matchup_data,
+                enemy_pkmn_matchup_data,
+                player_move_jobs,
+                enemy_move_jobs,
+                [[None if x is None else calculate_move(x) for x in cur_jobs] for cur_jobs in player_move_jobs],
+                [[None if x is None else calculate_move(x) for x in cur_jobs] for cur_jobs in enemy_move_jobs],
+                is_load
+            )
+            return
+
+        player_move_futures = [[None if x is None else worker_pool.submit(_calculate_move_in_worker, x) for x in cur_jobs] for cur_jobs in player_move_jobs]
+        enemy_move_futures = [[None if x is None else worker_pool.submit(_calculate_move_in_worker, x) for x in cur_jobs] for cur_jobs in enemy_move_jobs]
+        with self._refresh_lock:
+            if refresh_id == self._latest_refresh_id:
+                self._pending_calcs = [x for cur_futures in (player_move_futures + enemy_move_futures) for x in cur_futures if x is not None]
+
+        threading.Thread(
+            target=self._collect_refresh_results,
+            args=(
+                refresh_id,
+                player_pkmn_matchup_data,
+                enemy_pkmn_matchup_data,
+                player_move_jobs,
+                enemy_move_jobs,
+                player_move_futures,
+                enemy_move_futures,
+                is_load
+            ),
+            daemon=True
+        ).start()
+
+    def _collect_refresh_results(
+        self,
+        refresh_id:int,
+        player_pkmn_matchup_data:List[PkmnRenderInfo],
+        enemy_pkmn_matchup_data:List[PkmnRenderInfo],
+        player_move_jobs:List[List[MoveCalcJob]],
+        enemy_move_jobs:List[List[MoveCalcJob]],
+        player_move_futures:List[List[concurrent.futures.Future]],
+        enemy_move_futures:List[List[concurrent.futures.Future]],
+        is_load:bool,
+    ):
+        all_results = []
+        for cur_side_futures in (player_move_futures, enemy_move_futures):
+            cur_side_results = []
+            for cur_futures in cur_side_futures:
+                cur_side_results.append([])
+                for cur_future in cur_futures:
+                    if cur_future is None:
+                        cur_side_results[-1].append(None)
+                        continue
+
+                    try:
+                        cur_side_results[-1].append(cur_future.result())
+                    except concurrent.futures.CancelledError:
+                        # only happens when a newer refresh has already been started, so nothing left to do
+                        return
+                    except Exception as e:
+                        logger.error(f"encountered error calculating move in battle summary worker")
+                        logger.exception(e)
+                        cur_side_results[-1].append(None)
+            all_results.append(cur_side_results)
+
+        self._finish_refresh(
+            refresh_id,
+            player_pkmn_matchup_data,
+            enemy_pkmn_matchup_data,
+            player_move_jobs,
+            enemy_move_jobs,
+            all_results[0],
+            all_results[1],
+            is_load
+        )
 
-                #####
-                # Now the info has been generated for both sides of the fight. Add to the data structure, if appropriate
-                #####
-                self._player_move_data[mon_idx].append(cur_player_move_data)
-                self._enemy_move_data[mon_idx].append(cur_enemy_move_data)
+    def _finish_refresh(
+        self,
+        refresh_id:int,
+        player_pkmn_matchup_data:List[PkmnRenderInfo],
+        enemy_pkmn_matchup_data:List[PkmnRenderInfo],
+        player_move_jobs:List[List[MoveCalcJob]],
+        enemy_move_jobs:List[List[MoveCalcJob]],
+        player_move_results:List[List[MoveCalcResult]],
+        enemy_move_results:List[List[MoveCalcResult]],
+        is_load:bool,
+    ):
+        with self._refresh_lock:
+            if refresh_id != self._latest_refresh_id:
+                return
 
-            #####
-            # Finally out of move data loop. Update best moves
-            #####
-            self._update_best_move_inplace(mon_idx, True)
-            self._update_best_move_inplace(mon_idx, False)
+            self._pending_calcs = []
+            self._player_pkmn_matchup_data = player_pkmn_matchup_data
+            self._enemy_pkmn_matchup_data = enemy_pkmn_matchup_data
+            self._player_move_data = [
+                [self._get_move_render_info(cur_job, cur_result) for cur_job, cur_result in zip(cur_jobs, cur_results)]
+                for cur_jobs, cur_results in zip(player_move_jobs, player_move_results)
+            ]
+            self._enemy_move_data = [
+                [self._get_move_render_info(cur_job, cur_result) for cur_job, cur_result in zip(cur_jobs, cur_results)]
+                for cur_jobs, cur_results in zip(enemy_move_jobs, enemy_move_results)
+            ]
+
+            for mon_idx in range(len(self._player_move_data)):
+                self._update_best_move_inplace(mon_idx, True)
+                self._update_best_move_inplace(mon_idx, False)
 
         # finally done calculating everything. Refresh and exit
         self._on_refresh()
         if not is_load:
             self._on_nonload_change()
 
+    def _get_calc_worker_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        num_workers = config.get_battle_summary_workers()
+        version_name = current_gen_info().version_name()
+        # workers only pre-load a single version, so they are restarted whenever the route changes versions
+        if num_workers != self._calc_worker_count or (num_workers > 0 and version_name != self._calc_worker_version):
+            self.shutdown_calc_workers()
+            if num_workers > 0:
+                # NOTE: always spawn, rather than fork. Forking a process that is already running the GUI (and other threads) isn't safe
+                self._calc_worker_pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=num_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_calc_worker,
+                    initargs=(version_name,),
+                )
+                # workers are only started as jobs come in, so start all of them now
+                # that way, each one is done loading the version before the first real refresh comes in
+                for _ in range(num_workers):
+                    self._calc_worker_pool.submit(_warm_up_calc_worker)
+                self._calc_worker_version = version_name
+            self._calc_worker_count = num_workers
+
+        return self._calc_worker_pool
+
+    def start_calc_workers(self):
+        # gets the workers started (and loading the current version) before they're needed for a refresh
+        # restarting the workers would cancel a pending refresh, in which case the next refresh restarts them instead
+        if not self._is_refresh_pending():
+            self._get_calc_worker_pool()
+
+    def shutdown_calc_workers(self):
+        if self._calc_worker_pool is not None:
+            self._calc_worker_pool.shutdown(wait=False, cancel_futures=True)
+            self._calc_worker_pool = None
+        self._calc_worker_count = 0
+        self._calc_worker_version = None
+
+    def _is_refresh_pending(self) -> bool:
+        with self._refresh_lock:
+            return len(self._pending_calcs) > 0
+
     def _recalculate_single_move(
         self,
         mon_idx:int,
@@ -356,6 +676,38 @@ class BattleSummaryController:
         move_name:str,
         move_display_name:str=None,
     ):
+        job = self._get_move_calc_job(mon_idx, is_player_mon, move_name, move_display_name=move_display_name)
+        if job is None:
+            return None
+
+        return self._get_move_render_info(job, calculate_move(job))
+
+    def _get_move_render_info(self, job:MoveCalcJob, result:MoveCalcResult) -> MoveRenderInfo:
+        if job is None or result is None:
+            return None
+
+        return MoveRenderInfo(
+            job.move_display_name,
+            job.attack_flavor,
+            result.min_damage,
+            result.max_damage,
+            result.crit_min_damage,
+            result.crit_max_damage,
+            job.defending_mon.cur_stats.hp,
+            result.kill_ranges,
+            self._mimic_selection,
+            self._mimic_options,
+            job.custom_data_options,
+            job.custom_data_selection
+        )
+
+    def _get_move_calc_job(
+        self,
+        mon_idx:int,
+        is_player_mon:bool,
+        move_name:str,
+        move_display_name:str=None,
+    ) -> MoveCalcJob:
         if is_player_mon:
             # TODO: gross hacky transform support. Somehow we should figure out how to offload some of this logic back into the generation objects...
             # but I'm not sure how, currently...
@@ -365,7 +717,7 @@ class BattleSummaryController:
                 if current_gen_info().get_generation() == 1:
                     if attacking_mon.level > self._transformed_mon_list[0].level:
                         attacking_mon.badges = copy.deepcopy(self._original_player_mon_list[0].badges)
-                        attacking_mon_stats = attacking_mon.get_battle_stats(StageModifiers())
+                        attacking_mon_stats = attacking_mon.get_battle_stats(NEUTRAL_STAGE_MODIFIERS)
                     orig_player_mon = self._original_player_mon_list[mon_idx]
                     crit_mon = copy.deepcopy(attacking_mon)
                     crit_mon.level = orig_player_mon.level
@@ -436,70 +788,28 @@ class BattleSummaryController:
         elif custom_data_selection not in custom_data_options:
             custom_data_selection = custom_data_options[0]
 
-        normal_ranges = current_gen_info().calculate_damage(
+        return MoveCalcJob(
+            current_gen_info().version_name(),
+            move.name,
+            move.attack_flavor,
             attacking_mon,
-            move,
-            defending_mon,
-            attacking_stage_modifiers=attacking_stage_modifiers,
-            defending_stage_modifiers=defending_stage_modifiers,
-            attacking_field=attacking_field_status,
-            defending_field=defending_field_status,
-            custom_move_data=custom_data_selection,
-            weather=self._weather,
-            is_double_battle=self._double_battle_flag,
-            attacking_battle_stats=attacking_mon_stats,
-            defending_battle_stats=defending_mon_stats,
-        )
-        crit_ranges = current_gen_info().calculate_damage(
+            attacking_mon_stats,
             crit_mon,
-            move,
+            crit_mon_stats,
             defending_mon,
-            attacking_stage_modifiers=attacking_stage_modifiers,
-            defending_stage_modifiers=defending_stage_modifiers,
-            attacking_field=attacking_field_status,
-            defending_field=defending_field_status,
-            custom_move_data=custom_data_selection,
-            is_crit=True,
-            weather=self._weather,
-            is_double_battle=self._double_battle_flag,
-            attacking_battle_stats=crit_mon_stats,
-            defending_battle_stats=defending_mon_stats,
-        )
-        if normal_ranges is not None and crit_ranges is not None:
-            if config.do_ignore_accuracy():
-                accuracy = 100
-            else:
-                accuracy = current_gen_info().get_move_accuracy(attacking_mon, move, custom_data_selection, defending_mon, self._weather)
-                if accuracy is None:
-                    accuracy = 100
-
-            accuracy = float(accuracy) / 100.0
-
-            kill_ranges = find_kill(
-                normal_ranges,
-                crit_ranges,
-                current_gen_info().get_crit_rate(attacking_mon, move, custom_data_selection),
-                accuracy,
-                defending_mon.cur_stats.hp,
-                attack_depth=config.get_damage_search_depth(),
-                force_full_search=config.do_force_full_search()
-            )
-        else:
-            kill_ranges = []
-
-        return MoveRenderInfo(
+            defending_mon_stats,
+            attacking_stage_modifiers,
+            defending_stage_modifiers,
+            attacking_field_status,
+            defending_field_status,
+            custom_data_selection,
+            self._weather,
+            self._double_battle_flag,
+            config.do_ignore_accuracy(),
+            config.get_damage_search_depth(),
+            config.do_force_full_search(),
             move_display_name,
-            move.attack_flavor,
-            -1 if normal_ranges is None else normal_ranges.min_damage,
-            -1 if normal_ranges is None else normal_ranges.max_damage,
-            -1 if crit_ranges is None else crit_ranges.min_damage,
-            -1 if crit_ranges is None else crit_ranges.max_damage,
-            defending_mon.cur_stats.hp,
-            kill_ranges,
-            self._mimic_selection,
-            self._mimic_options,
             custom_data_options,
-            custom_data_selection
         )
 
     def load_from_event(self, event_group:EventGroup):
@@ -789,7 +1099,7 @@ class BattleSummaryController:
 
     @staticmethod
     def _calc_stage_modifier(move_list) -> StageModifiers:
-        result = StageModifiers()
+        result = NEUTRAL_STAGE_MODIFIERS
 
         for cur_move in move_list:
             result = result.apply_stat_mod(current_gen_info().move_db().get_stat_mod(cur_move))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 import os
 import logging
-from typing import Callable, List, Tuple
+from typing import Callable, Iterator, List
 import tkinter
 from PIL import ImageGrab
 
@@ -11,6 +11,7 @@ from utils.config_manager import config
 from utils import io_utils
 from routing.route_events import EventDefinition, EventFolder, EventGroup, EventItem, TrainerEventDefinition
 import routing.router
+import routing.route_search
 from pkmn import gen_factory
 
 
@@ -50,6 +51,10 @@ class MainController:
         self._route_filter_types = []
         self._route_search = ""
         self._unsaved_changes = False
+        # partially loaded route, see load_route()
+        self._route_loader = None
+        # changes which aren't from the route itself (e.g. a new search), see pop_route_changes()
+        self._route_changes = routing.router.RouteChanges(full_refresh=True)
 
         self._name_change_events = []
         self._version_change_events = []
@@ -188,6 +193,9 @@ class MainController:
 
     def _on_route_change(self):
         self._unsaved_changes = True
+        if self._headless:
+            # nothing will ever collect the changes, so don't let them pile up
+            self._data.pop_changes()
         self._safely_generate_events(self._route_change_events)
 
     def _on_event_change(self):
@@ -249,6 +257,7 @@ class MainController:
 
     @handle_exceptions
     def update_existing_event(self, event_group_id:int, new_event:EventDefinition):
+        self._finish_route_load()
         if new_event.learn_move is not None and new_event.learn_move.source == const.MOVE_SOURCE_LEVELUP:
             return self.update_levelup_move(new_event.learn_move)
         self._data.replace_event_group(event_group_id, new_event)
@@ -256,11 +265,13 @@ class MainController:
 
     @handle_exceptions
     def update_levelup_move(self, new_learn_move_event):
+        self._finish_route_load()
         self._data.replace_levelup_move_event(new_learn_move_event)
         self._on_event_change()
 
     @handle_exceptions
     def add_area(self, area_name, include_rematches, insert_after_id):
+        self._finish_route_load()
         self._data.add_area(
             area_name=area_name,
             insert_after=insert_after_id,
@@ -275,6 +286,7 @@ class MainController:
 
         self._route_name = ""
         self._selected_ids = []
+        self._route_loader = None
         try:
             self._data.new_route(solo_mon, base_route_path, pkmn_version=pkmn_version, custom_dvs=custom_dvs, custom_ability_idx=custom_ability_idx, custom_nature=custom_nature)
         except Exception as e:
@@ -290,20 +302,25 @@ class MainController:
             self._on_route_change()
 
     @handle_exceptions
-    def load_route(self, full_path_to_route):
+    def load_route(self, full_path_to_route, incremental=False):
+        # incremental loads only load the first chunk of events up front
+        # the rest of the route is loaded one chunk at a time by continue_route_load()
+        self._route_loader = None
         try:
             _, route_name = os.path.split(full_path_to_route)
             route_name = os.path.splitext(route_name)[0]
             self._route_name = route_name
 
-            self._data.load(full_path_to_route)
+            if incremental:
+                self._route_loader = self._data.iter_load(full_path_to_route)
+                self._load_next_route_chunk()
+            else:
+                self._data.load(full_path_to_route)
             self._selected_ids = []
         except Exception as e:
             logger.error(f"Exception ocurred trying to load route: {full_path_to_route}")
             logger.exception(e)
-            self._route_name = ""
-            # load an empty route, just in case. Hardcoded, but wtv, Abra is in every game
-            self._data.new_route("Abra")
+            self._reset_failed_route_load()
             raise e
         finally:
             self._on_name_change()
@@ -312,25 +329,89 @@ class MainController:
             self._on_route_change()
             self._unsaved_changes = False
 
+    @handle_exceptions
+    def continue_route_load(self):
+        if self._route_loader is None:
+            return
+
+        # loading more of the route isn't a change made by the user, so it shouldn't affect whether there are unsaved changes
+        unsaved_changes = self._unsaved_changes
+        try:
+            if not self._continue_route_load():
+                return
+        finally:
+            self._on_route_change()
+            self._unsaved_changes = unsaved_changes
+
+    def _continue_route_load(self):
+        # returns False once the route is already fully loaded
+        try:
+            return self._load_next_route_chunk()
+        except Exception as e:
+            logger.error(f"Exception ocurred trying to continue loading route: {self._route_name}")
+            logger.exception(e)
+            self._stop_failed_route_load()
+            raise e
+
+    def _load_next_route_chunk(self):
+        # returns False once the route is already fully loaded
+        try:
+            next(self._route_loader)
+            return True
+        except StopIteration:
+            self._route_loader = None
+            return False
+
+    def _finish_route_load(self):
+        # anything that modifies the route has to wait for the rest of it to load first
+        # otherwise, the remaining chunks could be loaded into folders or after events that no longer exist
+        if self._route_loader is None:
+            return
+
+        unsaved_changes = self._unsaved_changes
+        try:
+            while self._continue_route_load():
+                pass
+        finally:
+            self._on_route_change()
+            self._unsaved_changes = unsaved_changes
+
+    def _stop_failed_route_load(self):
+        # the events loaded before the failure are kept, since the user may have already started working with them
+        # but the route loses its name, so that saving can't overwrite the full route file with only part of it
+        self._route_loader = None
+        self._route_name = ""
+        self._on_name_change()
+
+    def _reset_failed_route_load(self):
+        self._route_loader = None
+        self._route_name = ""
+        # load an empty route, just in case. Hardcoded, but wtv, Abra is in every game
+        self._data.new_route("Abra")
+
     @handle_exceptions
     def customize_innate_stats(self, new_dvs, new_ability, new_nature):
+        self._finish_route_load()
         self._data.change_current_innate_stats(new_dvs, new_ability, new_nature)
         self._on_route_change()
 
     @handle_exceptions
     def move_groups_up(self, event_ids):
+        self._finish_route_load()
         for cur_event in event_ids:
             self._data.move_event_object(cur_event, True)
         self._on_route_change()
 
     @handle_exceptions
     def move_groups_down(self, event_ids):
+        self._finish_route_load()
         for cur_event in event_ids:
             self._data.move_event_object(cur_event, False)
         self._on_route_change()
 
     @handle_exceptions
     def delete_events(self, event_ids):
+        self._finish_route_load()
         self._data.batch_remove_events(event_ids)
 
         selection_changed = False
@@ -345,6 +426,7 @@ class MainController:
 
     @handle_exceptions
     def purge_empty_folders(self):
+        self._finish_route_load()
         while True:
             deleted_ids = []
             for cur_folder_name, cur_folder in self._data.folder_lookup.items():
@@ -360,11 +442,13 @@ class MainController:
 
     @handle_exceptions
     def transfer_to_folder(self, event_ids, new_folder_name):
+        self._finish_route_load()
         self._data.transfer_events(event_ids, new_folder_name)
         self._on_route_change()
 
     @handle_exceptions
     def new_event(self, event_def:EventDefinition, insert_after:int=None, insert_before:int=None, dest_folder_name=const.ROOT_FOLDER_NAME, do_select=True):
+        self._finish_route_load()
         result = self._data.add_event_object(event_def=event_def, insert_after=insert_after, insert_before=insert_before, dest_folder_name=dest_folder_name)
         self._on_route_change()
         if do_select:
@@ -373,6 +457,7 @@ class MainController:
 
     @handle_exceptions
     def finalize_new_folder(self, new_folder_name, prev_folder_name=None, insert_after=None):
+        self._finish_route_load()
         if prev_folder_name is None and insert_after is None:
             self._data.add_event_object(new_folder_name=new_folder_name)
         elif prev_folder_name is None:
@@ -384,6 +469,7 @@ class MainController:
 
     @handle_exceptions
     def toggle_event_highlight(self, event_ids):
+        self._finish_route_load()
         for cur_event in event_ids:
             self._data.toggle_event_highlight(cur_event)
         
@@ -391,18 +477,21 @@ class MainController:
 
     @handle_exceptions
     def set_record_mode(self, new_record_mode):
+        self._finish_route_load()
         self._is_record_mode_active = new_record_mode
         self._on_record_mode_change()
 
     @handle_exceptions
     def set_route_filter_types(self, filter_options):
         self._route_filter_types = filter_options
+        self._route_changes.set_full_refresh()
         self._on_route_change()
         self._on_event_selection()
 
     @handle_exceptions
     def set_route_search(self, search):
         self._route_search = search
+        self._route_changes.set_full_refresh()
         self._on_route_change()
         self._on_event_selection()
 
@@ -413,6 +502,8 @@ class MainController:
     @handle_exceptions
     def create_custom_version(self, base_version, custom_version):
         gen_factory._gen_factory.get_specific_version(base_version).create_new_custom_gen(custom_version)
+        # cheap, since only the metadata of each custom gen is read until the gen is actually used
+        gen_factory._gen_factory.reload_all_custom_gens()
 
     def send_message(self, message):
         self._on_info_message(message)
@@ -493,6 +584,9 @@ class MainController:
             return None
         return self._route_filter_types
 
+    def get_route_search_results(self) -> routing.route_search.RouteSearchResults:
+        return self._data.get_search_results(search=self.get_route_search_string(), filter_types=self.get_route_filter_types())
+
     def is_empty(self):
         return len(self._data.root_folder.children) == 0
 
@@ -506,6 +600,14 @@ class MainController:
 
         return target_mon.growth_rate == self.get_final_state().solo_pkmn.species_def.growth_rate
 
+    def pop_route_changes(self) -> routing.router.RouteChanges:
+        # everything that has changed since the last call, for the route list to update only the affected events
+        # NOTE: only the route list should call this, anything else would swallow the changes
+        result = self._route_changes
+        result.merge(self._data.pop_changes())
+        self._route_changes = routing.router.RouteChanges()
+        return result
+
     def has_unsaved_changes(self) -> routing.router.Router:
         return self._unsaved_changes
 
@@ -564,13 +666,15 @@ class MainController:
     def save_route(self, route_name):
         try:
             self._fire_pre_save_hooks()
-            self._data.save(route_name)
+            self._finish_route_load()
+            self._data.save(route_name, compact=config.use_compact_routes())
             self.send_message(f"Successfully saved route: {route_name}")
             self._unsaved_changes = False
         except Exception as e:
             self.trigger_exception(f"Couldn't save route due to exception! {type(e)}: {e}")
 
     def export_notes(self, route_name):
+        self._finish_route_load()
         out_path = self._data.export_notes(route_name)
         self.send_message(f"Exported notes to: {out_path}")
 
@@ -592,6 +696,9 @@ class MainController:
     def is_record_mode_active(self):
         return self._is_record_mode_active
 
+    def is_route_loading(self):
+        return self._route_loader is not None
+
     def get_move_idx(self, move_name, state=None):
         if state is None:
             state = self.get_final_state()
@@ -605,41 +712,12 @@ class MainController:
 
         return move_idx
 
-    def _walk_events_helper(self, cur_folder:EventFolder, cur_event_id:int, cur_event_found:bool, enabled_only:bool, walk_forward=True) -> Tuple[bool, EventGroup]:
-        if walk_forward:
-            iterable = cur_folder.children
-        else:
-            iterable = reversed(cur_folder.children)
-
-        for test_obj in iterable:
-            if isinstance(test_obj, EventGroup):
-                if cur_event_found and test_obj.is_enabled():
-                    return cur_event_found, test_obj
-                elif test_obj.group_id == cur_event_id:
-                    cur_event_found = True
-            elif isinstance(test_obj, EventFolder):
-                cur_event_found, prev_result = self._walk_events_helper(test_obj, cur_event_id, cur_event_found, enabled_only, walk_forward=walk_forward)
-                if cur_event_found and prev_result is not None:
-                    return cur_event_found, prev_result
-            else:
-                logger.error(f"Encountered unexpected types walking events: {type(test_obj)}")
-
-        return cur_event_found, None
+    def iter_events(self, start_after_id=None, reverse=False, enabled_only=False) -> Iterator[EventGroup]:
+        return self._data.iter_event_groups(start_after_id=start_after_id, reverse=reverse, enabled_only=enabled_only)
 
+    # NOTE: these have always skipped disabled events, regardless of enabled_only
     def get_next_event(self, cur_event_id=None, enabled_only=False) -> EventGroup:
-        return self._walk_events_helper(
-            self._data.root_folder,
-            cur_event_id,
-            cur_event_id == None,
-            enabled_only=enabled_only,
-            walk_forward=True
-        )[1]
+        return next(self._data.iter_event_groups(start_after_id=cur_event_id, enabled_only=True), None)
 
     def get_previous_event(self, cur_event_id=None, enabled_only=False) -> EventGroup:
-        return self._walk_events_helper(
-            self._data.root_folder,
-            cur_event_id,
-            cur_event_id == None,
-            enabled_only,
-            walk_forward=False
-        )[1]
+        return next(self._data.iter_event_groups(start_after_id=cur_event_id, reverse=True, enabled_only=True), None)
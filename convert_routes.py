@@ -0,0 +1,19 @@
+import argparse
+
+from routing import route_files
+
+
+if __name__ == "__main__":
+    # converts routes between the regular json format, and the compact format
+    # the format of each file is determined by its extension
+    parser = argparse.ArgumentParser()
+    parser.add_argument("route_files", nargs="+")
+    parser.add_argument("-o", "--output", default=None, help="Path to write the converted route to. Only valid when converting a single route")
+    args = parser.parse_args()
+
+    if args.output is not None and len(args.route_files) > 1:
+        parser.error("--output can only be used when converting a single route")
+
+    for cur_route_path in args.route_files:
+        dest_path = route_files.convert_route(cur_route_path, dest_path=args.output)
+        print(f"Converted {cur_route_path} to: {dest_path}")
@@ -134,6 +134,8 @@ class CustomGridview(CheckboxTreeview):
         super().__init__(*args, **kwargs, selectmode="extended")
 
         self._treeview_id_lookup = {}
+        # the text, values and tags each row was last given, so that rows which haven't changed are left alone
+        self._rendered_lookup = {}
         self._cfg_custom_columns()
     
     def _cfg_custom_columns(self):
@@ -161,6 +163,14 @@ class CustomGridview(CheckboxTreeview):
                 self.column(cur_col.id, stretch=tk.YES)
             self.heading(cur_col.id, text=cur_col.name)
 
+    def _set_checkbox_state(self, item, state, force=False):
+        # the tags are being changed directly, so the row needs to be fully updated next time
+        self._rendered_lookup.pop(item, None)
+        super()._set_checkbox_state(item, state, force=force)
+
+    def forget_rendered_values(self, item_id):
+        self._rendered_lookup.pop(item_id, None)
+
     @staticmethod
     def _get_attr_helper(obj, attr):
         if hasattr(obj, attr):
@@ -185,34 +195,43 @@ class CustomGridview(CheckboxTreeview):
                 tags.append(self.CHECKED_TAG if checkbox_val else self.UNCHECKED_TAG)
         
         tags = tuple(tags)
+        values = tuple(self._get_attr_helper(obj, x.attr) for x in self._custom_col_data)
 
         if semantic_id in self._treeview_id_lookup:
             item_id = self._treeview_id_lookup[semantic_id]
+            prev_rendered = self._rendered_lookup.get(item_id)
 
             # if we aren't updating checkbox state, attempt to preserve previous state
             if not update_checkbox:
-                prev_checkbox_state = self.get_checkbox_state(item_id)
+                if prev_rendered is None:
+                    prev_checkbox_state = self.get_checkbox_state(item_id)
+                else:
+                    prev_checkbox_state = next((x for x in prev_rendered[2] if x in self.ALL_STATES), None)
                 if prev_checkbox_state is not None:
                     tags = tuple(list(tags) + [prev_checkbox_state])
 
-            self.item(
-                item_id,
-                text=str(text_val),
-                values=tuple(self._get_attr_helper(obj, x.attr) for x in self._custom_col_data),
-                tags=tags,
-            )
+            rendered = (str(text_val), values, tags)
+            if rendered != prev_rendered:
+                self.item(
+                    item_id,
+                    text=rendered[0],
+                    values=values,
+                    tags=tags,
+                )
+                self._rendered_lookup[item_id] = rendered
 
         else:
             item_id = self.insert(
                 parent,
                 tk.END,
                 text=str(text_val),
-                values=tuple(self._get_attr_helper(obj, x.attr) for x in self._custom_col_data),
+                values=values,
                 tags=tags,
                 open=force_open
             )
 
             self._treeview_id_lookup[semantic_id] = item_id
+            self._rendered_lookup[item_id] = (str(text_val), values, tags)
 
         return item_id
 
@@ -220,7 +220,7 @@ class MainWindow(tk.Tk):
         # intentionally pack event list after scrollbar, so they're ordered correctly
         self.scroll_bar.pack(side="right", fill=tk.BOTH)
         self.event_list.pack(padx=10, pady=10, fill=tk.BOTH, expand=True, side="right")
-        self.event_list.configure(yscrollcommand=self.scroll_bar.set)
+        self.event_list.set_scroll_bar(self.scroll_bar)
 
         # right panel for event details
         self.event_details = EventDetails(self._controller, self._battle_controller, self.info_panel)
@@ -271,7 +271,7 @@ class MainWindow(tk.Tk):
         self.bind(self._controller.register_record_mode_change(self), self._on_record_mode_changed)
         self.bind(self._controller.register_message_callback(self), self._on_route_message)
         # TODO: should this be moved directly to the event list class?
-        self.bind(self._controller.register_route_change(self), self.event_list.refresh)
+        self.bind(self._controller.register_route_change(self), self._on_route_change)
 
         self.event_list.refresh()
         self.new_event_window = None
@@ -294,6 +294,7 @@ class MainWindow(tk.Tk):
             if not messagebox.askyesno("Quit?", "Route has unsaved changes. Quit without saving?"):
                 return
 
+        self._battle_controller.shutdown_calc_workers()
         self.destroy()
 
     def _on_exception(self, *args, **kwargs):
@@ -318,6 +319,12 @@ class MainWindow(tk.Tk):
         if not self._loading_route_name:
             self._controller.set_current_route_name(self.route_name.get())
     
+    def _on_route_change(self, *args, **kwargs):
+        self.event_list.refresh()
+        # keep loading the rest of the route once everything loaded so far has been drawn
+        if self._controller.is_route_loading():
+            self.after_idle(self._controller.continue_route_load)
+
     def _on_route_message(self, *args, **kwargs):
         self.message_label.set_message(self._controller.get_next_message_info())
 
@@ -353,6 +360,7 @@ class MainWindow(tk.Tk):
             background=const.VERSION_COLORS.get(self._controller.get_version(), "white")
         )
         self.record_button.enable()
+        self._battle_controller.start_calc_workers()
     
     def record_button_clicked(self, *args, **kwargs):
         self._controller.set_record_mode(not self._controller.is_record_mode_active())
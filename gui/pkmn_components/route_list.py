@@ -1,15 +1,18 @@
 from controllers.main_controller import MainController
+import bisect
 import logging
+import tkinter as tk
 
 from gui import custom_components
-from routing import route_events
+from routing import route_events, route_search
 from utils.constants import const
+from utils.config_manager import config
 
 logger = logging.getLogger(__name__)
 
 
 class RouteList(custom_components.CustomGridview):
-    def __init__(self, controller:MainController, *args, **kwargs):
+    def __init__(self, controller:MainController, *args, virtualized=None, **kwargs):
         self._controller = controller
         super().__init__(
             *args,
@@ -42,29 +45,82 @@ class RouteList(custom_components.CustomGridview):
         self.bind("<<TreeviewOpen>>", self._treeview_opened_callback)
         self.bind("<<TreeviewClose>>", self._treeview_closed_callback)
 
+        # Virtualized lists only create rows for the part of the route that is actually visible (plus a buffer)
+        # The rows are created from a flattened copy of the displayed route, which is re-built whenever the route changes
+        # and rows are swapped in and out of the tree as the list is scrolled
+        if virtualized is None:
+            virtualized = config.use_virtual_route_list()
+        self._virtualized = virtualized
+        self._scroll_bar = None
+        # every row that would be displayed, in order, as (event object, index of the parent row)
+        self._virtual_rows = []
+        self._virtual_idx_lookup = {}
+        # indices of all rows which currently exist in the tree
+        self._virtual_materialized = []
+        self._virtual_window = (0, 0)
+        self._virtual_top = 0
+        self._visible_row_count = const.VIRTUAL_ROUTE_LIST_BUFFER // 2
+        self._virtual_layout_in_progress = False
+        self._rewindow_pending = False
+        # event groups whose event items are shown. Normally, the tree keeps track of this on its own
+        self._open_group_ids = set()
+        # rows are created without their children when they're closed, so they get an empty child to keep the expand indicator
+        self._placeholder_ids = {}
+        self._virtual_open_lookup = {}
+        self._virtual_prev_lookup = {}
+
+    def set_scroll_bar(self, scroll_bar:tk.Scrollbar):
+        self._scroll_bar = scroll_bar
+        if self._virtualized:
+            # the tree doesn't know about the rest of the route, so the scroll bar gets updated from the flattened route instead
+            self.configure(yscrollcommand=self._on_virtual_yscroll)
+        else:
+            self.configure(yscrollcommand=scroll_bar.set)
+
+    def yview(self, *args):
+        if not self._virtualized or not args:
+            return super().yview(*args)
+
+        # requests from the scroll bar, which are relative to the entire route
+        if args[0] == tk.MOVETO:
+            target_idx = int(float(args[1]) * len(self._virtual_rows))
+        else:
+            target_idx = int(args[1])
+            if args[2] == tk.PAGES:
+                target_idx *= self._visible_row_count
+            target_idx += self._virtual_top
+        self._show_virtual_window(target_idx)
+
     def general_checkbox_callback_fn(self):
         self._controller.get_raw_route()._recalc()
         self.refresh()
 
     def _treeview_opened_callback(self, *args, **kwargs):
+        if self._virtualized:
+            # the item being opened is always the focus item
+            self._set_virtual_row_open(self.focus(), True)
+            return
+
         selected = self.get_all_selected_event_ids()
         # no easy way to figure out unless only one is sleected. Just give up otherwise
         if len(selected) == 1:
             cur_obj = self._controller.get_event_by_id(selected[0])
             if isinstance(cur_obj, route_events.EventFolder):
                 cur_obj.expanded = True
-
-            self.refresh()
+                self.refresh(updated_ids=[cur_obj.group_id])
 
     def _treeview_closed_callback(self, event):
+        if self._virtualized:
+            self._set_virtual_row_open(self.focus(), False)
+            return
+
         selected = self.get_all_selected_event_ids()
         # no easy way to figure out unless only one is sleected. Just give up otherwise
         if len(selected) == 1:
             cur_obj = self._controller.get_event_by_id(selected[0])
             if isinstance(cur_obj, route_events.EventFolder):
                 cur_obj.expanded = False
-
-            self.refresh()
+                self.refresh(updated_ids=[cur_obj.group_id])
 
     def checkbox_item_callback_fn(self, item_id, new_state):
         raw_obj = self._controller.get_event_by_id(self._get_route_id_from_item_id(item_id))
@@ -79,6 +135,12 @@ class RouteList(custom_components.CustomGridview):
             return -1
 
     def set_all_selected_event_ids(self, event_ids):
+        if self._virtualized:
+            # make sure rows exist for the newly selected events, even if they're nowhere near the visible part of the route
+            missing_ids = [x for x in event_ids if x not in self._treeview_id_lookup and x in self._virtual_idx_lookup]
+            if missing_ids:
+                self._show_virtual_window(self._virtual_top, extra_ids=missing_ids)
+
         new_selection = []
         try:
             for cur_event_id in event_ids:
@@ -91,6 +153,13 @@ class RouteList(custom_components.CustomGridview):
             pass
 
     def scroll_to_selected_events(self):
+        if self._virtualized:
+            if self.selection():
+                cur_idx = self._virtual_idx_lookup.get(self._get_route_id_from_item_id(self.selection()[-1]))
+                if cur_idx is not None and not (self._virtual_top <= cur_idx < self._virtual_top + self._visible_row_count):
+                    self._show_virtual_window(cur_idx - (self._visible_row_count // 2))
+            return
+
         try:
             if self.selection():
                 self.see(self.selection()[-1])
@@ -118,7 +187,24 @@ class RouteList(custom_components.CustomGridview):
 
         return result
 
-    def refresh(self, *args, **kwargs):
+    def refresh(self, *args, force_full=False, updated_ids=None, **kwargs):
+        # only the rows of events which have changed since the last refresh are updated, unless the whole route changed
+        changes = self._controller.pop_route_changes()
+        if updated_ids is not None:
+            for cur_id in updated_ids:
+                changes.record_updated(cur_id)
+
+        if self._virtualized:
+            if force_full or not changes.is_empty():
+                self._virtual_refresh()
+        elif force_full or changes.full_refresh:
+            self._full_refresh()
+        elif not changes.is_empty():
+            self._apply_changes(changes)
+
+        self.event_generate(const.ROUTE_LIST_REFRESH_EVENT)
+
+    def _full_refresh(self):
         # begin keeping track of the stuff we already know we're displaying
         # so we can eventually delete stuff that has been removed
         to_delete_ids = set(self._treeview_id_lookup.keys())
@@ -127,6 +213,7 @@ class RouteList(custom_components.CustomGridview):
         # we have now updated all relevant records, created missing ones, and ordered everything correctly
         # just need to remove any potentially deleted records
         for cur_del_id in to_delete_ids:
+            self.forget_rendered_values(self._treeview_id_lookup[cur_del_id])
             try:
                 self.delete(self._treeview_id_lookup[cur_del_id])
             except Exception:
@@ -136,18 +223,114 @@ class RouteList(custom_components.CustomGridview):
                 pass
             del self._treeview_id_lookup[cur_del_id]
 
-        self.event_generate(const.ROUTE_LIST_REFRESH_EVENT)
+    def _delete_row(self, semantic_id):
+        item_id = self._treeview_id_lookup.pop(semantic_id, None)
+        if item_id is None:
+            return
+
+        # deleting a row deletes all of its children too, so forget about those as well
+        self._forget_child_rows(item_id)
+        self.forget_rendered_values(item_id)
+        self._virtual_open_lookup.pop(item_id, None)
+        self.delete(item_id)
+
+    def _forget_child_rows(self, item_id):
+        placeholder_id = self._placeholder_ids.pop(item_id, None)
+        for child_id in self.get_children(item_id):
+            if child_id == placeholder_id:
+                continue
+            self._forget_child_rows(child_id)
+            self.forget_rendered_values(child_id)
+            self._virtual_open_lookup.pop(child_id, None)
+            self._treeview_id_lookup.pop(self._get_route_id_from_item_id(child_id), None)
+
+    def _apply_changes(self, changes):
+        for cur_id in changes.removed_ids:
+            self._delete_row(cur_id)
+
+        # changed events need to be re-checked, along with all the folders containing them
+        # any other folders can't have been affected, so they are skipped over entirely
+        to_check_ids = set()
+        for cur_id in changes.inserted_ids | changes.moved_ids | changes.updated_ids:
+            event_obj = self._controller.get_event_by_id(cur_id)
+            # event items are always updated along with their group
+            if event_obj is None or isinstance(event_obj, route_events.EventItem):
+                continue
+
+            while event_obj is not None and event_obj.group_id not in to_check_ids:
+                to_check_ids.add(event_obj.group_id)
+                event_obj = event_obj.parent
+
+        # the relative order of the other rows can't have changed, so only these ever need to be moved
+        to_place_ids = changes.inserted_ids | changes.moved_ids
+        self._patch_recursively("", self._controller.get_raw_route().root_folder, to_check_ids, to_place_ids)
+
+    def _patch_recursively(self, parent_id, folder_obj:route_events.EventFolder, to_check_ids:set, to_place_ids:set, check_all=False):
+        search_results = self._controller.get_route_search_results()
+        # the closest row before the current event, which is always already in the right position
+        prev_item_id = None
+        for event_obj in folder_obj.children:
+            semantic_id = event_obj.group_id
+            cur_event_id = self._treeview_id_lookup.get(semantic_id)
+            if not check_all and semantic_id not in to_check_ids:
+                if cur_event_id is not None:
+                    prev_item_id = cur_event_id
+                continue
+
+            if not search_results.do_render(event_obj):
+                self._delete_row(semantic_id)
+                continue
+
+            is_new = cur_event_id is None
+            is_folder = isinstance(event_obj, route_events.EventFolder)
+            cur_event_id = self.custom_upsert(
+                event_obj,
+                parent=parent_id,
+                force_open=is_folder and event_obj.expanded,
+                update_checkbox=True
+            )
+
+            if is_new or semantic_id in to_place_ids:
+                target_idx = 0 if prev_item_id is None else self.index(prev_item_id) + 1
+                if self.parent(cur_event_id) != parent_id:
+                    self.move(cur_event_id, parent_id, target_idx)
+                else:
+                    cur_idx = self.index(cur_event_id)
+                    # rows moving further down are taken out before being put back, which shifts everything after them up
+                    if cur_idx < target_idx:
+                        target_idx -= 1
+                    if cur_idx != target_idx:
+                        self.move(cur_event_id, parent_id, target_idx)
+            prev_item_id = cur_event_id
+
+            if is_folder:
+                # a newly shown folder doesn't have rows for any of its children yet
+                self._patch_recursively(cur_event_id, event_obj, to_check_ids, to_place_ids, check_all=check_all or is_new)
+            else:
+                self._patch_event_items(cur_event_id, event_obj)
+
+    def _patch_event_items(self, parent_id, event_obj:route_events.EventGroup):
+        num_items = 0
+        if len(event_obj.event_items) > 1:
+            # item ids are based on their position, so existing rows are already in the right place
+            # and new rows are always added after them
+            for item_obj in event_obj.event_items:
+                self.custom_upsert(item_obj, parent=parent_id)
+            num_items = len(event_obj.event_items)
+
+        # which also means any leftover rows are the ones after the last item
+        leftover_id = route_events.get_event_item_id(event_obj.group_id, num_items)
+        while leftover_id in self._treeview_id_lookup:
+            self._delete_row(leftover_id)
+            num_items += 1
+            leftover_id = route_events.get_event_item_id(event_obj.group_id, num_items)
     
     def _refresh_recursively(self, parent_id, event_list, to_delete_ids:set):
-        cur_search = self._controller.get_route_search_string()
-        cur_filter = self._controller.get_route_filter_types()
+        search_results = self._controller.get_route_search_results()
         for event_idx, event_obj in enumerate(event_list):
             semantic_id = self._get_attr_helper(event_obj, self._semantic_id_attr)
 
-            if not event_obj.do_render(
-                search=cur_search,
-                filter_types=cur_filter,
-            ):
+            if not search_results.do_render(event_obj):
                 continue
 
             if isinstance(event_obj, route_events.EventFolder):
@@ -182,5 +365,201 @@ class RouteList(custom_components.CustomGridview):
                         else:
                             item_id = self.custom_upsert(item_obj, parent=cur_event_id)
 
-                        if self.index(cur_event_id) != item_idx or self.parent(cur_event_id) != cur_event_id:
+                        if self.index(item_id) != item_idx or self.parent(item_id) != cur_event_id:
                             self.move(item_id, cur_event_id, item_idx)
+
+    def _virtual_refresh(self):
+        # keep the same event at the top of the list, wherever it ends up in the re-built route
+        if self._virtual_top < len(self._virtual_rows):
+            top_id = self._virtual_rows[self._virtual_top][0].group_id
+        else:
+            top_id = None
+
+        self._virtual_rows = []
+        self._flatten_recursively(
+            self._controller.get_raw_route().root_folder,
+            None,
+            self._controller.get_route_search_results(),
+        )
+        self._virtual_idx_lookup = {x[0].group_id: idx for idx, x in enumerate(self._virtual_rows)}
+        self._show_virtual_window(self._virtual_idx_lookup.get(top_id, self._virtual_top))
+
+    def _flatten_recursively(self, folder_obj:route_events.EventFolder, parent_idx, search_results:route_search.RouteSearchResults):
+        for event_obj in folder_obj.children:
+            if isinstance(event_obj, route_events.EventFolder):
+                # folders without any matches are skipped without looking at their children
+                if not search_results.do_render(event_obj):
+                    continue
+
+                folder_idx = len(self._virtual_rows)
+                self._virtual_rows.append((event_obj, parent_idx))
+                if event_obj.expanded:
+                    self._flatten_recursively(event_obj, folder_idx, search_results)
+
+            elif search_results.do_render(event_obj):
+                group_idx = len(self._virtual_rows)
+                self._virtual_rows.append((event_obj, parent_idx))
+                if len(event_obj.event_items) > 1 and event_obj.group_id in self._open_group_ids:
+                    self._virtual_rows.extend([(x, group_idx) for x in event_obj.event_items])
+
+    def _set_virtual_row_open(self, item_id, is_open):
+        cur_obj = self._controller.get_event_by_id(self._get_route_id_from_item_id(item_id))
+        if isinstance(cur_obj, route_events.EventFolder):
+            cur_obj.expanded = is_open
+        elif isinstance(cur_obj, route_events.EventGroup):
+            if is_open:
+                self._open_group_ids.add(cur_obj.group_id)
+            else:
+                self._open_group_ids.discard(cur_obj.group_id)
+        else:
+            return
+
+        # the tree has already opened (or closed) the row itself
+        self._virtual_open_lookup[item_id] = is_open
+        self.refresh(updated_ids=[cur_obj.group_id])
+
+    def _show_virtual_window(self, top_idx, extra_ids=None):
+        # creates rows for everything that can be seen when the list is scrolled to the given row, plus the buffer on either side
+        # and deletes all other rows, except for selected ones, so that the selection is kept
+        self._rewindow_pending = False
+        num_rows = len(self._virtual_rows)
+        top_idx = max(0, min(top_idx, num_rows - self._visible_row_count))
+        win_first = max(0, top_idx - const.VIRTUAL_ROUTE_LIST_BUFFER)
+        win_last = min(num_rows, top_idx + self._visible_row_count + const.VIRTUAL_ROUTE_LIST_BUFFER)
+
+        to_show = set(range(win_first, win_last))
+        keep_ids = [self._get_route_id_from_item_id(x) for x in self.selection()]
+        if extra_ids is not None:
+            keep_ids.extend(extra_ids)
+        for cur_id in keep_ids:
+            cur_idx = self._virtual_idx_lookup.get(cur_id)
+            if cur_idx is not None:
+                to_show.add(cur_idx)
+
+        # a row can't exist without the rows containing it
+        for cur_idx in list(to_show):
+            parent_idx = self._virtual_rows[cur_idx][1]
+            while parent_idx is not None and parent_idx not in to_show:
+                to_show.add(parent_idx)
+                parent_idx = self._virtual_rows[parent_idx][1]
+
+        self._virtual_layout_in_progress = True
+        try:
+            materialized = sorted(to_show)
+            to_show_ids = set(self._virtual_rows[x][0].group_id for x in materialized)
+            for cur_id in [x for x in self._treeview_id_lookup if x not in to_show_ids]:
+                self._delete_row(cur_id)
+
+            prev_lookup = {}
+            last_child_lookup = {}
+            for cur_idx in materialized:
+                self._show_virtual_row(cur_idx, prev_lookup, last_child_lookup)
+            self._virtual_prev_lookup = prev_lookup
+
+            self._virtual_materialized = materialized
+            self._virtual_window = (win_first, win_last)
+            self._virtual_top = top_idx
+            self._update_virtual_scroll_bar()
+
+            # the tree only updates its scroll region once it's redrawn
+            self.update_idletasks()
+            self.yview_moveto(0)
+            self.yview_scroll(bisect.bisect_left(materialized, top_idx), tk.UNITS)
+        finally:
+            self._virtual_layout_in_progress = False
+
+    def _show_virtual_row(self, row_idx, prev_lookup:dict, last_child_lookup:dict):
+        event_obj, parent_idx = self._virtual_rows[row_idx]
+        if parent_idx is None:
+            parent_id = ""
+        else:
+            parent_id = self._treeview_id_lookup[self._virtual_rows[parent_idx][0].group_id]
+
+        if isinstance(event_obj, route_events.EventFolder):
+            is_open = event_obj.expanded
+            has_children = len(event_obj.children) > 0
+        elif isinstance(event_obj, route_events.EventGroup):
+            is_open = event_obj.group_id in self._open_group_ids
+            has_children = len(event_obj.event_items) > 1
+        else:
+            is_open = False
+            has_children = False
+
+        cur_event_id = self.custom_upsert(
+            event_obj,
+            parent=parent_id,
+            force_open=is_open,
+            update_checkbox=not isinstance(event_obj, route_events.EventItem)
+        )
+
+        # rows which were already right after the same row last time don't need to be checked
+        prev_id = last_child_lookup.get(parent_id)
+        if self._virtual_prev_lookup.get(cur_event_id, "") != prev_id:
+            target_idx = 0 if prev_id is None else self.index(prev_id) + 1
+            if self.parent(cur_event_id) != parent_id:
+                self.move(cur_event_id, parent_id, target_idx)
+            else:
+                cur_idx = self.index(cur_event_id)
+                # rows moving further down are taken out before being put back, which shifts everything after them up
+                if cur_idx < target_idx:
+                    target_idx -= 1
+                if cur_idx != target_idx:
+                    self.move(cur_event_id, parent_id, target_idx)
+        prev_lookup[cur_event_id] = prev_id
+        last_child_lookup[parent_id] = cur_event_id
+
+        if self._virtual_open_lookup.get(cur_event_id) != is_open:
+            self.item(cur_event_id, open=is_open)
+            self._virtual_open_lookup[cur_event_id] = is_open
+
+        placeholder_id = self._placeholder_ids.get(cur_event_id)
+        if has_children and not is_open:
+            if placeholder_id is None:
+                self._placeholder_ids[cur_event_id] = self.insert(cur_event_id, tk.END, text="")
+        elif placeholder_id is not None:
+            self.delete(placeholder_id)
+            del self._placeholder_ids[cur_event_id]
+
+    def _on_virtual_yscroll(self, first, last):
+        # the tree has been scrolled, either by the list itself or through the tree directly (e.g. the mouse wheel)
+        if self._scroll_bar is None or self._virtual_layout_in_progress:
+            return
+
+        num_lines = len(self._virtual_materialized)
+        num_rows = len(self._virtual_rows)
+        if num_lines == 0 or num_rows == 0:
+            self._update_virtual_scroll_bar()
+            return
+
+        first = float(first)
+        last = float(last)
+        top_line = int(round(first * num_lines))
+        self._visible_row_count = max(1, int(round((last - first) * num_lines)))
+        win_first, win_last = self._virtual_window
+        window_start_line = bisect.bisect_left(self._virtual_materialized, win_first)
+        self._virtual_top = max(0, min(num_rows - 1, win_first + top_line - window_start_line))
+        self._update_virtual_scroll_bar()
+
+        # move the window once the visible rows get close to either end of it
+        margin = const.VIRTUAL_ROUTE_LIST_BUFFER // 2
+        if (
+            (win_first > 0 and self._virtual_top - win_first < margin) or
+            (win_last < num_rows and win_last - (self._virtual_top + self._visible_row_count) < margin)
+        ):
+            if not self._rewindow_pending:
+                self._rewindow_pending = True
+                self.after_idle(self._rewindow)
+
+    def _update_virtual_scroll_bar(self):
+        if self._scroll_bar is None:
+            return
+
+        num_rows = len(self._virtual_rows)
+        if num_rows == 0:
+            self._scroll_bar.set(0, 1)
+        else:
+            self._scroll_bar.set(self._virtual_top / num_rows, min(1.0, (self._virtual_top + self._visible_row_count) / num_rows))
+
+    def _rewindow(self):
+        if self._rewindow_pending:
+            self._show_virtual_window(self._virtual_top)
@@ -37,6 +37,13 @@ class BattleConfigWindow(Popup):
         self.search_depth_details = ttk.Label(self.input_frame, text="\n# Of turns to search damage ranges to find kill %'s\nLarger gets more accurate guaranteed kills, but may take longer, especially on slower computers")
         self.search_depth_details.grid(row=1, column=0, columnspan=2, pady=self.pady, padx=self.padx)
 
+        self.workers_label = ttk.Label(self.input_frame, text="Damage Calc Worker Processes:")
+        self.workers_label.grid(row=2, column=0, pady=self.pady, padx=self.padx)
+        self.workers_val = custom_components.AmountEntry(self.input_frame, init_val=config.get_battle_summary_workers(), callback=self._update_battle_summary_workers, min_val=0, max_val=32)
+        self.workers_val.grid(row=2, column=1, pady=self.pady, padx=self.padx)
+        self.workers_details = ttk.Label(self.input_frame, text="\n# Of background processes used to calculate damage ranges, 0 to calculate without any\nCan keep the app responsive with large search depths, but uses more memory")
+        self.workers_details.grid(row=3, column=0, columnspan=2, pady=self.pady, padx=self.padx)
+
         self.force_full_search_label = custom_components.CheckboxLabel(self.input_frame, text="Fully calculate psywave (Not recommended):", toggle_command=self._toggle_force_full_search, flip=True)
         self.force_full_search_label.grid(row=10, column=0, columnspan=2, pady=self.pady, padx=self.padx)
         self.force_full_search_label.set_checked(config.do_force_full_search())
@@ -127,3 +134,12 @@ class BattleConfigWindow(Popup):
             pass
 
         config.set_damage_search_depth(result)
+
+    def _update_battle_summary_workers(self, *args, **kwargs):
+        result = config.DEFAULT_BATTLE_SUMMARY_WORKERS
+        try:
+            result = int(self.workers_val.get())
+        except Exception:
+            pass
+
+        config.set_battle_summary_workers(result)
@@ -52,6 +52,22 @@ class DataDirConfigWindow(Popup):
         self.debug_mode_button = ttk.Checkbutton(self.app_info_frame, variable=self.debug_mode_value)
         self.debug_mode_button.grid(row=2, column=1)
 
+        self.compact_routes_label = tk.Label(self.app_info_frame, text="Save Routes in Compact Format:")
+        self.compact_routes_label.grid(row=3, column=0)
+        self.compact_routes_value = tk.BooleanVar()
+        self.compact_routes_value.set(config.use_compact_routes())
+        self.compact_routes_value.trace("w", self.toggle_compact_routes)
+        self.compact_routes_button = ttk.Checkbutton(self.app_info_frame, variable=self.compact_routes_value)
+        self.compact_routes_button.grid(row=3, column=1)
+
+        self.virtual_route_list_label = tk.Label(self.app_info_frame, text="Only Draw Visible Route Events (requires restart):")
+        self.virtual_route_list_label.grid(row=4, column=0)
+        self.virtual_route_list_value = tk.BooleanVar()
+        self.virtual_route_list_value.set(config.use_virtual_route_list())
+        self.virtual_route_list_value.trace("w", self.toggle_virtual_route_list)
+        self.virtual_route_list_button = ttk.Checkbutton(self.app_info_frame, variable=self.virtual_route_list_value)
+        self.virtual_route_list_button.grid(row=4, column=1)
+
         self._windows_label = tk.Label(self.app_info_frame, text="Automatic updates only supported on windows machines")
         self._windows_label.grid(row=5, column=0, columnspan=2, padx=self.padx, pady=(2 * self.pady, self.pady))
         self._latest_version_label = tk.Label(self.app_info_frame, text="Fetching newest version...")
@@ -116,6 +132,12 @@ class DataDirConfigWindow(Popup):
     
     def toggle_debug_mode(self, *args, **kwargs):
         config.set_debug_mode(not config.is_debug_mode())
+    
+    def toggle_compact_routes(self, *args, **kwargs):
+        config.set_compact_routes(not config.use_compact_routes())
+    
+    def toggle_virtual_route_list(self, *args, **kwargs):
+        config.set_virtual_route_list(not config.use_virtual_route_list())
 
     def _change_location_helper(self, init_dir):
         logger.info(f"Trying to change location of init_dir: {init_dir}")
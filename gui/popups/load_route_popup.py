@@ -77,4 +77,4 @@ class LoadRouteWindow(Popup):
             return
         
         self.close()
-        self._controller.load_route(io_utils.get_existing_route_path(self.previous_route_names.get()))
+        self._controller.load_route(io_utils.get_existing_route_path(self.previous_route_names.get()), incremental=True)
@@ -10,7 +10,7 @@ from pkmn import universal_utils
 from routing.route_events import \
     EventDefinition, EventItem, EvolutionEventDefinition, HoldItemEventDefinition, InventoryEventDefinition, LearnMoveEventDefinition, \
     RareCandyEventDefinition, TrainerEventDefinition, VitaminEventDefinition, WildPkmnEventDefinition, \
-    SaveEventDefinition, HealEventDefinition, BlackoutEventDefinition
+    SaveEventDefinition, HealEventDefinition, BlackoutEventDefinition, EncounterGrindEventDefinition
 
 from utils.constants import const
 from pkmn.gen_factory import current_gen_info
@@ -27,6 +27,7 @@ class QuickTrainerAdd(ttk.LabelFrame):
         self._ignore_preview = False
         self._multi_setup_mode = False
         self._saved_partner = None
+        self._trainer_display_names = {}
 
         self.padx = 5
         self.pady = 1
@@ -110,6 +111,7 @@ class QuickTrainerAdd(ttk.LabelFrame):
                 self._add_multi.disable()
     
     def update_pkmn_version(self, *args, **kwargs):
+        self._trainer_display_names = {}
         self._trainers_by_loc.new_values([const.ALL_TRAINERS] + sorted(current_gen_info().trainer_db().get_all_locations()))
         self._trainers_by_class.new_values([const.ALL_TRAINERS] + sorted(current_gen_info().trainer_db().get_all_classes()))
         self._set_multi_setup_mode(False)
@@ -124,10 +126,14 @@ class QuickTrainerAdd(ttk.LabelFrame):
     def route_change_callback(self, *args, **kwargs):
         self.trainer_filter_callback(ignore_trainer_preview=True)
     
-    @staticmethod
-    def _custom_trainer_name(trainer_obj:Trainer):
+    def _custom_trainer_name(self, trainer_obj:Trainer):
         # custom name to inject exp per sec into name results
-        return f"({universal_utils.experience_per_second(current_gen_info().get_trainer_timing_info(), trainer_obj.pkmn)}) {trainer_obj.name}"
+        # cached, since the filters get re-applied on every change, and the exp per sec never changes for a given trainer
+        result = self._trainer_display_names.get(trainer_obj)
+        if result is None:
+            result = f"({universal_utils.experience_per_second(current_gen_info().get_trainer_timing_info(), trainer_obj.pkmn)}) {trainer_obj.name}"
+            self._trainer_display_names[trainer_obj] = result
+        return result
     
     def _get_trainer_name(self):
         # extract raw trainer name from value in list that has exp per sec
@@ -273,6 +279,20 @@ class QuickWildPkmn(ttk.LabelFrame):
         self._quantity_val.grid(row=self._cur_row, column=1, padx=self.padx, pady=self.pady, sticky=tk.E)
         self._cur_row += 1
 
+        self._encounter_map_label = tk.Label(self._dropdowns, text="Grind Map:", justify=tk.LEFT)
+        self._encounter_map = custom_components.SimpleOptionMenu(self._dropdowns, [const.NO_ENCOUNTERS], callback=self._encounter_map_callback)
+        self._encounter_map.configure(width=self.option_menu_width)
+        self._encounter_map_label.grid(row=self._cur_row, column=0, padx=self.padx, pady=self.pady, sticky=tk.W)
+        self._encounter_map.grid(row=self._cur_row, column=1, padx=self.padx, pady=self.pady, sticky=tk.E)
+        self._cur_row += 1
+
+        self._encounter_method_label = tk.Label(self._dropdowns, text="Grind Method:", justify=tk.LEFT)
+        self._encounter_method = custom_components.SimpleOptionMenu(self._dropdowns, [const.NO_ENCOUNTERS], callback=self._update_button_callback_wrapper)
+        self._encounter_method.configure(width=self.option_menu_width)
+        self._encounter_method_label.grid(row=self._cur_row, column=0, padx=self.padx, pady=self.pady, sticky=tk.W)
+        self._encounter_method.grid(row=self._cur_row, column=1, padx=self.padx, pady=self.pady, sticky=tk.E)
+        self._cur_row += 1
+
         self._buttons = ttk.Frame(self)
         self._buttons.pack(fill=tk.X, anchor=tk.CENTER, side=tk.BOTTOM)
         self._btn_width = 8
@@ -281,6 +301,8 @@ class QuickWildPkmn(ttk.LabelFrame):
         self._add_wild_pkmn.grid(row=0, column=0, padx=self.padx, pady=self.pady + 1, sticky=tk.W)
         self._add_trainer_pkmn = custom_components.SimpleButton(self._buttons, text="Add Trainer Pkmn", command=self.add_trainer_pkmn_cmd)
         self._add_trainer_pkmn.grid(row=0, column=1, padx=self.padx, pady=self.pady + 1, sticky=tk.W)
+        self._add_encounter_grind = custom_components.SimpleButton(self._buttons, text="Add Grind", command=self.add_encounter_grind_cmd)
+        self._add_encounter_grind.grid(row=1, column=0, columnspan=2, padx=self.padx, pady=self.pady + 1)
 
         self._level_val.set(5)
         self.bind(self._controller.register_event_selection(self), self.update_button_status)
@@ -291,6 +313,7 @@ class QuickWildPkmn(ttk.LabelFrame):
         if not self._controller.can_insert_after_current_selection():
             self._add_wild_pkmn.disable()
             self._add_trainer_pkmn.disable()
+            self._add_encounter_grind.disable()
             return
         
         valid = True
@@ -304,22 +327,36 @@ class QuickWildPkmn(ttk.LabelFrame):
         except Exception:
             valid = False
 
+        valid_quantity = True
         try:
             quantity = int(self._quantity_val.get().strip())
             if quantity < 1:
                 raise ValueError
         except Exception:
-            valid = False
+            valid_quantity = False
 
-        if not valid:
+        if not valid or not valid_quantity:
             self._add_wild_pkmn.disable()
             self._add_trainer_pkmn.disable()
         else:
             self._add_wild_pkmn.enable()
             self._add_trainer_pkmn.enable()
 
+        if (
+            not valid_quantity or
+            current_gen_info().encounter_db().get_table(self._encounter_map.get(), self._encounter_method.get()) is None
+        ):
+            self._add_encounter_grind.disable()
+        else:
+            self._add_encounter_grind.enable()
+
     def update_pkmn_version(self, *args, **kwargs):
         self._pkmn_types.new_values(current_gen_info().pkmn_db().get_all_names())
+        self._encounter_map.new_values(current_gen_info().encounter_db().get_all_maps() or [const.NO_ENCOUNTERS])
+
+    def _encounter_map_callback(self, *args, **kwargs):
+        self._encounter_method.new_values(current_gen_info().encounter_db().get_methods(self._encounter_map.get()) or [const.NO_ENCOUNTERS])
+        self.update_button_status()
 
     def _pkmn_filter_callback(self, *args, **kwargs):
         self._pkmn_types.new_values(current_gen_info().pkmn_db().get_filtered_names(filter_val=self._pkmn_filter.get().strip()))
@@ -340,6 +377,18 @@ class QuickWildPkmn(ttk.LabelFrame):
             insert_after=self._controller.get_single_selected_event_id()
         )
 
+    def add_encounter_grind_cmd(self, *args, **kwargs):
+        self._controller.new_event(
+            EventDefinition(
+                encounter_grind=EncounterGrindEventDefinition(
+                    self._encounter_map.get(),
+                    self._encounter_method.get(),
+                    int(self._quantity_val.get().strip()),
+                )
+            ),
+            insert_after=self._controller.get_single_selected_event_id()
+        )
+
     def add_trainer_pkmn_cmd(self, *args, **kwargs):
         self._controller.new_event(
             EventDefinition(
@@ -8,7 +8,8 @@ from gui.pkmn_components.pkmn_viewer import PkmnViewer
 from utils.constants import const
 from utils.config_manager import config
 from pkmn.gen_factory import current_gen_info
-from routing.route_events import BlackoutEventDefinition, EventDefinition, EvolutionEventDefinition, HealEventDefinition, HoldItemEventDefinition, InventoryEventDefinition, LearnMoveEventDefinition, RareCandyEventDefinition, SaveEventDefinition, TrainerEventDefinition, VitaminEventDefinition, WildPkmnEventDefinition
+from pkmn import universal_utils
+from routing.route_events import BlackoutEventDefinition, EncounterGrindEventDefinition, EventDefinition, EvolutionEventDefinition, HealEventDefinition, HoldItemEventDefinition, InventoryEventDefinition, LearnMoveEventDefinition, RareCandyEventDefinition, SaveEventDefinition, TrainerEventDefinition, VitaminEventDefinition, WildPkmnEventDefinition
 from routing import full_route_state
 
 logger = logging.getLogger(__name__)
@@ -716,6 +717,120 @@ class WildPkmnEditor(EventEditorBase):
         self._pkmn_trainer_flag.disable()
 
 
+class EncounterGrindEditor(EventEditorBase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self._map_label = ttk.Label(self, text="Map:")
+        self._map_selector = custom_components.SimpleOptionMenu(self, [const.NO_ENCOUNTERS], width=20, callback=self._map_selected_callback)
+        self._map_label.grid(row=self._cur_row, column=0, pady=2)
+        self._map_selector.grid(row=self._cur_row, column=1, pady=2)
+        self._cur_row += 1
+
+        self._method_label = ttk.Label(self, text="Encounter Method:")
+        self._method_selector = custom_components.SimpleOptionMenu(self, [const.NO_ENCOUNTERS], width=20, callback=self._update_button_status)
+        self._method_label.grid(row=self._cur_row, column=0, pady=2)
+        self._method_selector.grid(row=self._cur_row, column=1, pady=2)
+        self._cur_row += 1
+
+        self._quantity_label = ttk.Label(self, text="Num Encounters:")
+        self._quantity = custom_components.AmountEntry(self, min_val=1, callback=self._update_button_status, width=5)
+        self._quantity_label.grid(row=self._cur_row, column=0, pady=2)
+        self._quantity.grid(row=self._cur_row, column=1, pady=2)
+        self._cur_row += 1
+
+        self._repel_label = ttk.Label(self, text="Repel Level (0 for none):")
+        self._repel_level = custom_components.AmountEntry(self, min_val=0, max_val=100, callback=self._update_button_status, width=5)
+        self._repel_label.grid(row=self._cur_row, column=0, pady=2)
+        self._repel_level.grid(row=self._cur_row, column=1, pady=2)
+        self._cur_row += 1
+
+        self._expected_yield_label = ttk.Label(self, text="")
+        self._expected_yield_label.grid(row=self._cur_row, column=0, columnspan=2, pady=2)
+        self._cur_row += 1
+
+    def _get_repel_level(self):
+        repel_level = int(self._repel_level.get().strip())
+        if repel_level <= 0:
+            return None
+        return repel_level
+
+    def _update_expected_yield(self):
+        encounter_table = current_gen_info().encounter_db().get_table(self._map_selector.get(), self._method_selector.get())
+        expected_yield = None
+        if encounter_table is not None:
+            try:
+                expected_yield = universal_utils.calc_expected_encounter_yield(current_gen_info(), encounter_table, repel_level=self._get_repel_level())
+            except Exception:
+                expected_yield = None
+
+        if expected_yield is None:
+            self._expected_yield_label.configure(text="")
+        else:
+            self._expected_yield_label.configure(text=f"Avg XP per encounter: {expected_yield[0]:.1f}")
+
+    def _map_selected_callback(self, *args, **kwargs):
+        self._method_selector.new_values(current_gen_info().encounter_db().get_methods(self._map_selector.get()) or [const.NO_ENCOUNTERS])
+        self._update_button_status()
+
+    def _update_button_status(self, *args, **kwargs):
+        self._update_expected_yield()
+        valid = True
+        if current_gen_info().encounter_db().get_table(self._map_selector.get(), self._method_selector.get()) is None:
+            valid = False
+
+        try:
+            quantity = int(self._quantity.get().strip())
+            if quantity < 1:
+                raise ValueError
+            self._get_repel_level()
+        except Exception:
+            valid = False
+
+        if valid:
+            self._trigger_save()
+
+    @ignore_updates
+    def configure(self, editor_params, save_callback=None, delayed_save_callback=None):
+        super().configure(editor_params, save_callback=save_callback, delayed_save_callback=delayed_save_callback)
+        self._map_selector.new_values(current_gen_info().encounter_db().get_all_maps() or [const.NO_ENCOUNTERS])
+        self._quantity.set("1")
+        self._repel_level.set("0")
+
+    @ignore_updates
+    def load_event(self, event_def):
+        self._map_selector.set(event_def.encounter_grind.map_name)
+        self._method_selector.new_values(
+            current_gen_info().encounter_db().get_methods(event_def.encounter_grind.map_name) or [const.NO_ENCOUNTERS],
+            default_val=event_def.encounter_grind.method
+        )
+        self._quantity.set(str(event_def.encounter_grind.quantity))
+        self._repel_level.set(str(event_def.encounter_grind.repel_level or 0))
+        self._update_expected_yield()
+
+    def get_event(self):
+        return EventDefinition(
+            encounter_grind=EncounterGrindEventDefinition(
+                self._map_selector.get(),
+                self._method_selector.get(),
+                int(self._quantity.get().strip()),
+                repel_level=self._get_repel_level()
+            )
+        )
+
+    def enable(self):
+        self._map_selector.enable()
+        self._method_selector.enable()
+        self._quantity.enable()
+        self._repel_level.enable()
+
+    def disable(self):
+        self._map_selector.disable()
+        self._method_selector.disable()
+        self._quantity.disable()
+        self._repel_level.disable()
+
+
 class InventoryEventEditor(EventEditorBase):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -1153,6 +1268,7 @@ class EventEditorFactory:
         const.TASK_RARE_CANDY: RareCandyEditor,
         const.TASK_VITAMIN: VitaminEditor,
         const.TASK_FIGHT_WILD_PKMN: WildPkmnEditor,
+        const.TASK_GRIND_ENCOUNTERS: EncounterGrindEditor,
         const.TASK_GET_FREE_ITEM: InventoryEventEditor,
         const.TASK_PURCHASE_ITEM: InventoryEventEditor,
         const.TASK_USE_ITEM: InventoryEventEditor,
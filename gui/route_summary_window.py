@@ -77,8 +77,7 @@ class RouteSummaryWindow(tk.Toplevel):
         self._move_frames:List[List[ttk.Frame]] = [[], [], [], []]
 
         summary_list:List[SummaryInfo] = []
-        cur_event = self._controller.get_next_event()
-        while cur_event is not None:
+        for cur_event in self._controller.iter_events(enabled_only=True):
             if (
                 cur_event.event_definition.trainer_def is not None and
                 cur_event.event_definition.enabled
@@ -110,8 +109,6 @@ class RouteSummaryWindow(tk.Toplevel):
                         rare_candy_count=cur_event.event_definition.rare_candy.amount,
                     )
                 )
-            
-            cur_event = self._controller.get_next_event(cur_event.group_id)
         
         if len(summary_list) == 0:
             header_frame = ttk.Frame(self._main_frame, style="SummaryHeader.TFrame")
@@ -35,8 +35,7 @@ class SetupSummaryWindow(tk.Toplevel):
     def _refresh(self, *args, **kwargs):
         moves_used = []
 
-        cur_event = self._controller.get_next_event()
-        while cur_event is not None:
+        for cur_event in self._controller.iter_events(enabled_only=True):
             if (
                 cur_event.event_definition.trainer_def is not None and
                 cur_event.event_definition.enabled and 
@@ -55,8 +54,6 @@ class SetupSummaryWindow(tk.Toplevel):
                     f"{cur_event.event_definition.get_label()}: {','.join(setup_moves_text)}"
                 )
 
-            cur_event = self._controller.get_next_event(cur_event.group_id)
-
         if moves_used:
             final_text = "\n".join(["Setup Moves:"] + moves_used)
         else:
@@ -1,6 +1,7 @@
 import argparse
 import os
 import concurrent.futures
+import multiprocessing
 from threading import Thread
 import logging
 from typing import Tuple
@@ -14,6 +15,7 @@ from webserver import router_server
 from utils.constants import const
 from utils.config_manager import config
 from utils import setup, custom_logging
+from pkmn import gen_factory
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +32,9 @@ def make_controllers(headless) -> Tuple[MainController, BattleSummaryController,
     recorder_controller = RecorderController(controller)
     controller.sync_register_record_mode_change(recorder_controller.on_recording_mode_changed)
 
+    # only the default version is loaded so far, the rest are loaded on first use, or in the background
+    gen_factory._gen_factory.load_all_gens_in_background()
+
     return controller, battle_controller, recorder_controller
 
 
@@ -58,6 +63,8 @@ def run(
 
 
 if __name__ == '__main__':
+    # required for the battle summary worker processes to start up properly in frozen builds
+    multiprocessing.freeze_support()
     parser = argparse.ArgumentParser()
     parser.add_argument("--debug", action="store_true")
     parser.add_argument("--gui", action="store_true")
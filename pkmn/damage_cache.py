@@ -0,0 +1,198 @@
+from collections import OrderedDict
+import logging
+from typing import List, Tuple
+
+from pkmn.damage_calc import DamageRange
+from pkmn.damage_calc import find_kill as _find_kill
+from pkmn.pkmn_info import CurrentGen
+from pkmn.universal_data_objects import EnemyPkmn, FieldStatus, Move, StageModifiers, StatBlock
+from utils.config_manager import config
+from utils.constants import const
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    def __init__(self, name:str):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def get(self, key):
+        # returns None on a miss. None is never stored as a value, see put()
+        result = self._data.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._data.move_to_end(key)
+        return result
+
+    def put(self, key, value):
+        max_size = config.get_damage_cache_size()
+        if value is None or max_size <= 0:
+            return
+
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > max_size:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def to_string(self) -> str:
+        total = self.hits + self.misses
+        hit_rate = 0 if total == 0 else (100 * self.hits / total)
+        return f"{self.name}: {len(self._data)} entries, {self.hits} hits, {self.misses} misses ({hit_rate:.1f}% hit rate)"
+
+
+# NOTE: misses are cached as well, since a move that can't do damage (e.g. a status move) is just as slow to figure out
+_NO_DAMAGE = "NO_DAMAGE"
+_damage_cache = LRUCache("damage")
+_kill_cache = LRUCache("kill ranges")
+
+
+def _get_stat_key(stats:StatBlock):
+    # NOTE: keyed on the values rather than the object, since battle stats get modified in place during some damage calcs
+    if stats is None:
+        return None
+    return (stats.hp, stats.attack, stats.defense, stats.special_attack, stats.special_defense, stats.speed)
+
+
+def _get_pkmn_key(pkmn:EnemyPkmn):
+    if pkmn is None:
+        return None
+
+    return (
+        pkmn.name,
+        pkmn.level,
+        _get_stat_key(pkmn.cur_stats),
+        _get_stat_key(pkmn.base_stats),
+        _get_stat_key(pkmn.dvs),
+        _get_stat_key(pkmn.stat_xp),
+        pkmn.badges,
+        pkmn.held_item,
+        pkmn.ability,
+        pkmn.nature,
+        pkmn.is_trainer_mon,
+    )
+
+
+def _get_damage_range_key(damage_range:DamageRange):
+    return (damage_range.min_damage, tuple(damage_range.get_counts()), damage_range.num_attacks)
+
+
+def calculate_damage(
+    gen:CurrentGen,
+    attacking_pkmn:EnemyPkmn,
+    move:Move,
+    defending_pkmn:EnemyPkmn,
+    attacking_stage_modifiers:StageModifiers=None,
+    defending_stage_modifiers:StageModifiers=None,
+    attacking_field:FieldStatus=None,
+    defending_field:FieldStatus=None,
+    is_crit:bool=False,
+    custom_move_data:str="",
+    weather:str=const.WEATHER_NONE,
+    is_double_battle:bool=False,
+    attacking_battle_stats:StatBlock=None,
+    defending_battle_stats:StatBlock=None,
+) -> DamageRange:
+    # cached version of CurrentGen.calculate_damage. Takes the same arguments, along with the gen to run the calculation in
+    key = (
+        gen.version_name(),
+        _get_pkmn_key(attacking_pkmn),
+        move.name,
+        _get_pkmn_key(defending_pkmn),
+        attacking_stage_modifiers,
+        defending_stage_modifiers,
+        attacking_field,
+        defending_field,
+        is_crit,
+        custom_move_data,
+        weather,
+        is_double_battle,
+        _get_stat_key(attacking_battle_stats),
+        _get_stat_key(defending_battle_stats),
+    )
+
+    result = _damage_cache.get(key)
+    if result is not None:
+        if result is _NO_DAMAGE:
+            return None
+        return result
+
+    result = gen.calculate_damage(
+        attacking_pkmn,
+        move,
+        defending_pkmn,
+        attacking_stage_modifiers=attacking_stage_modifiers,
+        defending_stage_modifiers=defending_stage_modifiers,
+        attacking_field=attacking_field,
+        defending_field=defending_field,
+        is_crit=is_crit,
+        custom_move_data=custom_move_data,
+        weather=weather,
+        is_double_battle=is_double_battle,
+        attacking_battle_stats=attacking_battle_stats,
+        defending_battle_stats=defending_battle_stats,
+    )
+    _damage_cache.put(key, _NO_DAMAGE if result is None else result)
+    return result
+
+
+def find_kill(
+    damage_range:DamageRange,
+    crit_damage_range:DamageRange,
+    crit_chance:float,
+    accuracy:float,
+    target_hp:int,
+    attack_depth:int=10,
+    percent_cutoff:float=0.1,
+    force_full_search=False
+) -> List[Tuple[int, float]]:
+    # cached version of damage_calc.find_kill
+    key = (
+        _get_damage_range_key(damage_range),
+        _get_damage_range_key(crit_damage_range),
+        crit_chance,
+        accuracy,
+        target_hp,
+        attack_depth,
+        percent_cutoff,
+        force_full_search,
+    )
+
+    result = _kill_cache.get(key)
+    if result is None:
+        result = _find_kill(
+            damage_range,
+            crit_damage_range,
+            crit_chance,
+            accuracy,
+            target_hp,
+            attack_depth=attack_depth,
+            percent_cutoff=percent_cutoff,
+            force_full_search=force_full_search
+        )
+        _kill_cache.put(key, result)
+
+    # callers get their own list, so the cached one can't be modified
+    return list(result)
+
+
+def clear_caches():
+    _damage_cache.clear()
+    _kill_cache.clear()
+
+
+def get_cache_summary() -> str:
+    return "\n".join([x.to_string() for x in (_damage_cache, _kill_cache)])
@@ -1,49 +1,83 @@
+from __future__ import annotations
+
+import itertools
 import math
 import logging
-from typing import Dict, Tuple
+from collections import Counter
+from typing import Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
 
 
 class DamageRange:
+    # NOTE: stored densely, as a count of rolls for each damage value from min_damage up to max_damage (inclusive)
+    # damage rolls are always clustered together, so this is both smaller and faster to work with than a dict
     def __init__(self, damage_vals:dict, num_attacks=1):
-        self.damage_vals = {}
-        self.min_damage = None
-        self.max_damage = None
-        self.size = 0
-
-        for cur_damage in damage_vals:
-            if cur_damage not in self.damage_vals:
-                self.damage_vals[cur_damage] = 0
-            
-            self.damage_vals[cur_damage] += damage_vals[cur_damage]
-            self.size += damage_vals[cur_damage]
+        if not damage_vals:
+            raise Exception
 
-            if self.min_damage is None or cur_damage < self.min_damage:
-                self.min_damage = cur_damage
-            if self.max_damage is None or cur_damage > self.max_damage:
-                self.max_damage = cur_damage
+        min_damage = min(damage_vals)
+        counts = [0] * (max(damage_vals) - min_damage + 1)
+        for cur_damage, cur_count in damage_vals.items():
+            counts[cur_damage - min_damage] += cur_count
 
-        if self.max_damage is None or self.min_damage is None:
+        self._set_counts(min_damage, counts, num_attacks)
+
+    @classmethod
+    def from_counts(cls, min_damage:int, counts:List[int], num_attacks=1) -> DamageRange:
+        # counts[x] is the number of rolls that deal (min_damage + x) damage
+        result = cls.__new__(cls)
+        result._set_counts(min_damage, counts, num_attacks)
+        return result
+
+    def _set_counts(self, min_damage:int, counts:List[int], num_attacks:int):
+        # trim off any damage values with no rolls, so that min_damage and max_damage are actually possible
+        start = 0
+        while start < len(counts) and counts[start] == 0:
+            start += 1
+        end = len(counts)
+        while end > start and counts[end - 1] == 0:
+            end -= 1
+        if start == end:
             raise Exception
+        if start != 0 or end != len(counts):
+            counts = counts[start:end]
 
+        self._counts = counts
+        self.min_damage = min_damage + start
+        self.max_damage = self.min_damage + len(counts) - 1
+        self.size = sum(counts)
         self.num_attacks = num_attacks
 
+    @property
+    def damage_vals(self) -> Dict[int, int]:
+        return {self.min_damage + idx: cur_count for idx, cur_count in enumerate(self._counts) if cur_count}
+
+    def get_counts(self) -> List[int]:
+        # index x is the number of rolls that deal (min_damage + x) damage. Should not be modified
+        return self._counts
+
     def add(self, other):
         if not isinstance(other, DamageRange):
             raise ValueError("Can only add DamageRange to other DamageRanges")
 
-        result_damage_vals = {}
-
-        for my_cur_damage, my_count in self.damage_vals.items():
-            for your_cur_damage, your_count in other.damage_vals.items():
-                cur_total_damage = my_cur_damage + your_cur_damage
-                if cur_total_damage not in result_damage_vals:
-                    result_damage_vals[cur_total_damage] = 0
-
-                result_damage_vals[cur_total_damage] += my_count + your_count
-
-        return DamageRange(result_damage_vals, num_attacks=(self.num_attacks + other.num_attacks))
+        # each roll of one attack can be paired with each roll of the other, so the combined counts are a convolution
+        other_counts = other._counts
+        other_len = len(other_counts)
+        result_counts = [0] * (len(self._counts) + other_len - 1)
+        for my_idx, my_count in enumerate(self._counts):
+            if my_count == 0:
+                continue
+            result_counts[my_idx:my_idx + other_len] = [
+                existing + (my_count * your_count)
+                for existing, your_count in zip(result_counts[my_idx:my_idx + other_len], other_counts)
+            ]
+
+        return DamageRange.from_counts(
+            self.min_damage + other.min_damage,
+            result_counts,
+            num_attacks=(self.num_attacks + other.num_attacks)
+        )
 
     def split_kills(self, hp_threshold):
         if hp_threshold > self.max_damage:
@@ -51,16 +85,11 @@ class DamageRange:
         elif hp_threshold <= self.min_damage:
             return self, None
 
-        kill_damage_vals = {}
-        non_kill_damage_vals = {}
-
-        for cur_damage, cur_count in self.damage_vals.items():
-            if cur_damage >= hp_threshold:
-                kill_damage_vals[cur_damage] = cur_count
-            else:
-                non_kill_damage_vals[cur_damage] = cur_count
-
-        return DamageRange(kill_damage_vals, num_attacks=self.num_attacks), DamageRange(non_kill_damage_vals, num_attacks=self.num_attacks)
+        split_idx = hp_threshold - self.min_damage
+        return (
+            DamageRange.from_counts(hp_threshold, self._counts[split_idx:], num_attacks=self.num_attacks),
+            DamageRange.from_counts(self.min_damage, self._counts[:split_idx], num_attacks=self.num_attacks)
+        )
 
     def __len__(self):
         return self.size
@@ -68,12 +97,12 @@ class DamageRange:
     def to_string(self, max_num=5, percent_of=None):
         result = []
 
-        for cur_dam in sorted(self.damage_vals.keys()):
+        for cur_dam, cur_count in self.damage_vals.items():
             if percent_of is not None:
                 cur_percent = (cur_dam / percent_of) * 100
-                result.append(f"{cur_percent:.1f} x{self.damage_vals[cur_dam]}")
+                result.append(f"{cur_percent:.1f} x{cur_count}")
             else:
-                result.append(f"{cur_dam} x{self.damage_vals[cur_dam]}")
+                result.append(f"{cur_dam} x{cur_count}")
 
         if max_num is not None and max_num > 1 and len(result) > max_num:
             parts = max_num // 2
@@ -88,106 +117,133 @@ class DamageRange:
         return self.add(other)
 
 
-def percent_rolls_kill(
-    num_non_crits:int,
-    damage_range:DamageRange,
-    num_crits:int,
-    crit_damage_range:DamageRange,
-    target_hp:int,
-    memoization:Dict[Tuple[int, int, int], int]
-):
-    num_kill_rolls = _percent_rolls_kill_recursive(
-        num_non_crits,
-        damage_range,
-        num_crits,
-        crit_damage_range,
-        target_hp,
-        1,
-        0,
-        memoization
-    )
-
-    return 100.0 * (num_kill_rolls) / math.pow(len(damage_range), num_non_crits + num_crits)
-
-def _percent_rolls_kill_recursive(
-    num_non_crits:int,
-    damage_range:DamageRange,
-    num_crits:int,
-    crit_damage_range:DamageRange,
-    target_hp:int,
-    num_roll_multiplier:int,
-    total_damage:int,
-    memoization:Dict[Tuple[int, int, int], int]
-):
-
-    cur_key = (num_non_crits, num_crits, num_roll_multiplier, total_damage)
-    if cur_key in memoization:
-        return memoization[cur_key]
-
-    min_damage_left = num_non_crits * damage_range.min_damage
-    min_damage_left += num_crits * crit_damage_range.min_damage
-
-    max_damage_left = num_non_crits * damage_range.max_damage
-    max_damage_left += num_crits * crit_damage_range.max_damage
-
-    if total_damage + min_damage_left >= target_hp:
-        # if kill is guaranteed, add all rolls for this and future attacks
-        # NOTE: use the number of rolls in the provided damage_range, so that special moves like psywave still work properly
-        result = num_roll_multiplier * math.pow(len(damage_range), num_non_crits + num_crits)
-        memoization[cur_key] = result
+def roll_damage_range(base_damage:int, min_roll:int, max_roll:int, multiplier:int=1) -> DamageRange:
+    # calculates every damage roll at once: each numerator from min_roll to max_roll is equally likely,
+    # and each roll is scaled by numerator/max_roll (always doing at least 1 damage)
+    # NOTE: base_damage is always a whole number by this point, but may be stored as a float after some move modifiers.
+    # Using int math for the rolls is equivalent to flooring the true division, and avoids float rounding per roll
+    base_damage = int(base_damage)
+    all_rolls = [max((base_damage * numerator) // max_roll, 1) * multiplier for numerator in range(min_roll, max_roll + 1)]
+    # the rolls only ever increase with the numerator, so the counts can be filled in directly
+    counts = [0] * (all_rolls[-1] - all_rolls[0] + 1)
+    for cur_damage, cur_count in Counter(all_rolls).items():
+        counts[cur_damage - all_rolls[0]] = cur_count
+    return DamageRange.from_counts(all_rolls[0], counts)
+
+
+class KillRollTable:
+    """
+    Counts how many combinations of damage rolls kill a target, for any mix of crits and non-crits.
+    The damage of each additional hit is convolved into the running totals, which are capped at the target's HP
+    (overkill doesn't matter), so the work per hit only scales with the target's HP, not the number of attacks
+    """
+    def __init__(self, damage_range:DamageRange, crit_damage_range:DamageRange, target_hp:int):
+        self._target_hp = max(target_hp, 0)
+        self._num_rolls = len(damage_range)
+        self._num_crit_rolls = len(crit_damage_range)
+        self._min_damage = damage_range.min_damage
+        self._max_damage = damage_range.max_damage
+        self._min_crit_damage = crit_damage_range.min_damage
+        self._max_crit_damage = crit_damage_range.max_damage
+        self._damage_runs = self._get_damage_runs(damage_range)
+        self._crit_damage_runs = self._get_damage_runs(crit_damage_range)
+
+        # index is the number of hits. Each value is a list where list[x] is the number of roll combinations dealing x total damage
+        # the last entry (x == target_hp) holds all the combinations that kill
+        initial_totals = [0] * (self._target_hp + 1)
+        initial_totals[0] = 1
+        self._non_crit_totals:List[List[int]] = [initial_totals]
+        self._crit_totals:List[List[int]] = [initial_totals]
+        # index is the number of non-crit hits. Each value is a list where list[x] is the number of roll combinations dealing at least x damage
+        self._non_crit_at_least:List[List[int]] = []
+
+    def _get_damage_runs(self, damage_range:DamageRange) -> List[Tuple[int, int, int]]:
+        # group consecutive damage values that share the same number of rolls into (first damage, last damage, count)
+        # e.g. psywave is just a single run, no matter how many rolls it has
+        # damage that kills in one hit is left out, it always ends up in the killing total anyway
+        result = []
+        for cur_idx, cur_count in enumerate(damage_range.get_counts()):
+            cur_damage = damage_range.min_damage + cur_idx
+            if cur_damage >= self._target_hp:
+                break
+            if cur_count == 0:
+                continue
+            if result and result[-1][1] == cur_damage - 1 and result[-1][2] == cur_count:
+                result[-1] = (result[-1][0], cur_damage, cur_count)
+            else:
+                result.append((cur_damage, cur_damage, cur_count))
+        return result
+
+    def _add_hit(self, totals:List[int], damage_runs:List[Tuple[int, int, int]], num_rolls:int) -> List[int]:
+        target_hp = self._target_hp
+        # prefix[x] is the number of combinations dealing less than x total damage (without killing)
+        prefix = [0]
+        prefix.extend(itertools.accumulate(totals[:target_hp]))
+
+        result = [0] * (target_hp + 1)
+        for first_damage, last_damage, cur_count in damage_runs:
+            # new totals from first_damage up to target_hp - 1 can be reached from the previous totals in [total - last_damage, total - first_damage]
+            upper = prefix[1:target_hp - first_damage + 1]
+            lower = [0] * (last_damage - first_damage + 1)
+            lower.extend(prefix[1:target_hp - last_damage])
+            result[first_damage:target_hp] = [
+                existing + (cur_count * (cur_upper - cur_lower))
+                for existing, cur_upper, cur_lower in zip(result[first_damage:target_hp], upper, lower)
+            ]
+
+        # anything that didn't end up below target_hp is a kill
+        result[target_hp] = (sum(totals) * num_rolls) - sum(result)
         return result
-    elif num_crits == 0 and num_non_crits == 0:
-        # ran out of attacks without a kill being found, no kill rolls found
-        memoization[cur_key] = 0
-        return 0
-    elif total_damage + max_damage_left < target_hp:
-        # kill is impossible even with future rolls, just quit and don't bother calculating
-        memoization[cur_key] = 0
-        return 0
-
-    # recursive case - a kill is still possible, but not found yet
-    result = 0
-    if num_crits > 0:
-        next_damage_range = crit_damage_range
-        num_crits -= 1
-    else:
-        next_damage_range = damage_range
-        num_non_crits -= 1
-    
-    # find all possible kills from this point forward
-    for next_damage in next_damage_range.damage_vals:
-        result += _percent_rolls_kill_recursive(
-            num_non_crits,
-            damage_range,
-            num_crits,
-            crit_damage_range,
-            target_hp,
-            next_damage_range.damage_vals[next_damage],
-            total_damage + next_damage,
-            memoization
-        )
-    
-    result *= num_roll_multiplier
-    memoization[cur_key] = result
-    return result
+
+    def _get_non_crit_at_least(self, num_non_crits:int) -> List[int]:
+        while len(self._non_crit_totals) <= num_non_crits:
+            self._non_crit_totals.append(self._add_hit(self._non_crit_totals[-1], self._damage_runs, self._num_rolls))
+
+        while len(self._non_crit_at_least) <= num_non_crits:
+            totals = self._non_crit_totals[len(self._non_crit_at_least)]
+            at_least = list(itertools.accumulate(reversed(totals)))
+            at_least.reverse()
+            self._non_crit_at_least.append(at_least)
+
+        return self._non_crit_at_least[num_non_crits]
+
+    def _get_crit_totals(self, num_crits:int) -> List[int]:
+        while len(self._crit_totals) <= num_crits:
+            self._crit_totals.append(self._add_hit(self._crit_totals[-1], self._crit_damage_runs, self._num_crit_rolls))
+        return self._crit_totals[num_crits]
+
+    def percent_rolls_kill(self, num_non_crits:int, num_crits:int) -> float:
+        # skip the convolutions entirely when every roll (or no roll) kills
+        min_total = (num_non_crits * self._min_damage) + (num_crits * self._min_crit_damage)
+        if min_total >= self._target_hp:
+            return 100.0
+        max_total = (num_non_crits * self._max_damage) + (num_crits * self._max_crit_damage)
+        if max_total < self._target_hp:
+            return 0.0
+
+        non_crit_at_least = self._get_non_crit_at_least(num_non_crits)
+        num_kill_rolls = 0
+        for cur_total, cur_count in enumerate(self._get_crit_totals(num_crits)):
+            if cur_count:
+                num_kill_rolls += cur_count * non_crit_at_least[self._target_hp - cur_total]
+
+        return 100.0 * num_kill_rolls / (self._num_rolls ** num_non_crits * self._num_crit_rolls ** num_crits)
 
 
 def find_kill(damage_range:DamageRange, crit_damage_range:DamageRange, crit_chance:float, accuracy:float, target_hp:int, attack_depth:int=10, percent_cutoff:float=0.1, force_full_search=False):
-    # NOTE: if attack_depth is too deep, (10+ is where I started to notice the issues), you quickly get overflow issues
+    # NOTE: roll combinations are counted with exact ints, so deep searches (20+ attacks) don't run into overflow issues
     result = []
 
     min_possible_damage = min(damage_range.min_damage, crit_damage_range.min_damage)
     max_possible_damage = max(damage_range.max_damage, crit_damage_range.max_damage)
     highest_found_kill_pct = 0
-    memoization = {}
+    kill_roll_table = KillRollTable(damage_range, crit_damage_range, target_hp)
     hits_to_kill_table = {}
 
-    # this is a quick and dirty way to ignore calculating psywave, which has vastly more possible rolls, and thus takes much longer to calculate
-    # also, don't endlessly search for a move that can't find a guaranteed kill even if it hits every time
-    if (
-        (len(damage_range) <= 200 and (min_possible_damage * attack_depth) > target_hp) or
-        force_full_search
-    ):
+    # by default, only moves whose lowest roll kills within the search depth (if it hits every time) are searched
+    # anything else just reports the guaranteed kill below, unless a full search is forced
+    # the number of rolls doesn't matter, moves with as many rolls as psywave are just as cheap to search
+    if (min_possible_damage * attack_depth) > target_hp or force_full_search:
         for cur_num_attacks in range(1, attack_depth + 1):
             if (max_possible_damage * cur_num_attacks) < target_hp:
                 continue
@@ -197,14 +253,7 @@ def find_kill(damage_range:DamageRange, crit_damage_range:DamageRange, crit_chan
             all_hits_kill_pct = 0
             for cur_num_crits in range(cur_num_attacks + 1):
                 # get the kill percent for this exact combination of crits + non-crits
-                kill_percent = percent_rolls_kill(
-                    cur_num_attacks - cur_num_crits,
-                    damage_range,
-                    cur_num_crits,
-                    crit_damage_range,
-                    target_hp,
-                    memoization
-                )
+                kill_percent = kill_roll_table.percent_rolls_kill(cur_num_attacks - cur_num_crits, cur_num_crits)
 
                 # and multiply that kill percent by the probability of actually getting
                 # this combination of crits + non-crits
@@ -14,6 +14,7 @@ class GenOneConstants:
         self.YELLOW_POKEMON_DB_PATH = os.path.join(self.YELLOW_ASSETS_PATH, const.POKEMON_DB_FILE_NAME)
         self.YELLOW_TRAINER_DB_PATH = os.path.join(self.YELLOW_ASSETS_PATH, const.TRAINERS_DB_FILE_NAME)
         self.YELLOW_MIN_BATTLES_DIR = os.path.join(self.YELLOW_ASSETS_PATH, "min_battles")
+        self.YELLOW_ENCOUNTER_TABLES_PATH = os.path.join(self.YELLOW_ASSETS_PATH, "yellow_encounter_tables.json")
 
         self.RB_ASSETS_PATH = os.path.join(self.GEN_ONE_DATA_PATH, "red_blue")
         self.RB_POKEMON_DB_PATH = os.path.join(self.RB_ASSETS_PATH, const.POKEMON_DB_FILE_NAME)
@@ -11,7 +11,7 @@ from pkmn.gen_1 import pkmn_damage_calc, pkmn_utils
 from pkmn.damage_calc import DamageRange
 from pkmn.gen_1.data_objects import GenOneBadgeList, GenOneStatBlock
 from pkmn.gen_1.gen_one_constants import gen_one_const
-from pkmn.pkmn_db import ItemDB, MinBattlesDB, PkmnDB, TrainerDB, MoveDB
+from pkmn.pkmn_db import EncounterDB, ItemDB, MinBattlesDB, PkmnDB, TrainerDB, MoveDB, load_shared_db
 from pkmn.pkmn_info import CurrentGen
 from route_recording.game_recorders.gen_one.yellow_recorder import YellowRecorder, RedBlueRecorder
 from route_recording.recorder import RecorderController, RecorderGameHookClient
@@ -23,42 +23,56 @@ logger = logging.getLogger(__name__)
 
 
 class GenOne(CurrentGen):
-    def __init__(self, pkmn_db_path, trainer_db_path, item_path, move_path, type_info_path, fight_info_path, min_battles_path, version_name, base_version_name=None):
+    def __init__(self, pkmn_db_path, trainer_db_path, item_path, move_path, type_info_path, fight_info_path, min_battles_path, version_name, base_version_name=None, encounter_tables_path=None):
         self._version_name = version_name
         self._base_version_name = base_version_name
+        self._encounter_tables_path = encounter_tables_path
 
         self._all_flat_files = [
             pkmn_db_path, trainer_db_path, item_path, move_path, type_info_path, fight_info_path
         ]
+        if encounter_tables_path is not None:
+            self._all_flat_files.append(encounter_tables_path)
 
         try:
-            self._pkmn_db = PkmnDB(_load_pkmn_db(pkmn_db_path))
+            self._pkmn_db = load_shared_db(PkmnDB, _load_pkmn_db, pkmn_db_path)
         except Exception as e:
             logger.error(f"Error loading pokemon DB: {pkmn_db_path}")
             logger.exception(e)
             raise ValueError(f"Failed to load pokemon DB: {e}")
 
         try:
-            self._trainer_db = TrainerDB(_load_trainer_db(trainer_db_path, self._pkmn_db))
+            self._trainer_db = load_shared_db(TrainerDB, _load_trainer_db, trainer_db_path, self._pkmn_db)
         except Exception as e:
             logger.error(f"Error loading trainer DB: {pkmn_db_path}")
             logger.exception(e)
             raise ValueError(f"Failed to load trainer DB: {e}")
 
         try:
-            self._item_db = ItemDB(_load_item_db(item_path))
+            self._item_db = load_shared_db(ItemDB, _load_item_db, item_path)
         except Exception as e:
             logger.error(f"Error loading trainer DB: {pkmn_db_path}")
             logger.exception(e)
             raise ValueError(f"Failed to load trainer DB: {e}")
 
         try:
-            self._move_db = MoveDB(_load_move_db(move_path))
+            self._move_db = load_shared_db(MoveDB, _load_move_db, move_path)
         except Exception as e:
             logger.error(f"Error loading move DB: {pkmn_db_path}")
             logger.exception(e)
             raise ValueError(f"Failed to load move DB: {e}")
 
+        try:
+            # NOTE: only some versions have encounter data, the rest just get an empty DB
+            if encounter_tables_path is None:
+                self._encounter_db = EncounterDB({})
+            else:
+                self._encounter_db = load_shared_db(EncounterDB, _load_encounter_db, encounter_tables_path)
+        except Exception as e:
+            logger.error(f"Error loading encounter DB: {encounter_tables_path}")
+            logger.exception(e)
+            raise ValueError(f"Failed to load encounter DB: {e}")
+
         try:
             self._min_battles_db = MinBattlesDB(min_battles_path)
         except Exception as e:
@@ -105,6 +119,7 @@ class GenOne(CurrentGen):
         self._pkmn_db.validate_types(supported_types)
         self._pkmn_db.validate_moves(self._move_db)
         self._trainer_db.validate_trainers(self._pkmn_db, self._move_db)
+        self._encounter_db.validate_encounters(self._pkmn_db)
 
     def version_name(self) -> str:
         return self._version_name
@@ -129,6 +144,12 @@ class GenOne(CurrentGen):
     
     def min_battles_db(self) -> MinBattlesDB:
         return self._min_battles_db
+
+    def encounter_db(self) -> EncounterDB:
+        return self._encounter_db
+
+    def get_source_files(self) -> List[str]:
+        return list(self._all_flat_files)
     
     def get_recorder_client(self, recorder_controller:RecorderController) -> RecorderGameHookClient:
         version_name = self._base_version_name
@@ -263,6 +284,13 @@ class GenOne(CurrentGen):
             )
     
     def load_custom_gen(self, custom_version_name, root_path) -> CurrentGen:
+        # custom gens created before encounter tables were supported won't have a copy of them
+        encounter_tables_path = None
+        if self._encounter_tables_path is not None:
+            encounter_tables_path = os.path.join(root_path, os.path.basename(self._encounter_tables_path))
+            if not os.path.exists(encounter_tables_path):
+                encounter_tables_path = None
+
         return GenOne(
             os.path.join(root_path, const.POKEMON_DB_FILE_NAME),
             os.path.join(root_path, const.TRAINERS_DB_FILE_NAME),
@@ -272,7 +300,8 @@ class GenOne(CurrentGen):
             os.path.join(root_path, const.FIGHTS_INFO_FILE_NAME),
             "",
             custom_version_name,
-            base_version_name=self._version_name
+            base_version_name=self._version_name,
+            encounter_tables_path=encounter_tables_path
         )
     
     def get_trainer_timing_info(self) -> universal_data_objects.TrainerTimingStats:
@@ -454,36 +483,72 @@ def _load_move_db(path):
     return result
 
 
-gen_one_yellow = GenOne(
-    gen_one_const.YELLOW_POKEMON_DB_PATH,
-    gen_one_const.YELLOW_TRAINER_DB_PATH,
-    gen_one_const.ITEM_DB_PATH,
-    gen_one_const.MOVE_DB_PATH,
-    gen_one_const.TYPE_INFO_PATH,
-    gen_one_const.FIGHTS_INFO_PATH,
-    gen_one_const.YELLOW_MIN_BATTLES_DIR,
-    const.YELLOW_VERSION
-)
-
-
-gen_one_blue = GenOne(
-    gen_one_const.RB_POKEMON_DB_PATH,
-    gen_one_const.RB_TRAINER_DB_PATH,
-    gen_one_const.ITEM_DB_PATH,
-    gen_one_const.MOVE_DB_PATH,
-    gen_one_const.TYPE_INFO_PATH,
-    gen_one_const.FIGHTS_INFO_PATH,
-    gen_one_const.RB_MIN_BATTLES_DIR,
-    const.BLUE_VERSION
-)
-
-gen_one_red = GenOne(
-    gen_one_const.RB_POKEMON_DB_PATH,
-    gen_one_const.RB_TRAINER_DB_PATH,
-    gen_one_const.ITEM_DB_PATH,
-    gen_one_const.MOVE_DB_PATH,
-    gen_one_const.TYPE_INFO_PATH,
-    gen_one_const.FIGHTS_INFO_PATH,
-    gen_one_const.RB_MIN_BATTLES_DIR,
-    const.RED_VERSION
-)
\ No newline at end of file
+def _load_encounter_db(path):
+    result = {}
+    with open(path, 'r') as f:
+        raw_db = json.load(f)
+
+    for raw_map in raw_db[const.ENCOUNTER_TABLES_KEY]:
+        map_name = raw_map[const.ENCOUNTER_MAP_NAME_KEY]
+        map_tables = {}
+        for cur_method in const.ENCOUNTER_METHODS:
+            raw_table = raw_map.get(cur_method)
+            if not raw_table:
+                continue
+
+            map_tables[cur_method] = universal_data_objects.EncounterTable(
+                map_name,
+                cur_method,
+                raw_table[const.ENCOUNTER_BASE_RATE_KEY],
+                [
+                    universal_data_objects.EncounterSlot(
+                        x[const.ENCOUNTER_PKMN_KEY],
+                        x[const.ENCOUNTER_LEVEL_KEY],
+                        x[const.ENCOUNTER_RATE_KEY],
+                    )
+                    for x in raw_table[const.ENCOUNTERS_KEY]
+                ]
+            )
+
+        result[map_name] = map_tables
+
+    return result
+
+
+def create_gen_one_yellow() -> GenOne:
+    return GenOne(
+        gen_one_const.YELLOW_POKEMON_DB_PATH,
+        gen_one_const.YELLOW_TRAINER_DB_PATH,
+        gen_one_const.ITEM_DB_PATH,
+        gen_one_const.MOVE_DB_PATH,
+        gen_one_const.TYPE_INFO_PATH,
+        gen_one_const.FIGHTS_INFO_PATH,
+        gen_one_const.YELLOW_MIN_BATTLES_DIR,
+        const.YELLOW_VERSION,
+        encounter_tables_path=gen_one_const.YELLOW_ENCOUNTER_TABLES_PATH
+    )
+
+
+def create_gen_one_blue() -> GenOne:
+    return GenOne(
+        gen_one_const.RB_POKEMON_DB_PATH,
+        gen_one_const.RB_TRAINER_DB_PATH,
+        gen_one_const.ITEM_DB_PATH,
+        gen_one_const.MOVE_DB_PATH,
+        gen_one_const.TYPE_INFO_PATH,
+        gen_one_const.FIGHTS_INFO_PATH,
+        gen_one_const.RB_MIN_BATTLES_DIR,
+        const.BLUE_VERSION
+    )
+
+def create_gen_one_red() -> GenOne:
+    return GenOne(
+        gen_one_const.RB_POKEMON_DB_PATH,
+        gen_one_const.RB_TRAINER_DB_PATH,
+        gen_one_const.ITEM_DB_PATH,
+        gen_one_const.MOVE_DB_PATH,
+        gen_one_const.TYPE_INFO_PATH,
+        gen_one_const.FIGHTS_INFO_PATH,
+        gen_one_const.RB_MIN_BATTLES_DIR,
+        const.RED_VERSION
+    )
\ No newline at end of file
@@ -50,12 +50,12 @@ def calculate_gen_one_damage(
         return damage_calc.DamageRange({x:1 for x in range(1, psywave_upper_limit)})
 
     if attacking_stage_modifiers is None:
-        attacking_stage_modifiers = universal_data_objects.StageModifiers()
+        attacking_stage_modifiers = universal_data_objects.NEUTRAL_STAGE_MODIFIERS
     if attacking_battle_stats is None:
         attacking_battle_stats = attacking_pkmn.get_battle_stats(attacking_stage_modifiers, is_crit=is_crit)
 
     if defending_stage_modifiers is None:
-        defending_stage_modifiers = universal_data_objects.StageModifiers()
+        defending_stage_modifiers = universal_data_objects.NEUTRAL_STAGE_MODIFIERS
     if defending_battle_stats is None:
         defending_battle_stats = defending_pkmn.get_battle_stats(defending_stage_modifiers, is_crit=is_crit)
 
@@ -146,13 +146,4 @@ def calculate_gen_one_damage(
         elif const.MULTI_HIT_5 in custom_move_data:
             multi_hit_multiplier = 5
 
-    damage_vals = {}
-    for numerator in range(MIN_RANGE, MAX_RANGE + 1):
-        cur_damage = max(math.floor((temp * numerator) / MAX_RANGE), 1) * multi_hit_multiplier
-
-        if cur_damage not in damage_vals:
-            damage_vals[cur_damage] = 0
-        
-        damage_vals[cur_damage] += 1
-    
-    return damage_calc.DamageRange(damage_vals)
+    return damage_calc.roll_damage_range(temp, MIN_RANGE, MAX_RANGE, multiplier=multi_hit_multiplier)
@@ -37,6 +37,11 @@ def _clamp_stat(val):
 
 
 class GenTwoBadgeList(universal_data_objects.BadgeList):
+    __slots__ = (
+        "_badge_rewards", "zephyr", "hive", "plain", "fog", "storm", "mineral", "glacier", "rising", "boulder",
+        "cascade", "thunder", "rainbow", "soul", "marsh", "volcano", "earth",
+    )
+
     def __init__(
         self, badge_rewards,
         zephyr=False, hive=False, plain=False, fog=False, storm=False, mineral=False, glacier=False, rising=False,
@@ -64,6 +69,9 @@ class GenTwoBadgeList(universal_data_objects.BadgeList):
     
     def award_badge(self, trainer_name) -> GenTwoBadgeList:
         reward = self._badge_rewards.get(trainer_name)
+        if reward is None:
+            return self
+
         result = self.copy()
         if reward == gen_two_const.ZEPHYR_BADGE:
             result.zephyr = True
@@ -209,6 +217,12 @@ class GenTwoBadgeList(universal_data_objects.BadgeList):
             self.earth == other.earth
         )
 
+    def __hash__(self):
+        return hash((
+            self.zephyr, self.hive, self.plain, self.fog, self.storm, self.mineral, self.glacier, self.rising, self.boulder,
+            self.cascade, self.thunder, self.rainbow, self.soul, self.marsh, self.volcano, self.earth,
+        ))
+
     def num_badges(self):
         result = 0
         for cur_badge in [
@@ -222,6 +236,8 @@ class GenTwoBadgeList(universal_data_objects.BadgeList):
 
 
 class GenTwoStatBlock(universal_data_objects.StatBlock):
+    __slots__ = ()
+
     def __init__(self, hp, attack, defense, special_attack, special_defense, speed, is_stat_xp=False):
         super().__init__(hp, attack, defense, special_attack, special_defense, speed, is_stat_xp=is_stat_xp)
 
@@ -245,6 +261,7 @@ class GenTwoStatBlock(universal_data_objects.StatBlock):
             return True
         return False
     
+    @universal_data_objects.cached_stat_calc
     def calc_level_stats(
         self,
         level:int,
@@ -270,6 +287,7 @@ class GenTwoStatBlock(universal_data_objects.StatBlock):
             calc_stat(self.speed, level, stat_dv.speed, stat_xp.speed, is_badge_boosted=badges.plain),
         )
     
+    @universal_data_objects.cached_stat_calc
     def calc_battle_stats(
         self,
         level:int,
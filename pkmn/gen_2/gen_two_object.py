@@ -12,7 +12,7 @@ from pkmn.gen_2 import pkmn_damage_calc
 from pkmn.damage_calc import DamageRange
 from pkmn.gen_2.data_objects import GenTwoBadgeList, GenTwoStatBlock, instantiate_trainer_pokemon, instantiate_wild_pokemon, get_hidden_power_base_power, get_hidden_power_type, VIT_AMT, VIT_CAP, STAT_XP_CAP
 from pkmn.gen_2.gen_two_constants import gen_two_const
-from pkmn.pkmn_db import ItemDB, MinBattlesDB, PkmnDB, TrainerDB, MoveDB
+from pkmn.pkmn_db import EncounterDB, ItemDB, MinBattlesDB, PkmnDB, TrainerDB, MoveDB, load_shared_db
 from pkmn.pkmn_info import CurrentGen
 from route_recording.game_recorders.gen_two.crystal_recorder import CrystalRecorder
 from route_recording.recorder import RecorderController, RecorderGameHookClient
@@ -33,21 +33,21 @@ class GenTwo(CurrentGen):
         ]
 
         try:
-            self._pkmn_db = PkmnDB(_load_pkmn_db(pkmn_db_path))
+            self._pkmn_db = load_shared_db(PkmnDB, _load_pkmn_db, pkmn_db_path)
         except Exception as e:
             logger.error(f"Error loading pokemon DB: {pkmn_db_path}")
             logger.exception(e)
             raise ValueError(f"Failed to load pokemon DB: {e}")
 
         try:
-            self._trainer_db = TrainerDB(
-                _load_trainer_db(
-                    trainer_db_path,
-                    self._pkmn_db,
-                    extract_trainer_id=(
-                        version_name == const.CRYSTAL_VERSION or
-                        base_version_name == const.CRYSTAL_VERSION
-                    )
+            self._trainer_db = load_shared_db(
+                TrainerDB,
+                _load_trainer_db,
+                trainer_db_path,
+                self._pkmn_db,
+                (
+                    version_name == const.CRYSTAL_VERSION or
+                    base_version_name == const.CRYSTAL_VERSION
                 )
             )
         except Exception as e:
@@ -56,19 +56,22 @@ class GenTwo(CurrentGen):
             raise ValueError(f"Failed to load trainer DB: {e}")
 
         try:
-            self._item_db = ItemDB(_load_item_db(item_path))
+            self._item_db = load_shared_db(ItemDB, _load_item_db, item_path)
         except Exception as e:
             logger.error(f"Error loading item DB: {pkmn_db_path}")
             logger.exception(e)
             raise ValueError(f"Failed to load item DB: {e}")
         
         try:
-            self._move_db = MoveDB(_load_move_db(move_path))
+            self._move_db = load_shared_db(MoveDB, _load_move_db, move_path)
         except Exception as e:
             logger.error(f"Error loading move DB: {pkmn_db_path}")
             logger.exception(e)
             raise ValueError(f"Failed to load move DB: {e}")
 
+        # NOTE: no encounter data for this gen yet
+        self._encounter_db = EncounterDB({})
+
         try:
             self._min_battles_db = MinBattlesDB(min_battles_path)
         except Exception as e:
@@ -142,6 +145,12 @@ class GenTwo(CurrentGen):
     def min_battles_db(self) -> MinBattlesDB:
         return self._min_battles_db
 
+    def encounter_db(self) -> EncounterDB:
+        return self._encounter_db
+
+    def get_source_files(self) -> List[str]:
+        return list(self._all_flat_files)
+
     def get_recorder_client(self, recorder_controller:RecorderController) -> RecorderGameHookClient:
         version_name = self._base_version_name
         if version_name is None:
@@ -485,36 +494,39 @@ def _load_move_db(path):
     return result
 
 
-gen_two_crystal = GenTwo(
-    gen_two_const.CRYSTAL_POKEMON_PATH,
-    gen_two_const.CRYSTAL_TRAINER_DB_PATH,
-    gen_two_const.ITEM_DB_PATH,
-    gen_two_const.MOVE_DB_PATH,
-    gen_two_const.TYPE_INFO_PATH,
-    gen_two_const.FIGHTS_INFO_PATH,
-    gen_two_const.CRYSTAL_MIN_BATTLES_DIR,
-    const.CRYSTAL_VERSION
-)
-
-
-gen_two_gold = GenTwo(
-    gen_two_const.GS_POKEMON_PATH,
-    gen_two_const.GS_TRAINER_DB_PATH,
-    gen_two_const.ITEM_DB_PATH,
-    gen_two_const.MOVE_DB_PATH,
-    gen_two_const.TYPE_INFO_PATH,
-    gen_two_const.FIGHTS_INFO_PATH,
-    gen_two_const.GS_MIN_BATTLES_DIR,
-    const.GOLD_VERSION
-)
-
-gen_two_silver = GenTwo(
-    gen_two_const.GS_POKEMON_PATH,
-    gen_two_const.GS_TRAINER_DB_PATH,
-    gen_two_const.ITEM_DB_PATH,
-    gen_two_const.MOVE_DB_PATH,
-    gen_two_const.TYPE_INFO_PATH,
-    gen_two_const.FIGHTS_INFO_PATH,
-    gen_two_const.GS_MIN_BATTLES_DIR,
-    const.SILVER_VERSION
-)
\ No newline at end of file
+def create_gen_two_crystal() -> GenTwo:
+    return GenTwo(
+        gen_two_const.CRYSTAL_POKEMON_PATH,
+        gen_two_const.CRYSTAL_TRAINER_DB_PATH,
+        gen_two_const.ITEM_DB_PATH,
+        gen_two_const.MOVE_DB_PATH,
+        gen_two_const.TYPE_INFO_PATH,
+        gen_two_const.FIGHTS_INFO_PATH,
+        gen_two_const.CRYSTAL_MIN_BATTLES_DIR,
+        const.CRYSTAL_VERSION
+    )
+
+
+def create_gen_two_gold() -> GenTwo:
+    return GenTwo(
+        gen_two_const.GS_POKEMON_PATH,
+        gen_two_const.GS_TRAINER_DB_PATH,
+        gen_two_const.ITEM_DB_PATH,
+        gen_two_const.MOVE_DB_PATH,
+        gen_two_const.TYPE_INFO_PATH,
+        gen_two_const.FIGHTS_INFO_PATH,
+        gen_two_const.GS_MIN_BATTLES_DIR,
+        const.GOLD_VERSION
+    )
+
+def create_gen_two_silver() -> GenTwo:
+    return GenTwo(
+        gen_two_const.GS_POKEMON_PATH,
+        gen_two_const.GS_TRAINER_DB_PATH,
+        gen_two_const.ITEM_DB_PATH,
+        gen_two_const.MOVE_DB_PATH,
+        gen_two_const.TYPE_INFO_PATH,
+        gen_two_const.FIGHTS_INFO_PATH,
+        gen_two_const.GS_MIN_BATTLES_DIR,
+        const.SILVER_VERSION
+    )
\ No newline at end of file
@@ -67,9 +67,9 @@ def calculate_gen_two_damage(
         return damage_calc.DamageRange({x:1 for x in range(1, psywave_upper_limit)})
     
     if attacking_stage_modifiers is None:
-        attacking_stage_modifiers = universal_data_objects.StageModifiers()
+        attacking_stage_modifiers = universal_data_objects.NEUTRAL_STAGE_MODIFIERS
     if defending_stage_modifiers is None:
-        defending_stage_modifiers = universal_data_objects.StageModifiers()
+        defending_stage_modifiers = universal_data_objects.NEUTRAL_STAGE_MODIFIERS
 
     # for gen two, the "is_crit" flag in the upcoming get_battle_stats call is effectively a flag to ignore badge boosts
     # always calculate badge boosts during a non crit
@@ -83,13 +83,13 @@ def calculate_gen_two_damage(
         if move_type in special_types and attacking_stage_modifiers.special_attack_stage <= defending_stage_modifiers.special_defense_stage:
             # stage modifiers do not favor the attacker for a special move: zero out the stage modifiers
             ignore_badge_boosts = True
-            attacking_stage_modifiers = universal_data_objects.StageModifiers()
-            defending_stage_modifiers = universal_data_objects.StageModifiers()
+            attacking_stage_modifiers = universal_data_objects.NEUTRAL_STAGE_MODIFIERS
+            defending_stage_modifiers = universal_data_objects.NEUTRAL_STAGE_MODIFIERS
         elif move_type not in special_types and attacking_stage_modifiers.attack_stage <= defending_stage_modifiers.defense_stage:
             # stage modifiers do not favor the attacker for a physical move: zero out the stage modifiers
             ignore_badge_boosts = True
-            attacking_stage_modifiers = universal_data_objects.StageModifiers()
-            defending_stage_modifiers = universal_data_objects.StageModifiers()
+            attacking_stage_modifiers = universal_data_objects.NEUTRAL_STAGE_MODIFIERS
+            defending_stage_modifiers = universal_data_objects.NEUTRAL_STAGE_MODIFIERS
 
     if attacking_battle_stats is None:
         attacking_battle_stats = attacking_pkmn.get_battle_stats(attacking_stage_modifiers, is_crit=ignore_badge_boosts)
@@ -322,15 +322,7 @@ def calculate_gen_two_damage(
         damage_vals[temp] = 1
         result = damage_calc.DamageRange(damage_vals)
     else:
-        for numerator in range(MIN_RANGE, MAX_RANGE + 1):
-            cur_damage = max(math.floor((temp * numerator) / MAX_RANGE), 1)
-
-            if cur_damage not in damage_vals:
-                damage_vals[cur_damage] = 0
-            
-            damage_vals[cur_damage] += 1
-        
-        result = damage_calc.DamageRange(damage_vals)
+        result = damage_calc.roll_damage_range(temp, MIN_RANGE, MAX_RANGE)
         if multi_hit_multiplier > 1:
             if is_crit:
                 # Currently forcing "crit" calculations to assume only one crit out of all strikes
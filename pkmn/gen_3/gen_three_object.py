@@ -10,7 +10,7 @@ from pkmn.gen_3 import pkmn_damage_calc
 from pkmn.damage_calc import DamageRange
 from pkmn.gen_3.data_objects import GenThreeBadgeList, GenThreeStatBlock, instantiate_trainer_pokemon, instantiate_wild_pokemon, get_hidden_power_base_power, get_hidden_power_type, VIT_AMT, VIT_CAP, BLACKOUT_BASE_VALS
 from pkmn.gen_3.gen_three_constants import gen_three_const
-from pkmn.pkmn_db import ItemDB, MinBattlesDB, PkmnDB, TrainerDB, MoveDB
+from pkmn.pkmn_db import EncounterDB, ItemDB, MinBattlesDB, PkmnDB, TrainerDB, MoveDB, load_shared_db
 from pkmn.pkmn_info import CurrentGen
 from route_recording.game_recorders.gen_three.emerald_recorder import EmeraldRecorder
 from route_recording.recorder import RecorderController, RecorderGameHookClient
@@ -31,33 +31,36 @@ class GenThree(CurrentGen):
         ]
 
         try:
-            self._pkmn_db = PkmnDB(_load_pkmn_db(pkmn_db_path))
+            self._pkmn_db = load_shared_db(PkmnDB, _load_pkmn_db, pkmn_db_path)
         except Exception as e:
             logger.error(f"Error loading pokemon DB: {pkmn_db_path}")
             logger.exception(e)
             raise ValueError(f"Failed to load pokemon DB: {e}")
 
         try:
-            self._trainer_db = TrainerDB(_load_trainer_db(trainer_db_path, self._pkmn_db))
+            self._trainer_db = load_shared_db(TrainerDB, _load_trainer_db, trainer_db_path, self._pkmn_db)
         except Exception as e:
             logger.error(f"Error loading trainer DB: {trainer_db_path}")
             logger.exception(e)
             raise ValueError(f"Failed to load trainer DB: {e}")
 
         try:
-            self._item_db = ItemDB(_load_item_db(item_path))
+            self._item_db = load_shared_db(ItemDB, _load_item_db, item_path)
         except Exception as e:
             logger.error(f"Error loading item DB: {item_path}")
             logger.exception(e)
             raise ValueError(f"Failed to load item DB: {e}")
         
         try:
-            self._move_db = MoveDB(_load_move_db(move_path))
+            self._move_db = load_shared_db(MoveDB, _load_move_db, move_path)
         except Exception as e:
             logger.error(f"Error loading move DB: {move_path}")
             logger.exception(e)
             raise ValueError(f"Failed to load move DB: {e}")
 
+        # NOTE: no encounter data for this gen yet
+        self._encounter_db = EncounterDB({})
+
         try:
             self._min_battles_db = MinBattlesDB(min_battles_path)
         except Exception as e:
@@ -131,6 +134,12 @@ class GenThree(CurrentGen):
     def min_battles_db(self) -> MinBattlesDB:
         return self._min_battles_db
 
+    def encounter_db(self) -> EncounterDB:
+        return self._encounter_db
+
+    def get_source_files(self) -> List[str]:
+        return list(self._all_flat_files)
+
     def get_recorder_client(self, recorder_controller:RecorderController) -> RecorderGameHookClient:
         version_name = self._base_version_name
         if version_name is None:
@@ -482,61 +491,66 @@ def _load_move_db(path):
     return result
 
 
-gen_three_ruby = GenThree(
-    gen_three_const.RUBY_SAPPHIRE_POKEMON_PATH,
-    gen_three_const.RUBY_TRAINER_DB_PATH,
-    gen_three_const.ITEM_DB_PATH,
-    gen_three_const.MOVE_DB_PATH,
-    gen_three_const.TYPE_INFO_PATH,
-    gen_three_const.FIGHTS_INFO_PATH,
-    "",
-    const.RUBY_VERSION
-)
-
-
-gen_three_sapphire = GenThree(
-    gen_three_const.RUBY_SAPPHIRE_POKEMON_PATH,
-    gen_three_const.SAPPHIRE_TRAINER_DB_PATH,
-    gen_three_const.ITEM_DB_PATH,
-    gen_three_const.MOVE_DB_PATH,
-    gen_three_const.TYPE_INFO_PATH,
-    gen_three_const.FIGHTS_INFO_PATH,
-    "",
-    const.SAPPHIRE_VERSION
-)
-
-
-gen_three_emerald = GenThree(
-    gen_three_const.EMERALD_POKEMON_PATH,
-    gen_three_const.EMERALD_TRAINER_DB_PATH,
-    gen_three_const.ITEM_DB_PATH,
-    gen_three_const.MOVE_DB_PATH,
-    gen_three_const.TYPE_INFO_PATH,
-    gen_three_const.FIGHTS_INFO_PATH,
-    "",
-    const.EMERALD_VERSION
-)
-
-
-gen_three_fire_red = GenThree(
-    gen_three_const.FIRE_RED_LEAF_GREEN_POKEMON_PATH,
-    gen_three_const.FIRE_RED_LEAF_GREEN_TRAINER_DB_PATH,
-    gen_three_const.ITEM_DB_PATH,
-    gen_three_const.MOVE_DB_PATH,
-    gen_three_const.TYPE_INFO_PATH,
-    gen_three_const.FIGHTS_INFO_PATH,
-    "",
-    const.FIRE_RED_VERSION
-)
-
-
-gen_three_leaf_green = GenThree(
-    gen_three_const.FIRE_RED_LEAF_GREEN_POKEMON_PATH,
-    gen_three_const.FIRE_RED_LEAF_GREEN_TRAINER_DB_PATH,
-    gen_three_const.ITEM_DB_PATH,
-    gen_three_const.MOVE_DB_PATH,
-    gen_three_const.TYPE_INFO_PATH,
-    gen_three_const.FIGHTS_INFO_PATH,
-    "",
-    const.LEAF_GREEN_VERSION
-)
\ No newline at end of file
+def create_gen_three_ruby() -> GenThree:
+    return GenThree(
+        gen_three_const.RUBY_SAPPHIRE_POKEMON_PATH,
+        gen_three_const.RUBY_TRAINER_DB_PATH,
+        gen_three_const.ITEM_DB_PATH,
+        gen_three_const.MOVE_DB_PATH,
+        gen_three_const.TYPE_INFO_PATH,
+        gen_three_const.FIGHTS_INFO_PATH,
+        "",
+        const.RUBY_VERSION
+    )
+
+
+def create_gen_three_sapphire() -> GenThree:
+    return GenThree(
+        gen_three_const.RUBY_SAPPHIRE_POKEMON_PATH,
+        gen_three_const.SAPPHIRE_TRAINER_DB_PATH,
+        gen_three_const.ITEM_DB_PATH,
+        gen_three_const.MOVE_DB_PATH,
+        gen_three_const.TYPE_INFO_PATH,
+        gen_three_const.FIGHTS_INFO_PATH,
+        "",
+        const.SAPPHIRE_VERSION
+    )
+
+
+def create_gen_three_emerald() -> GenThree:
+    return GenThree(
+        gen_three_const.EMERALD_POKEMON_PATH,
+        gen_three_const.EMERALD_TRAINER_DB_PATH,
+        gen_three_const.ITEM_DB_PATH,
+        gen_three_const.MOVE_DB_PATH,
+        gen_three_const.TYPE_INFO_PATH,
+        gen_three_const.FIGHTS_INFO_PATH,
+        "",
+        const.EMERALD_VERSION
+    )
+
+
+def create_gen_three_fire_red() -> GenThree:
+    return GenThree(
+        gen_three_const.FIRE_RED_LEAF_GREEN_POKEMON_PATH,
+        gen_three_const.FIRE_RED_LEAF_GREEN_TRAINER_DB_PATH,
+        gen_three_const.ITEM_DB_PATH,
+        gen_three_const.MOVE_DB_PATH,
+        gen_three_const.TYPE_INFO_PATH,
+        gen_three_const.FIGHTS_INFO_PATH,
+        "",
+        const.FIRE_RED_VERSION
+    )
+
+
+def create_gen_three_leaf_green() -> GenThree:
+    return GenThree(
+        gen_three_const.FIRE_RED_LEAF_GREEN_POKEMON_PATH,
+        gen_three_const.FIRE_RED_LEAF_GREEN_TRAINER_DB_PATH,
+        gen_three_const.ITEM_DB_PATH,
+        gen_three_const.MOVE_DB_PATH,
+        gen_three_const.TYPE_INFO_PATH,
+        gen_three_const.FIGHTS_INFO_PATH,
+        "",
+        const.LEAF_GREEN_VERSION
+    )
\ No newline at end of file
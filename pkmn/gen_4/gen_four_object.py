@@ -10,7 +10,7 @@ from pkmn.gen_4 import pkmn_damage_calc
 from pkmn.damage_calc import DamageRange
 from pkmn.gen_4.data_objects import GenFourBadgeList, GenFourStatBlock, instantiate_trainer_pokemon, instantiate_wild_pokemon, get_hidden_power_base_power, get_hidden_power_type, VIT_AMT, VIT_CAP, BLACKOUT_BASE_VALS
 from pkmn.gen_4.gen_four_constants import gen_four_const
-from pkmn.pkmn_db import ItemDB, MinBattlesDB, PkmnDB, TrainerDB, MoveDB
+from pkmn.pkmn_db import EncounterDB, ItemDB, MinBattlesDB, PkmnDB, TrainerDB, MoveDB, load_shared_db
 from pkmn.pkmn_info import CurrentGen
 from route_recording.game_recorders.gen_three.emerald_recorder import EmeraldRecorder
 from route_recording.recorder import RecorderController, RecorderGameHookClient
@@ -31,33 +31,36 @@ class GenFour(CurrentGen):
         ]
 
         try:
-            self._pkmn_db = PkmnDB(_load_pkmn_db(pkmn_db_path))
+            self._pkmn_db = load_shared_db(PkmnDB, _load_pkmn_db, pkmn_db_path)
         except Exception as e:
             msg = f"Error loading pokemon DB: {pkmn_db_path}"
             logger.exception(msg)
             raise ValueError(msg)
 
         try:
-            self._trainer_db = TrainerDB(_load_trainer_db(trainer_db_path, self._pkmn_db))
+            self._trainer_db = load_shared_db(TrainerDB, _load_trainer_db, trainer_db_path, self._pkmn_db)
         except Exception as e:
             msg = f"Error loading trainer DB: {trainer_db_path}"
             logger.exception(msg)
             raise ValueError(msg)
 
         try:
-            self._item_db = ItemDB(_load_item_db(item_path))
+            self._item_db = load_shared_db(ItemDB, _load_item_db, item_path)
         except Exception as e:
             msg = f"Error loading item DB: {item_path}"
             logger.exception(msg)
             raise ValueError(msg)
         
         try:
-            self._move_db = MoveDB(_load_move_db(move_path))
+            self._move_db = load_shared_db(MoveDB, _load_move_db, move_path)
         except Exception as e:
             msg = f"Error loading move DB: {move_path}"
             logger.exception(msg)
             raise ValueError(msg)
 
+        # NOTE: no encounter data for this gen yet
+        self._encounter_db = EncounterDB({})
+
         try:
             self._min_battles_db = MinBattlesDB(min_battles_path)
         except Exception as e:
@@ -129,6 +132,12 @@ class GenFour(CurrentGen):
     def min_battles_db(self) -> MinBattlesDB:
         return self._min_battles_db
 
+    def encounter_db(self) -> EncounterDB:
+        return self._encounter_db
+
+    def get_source_files(self) -> List[str]:
+        return list(self._all_flat_files)
+
     def get_recorder_client(self, recorder_controller:RecorderController) -> RecorderGameHookClient:
         raise NotImplementedError()
 
@@ -482,56 +491,61 @@ def _load_move_db(path):
     return result
 
 
-gen_four_platinum = GenFour(
-    gen_four_const.PLATINUM_POKEMON_PATH,
-    gen_four_const.PLATINUM_TRAINER_DB_PATH,
-    gen_four_const.ITEM_DB_PATH,
-    gen_four_const.MOVE_DB_PATH,
-    gen_four_const.TYPE_INFO_PATH,
-    gen_four_const.FIGHTS_INFO_PATH,
-    "",
-    const.PLATINUM_VERSION
-)
-
-gen_four_diamond = GenFour(
-    gen_four_const.DP_POKEMON_PATH,
-    gen_four_const.DP_TRAINER_DB_PATH,
-    gen_four_const.ITEM_DB_PATH,
-    gen_four_const.MOVE_DB_PATH,
-    gen_four_const.TYPE_INFO_PATH,
-    gen_four_const.FIGHTS_INFO_PATH,
-    "",
-    const.DIAMOND_VERSION
-)
-
-gen_four_pearl = GenFour(
-    gen_four_const.DP_POKEMON_PATH,
-    gen_four_const.DP_TRAINER_DB_PATH,
-    gen_four_const.ITEM_DB_PATH,
-    gen_four_const.MOVE_DB_PATH,
-    gen_four_const.TYPE_INFO_PATH,
-    gen_four_const.FIGHTS_INFO_PATH,
-    "",
-    const.PEARL_VERSION
-)
-
-gen_four_heartgold = GenFour(
-    gen_four_const.HGSS_POKEMON_PATH,
-    gen_four_const.HGSS_TRAINER_DB_PATH,
-    gen_four_const.ITEM_DB_PATH,
-    gen_four_const.MOVE_DB_PATH,
-    gen_four_const.TYPE_INFO_PATH,
-    gen_four_const.FIGHTS_INFO_PATH,
-    "",
-    const.HEART_GOLD_VERSION
-)
-gen_four_soulsilver = GenFour(
-    gen_four_const.HGSS_POKEMON_PATH,
-    gen_four_const.HGSS_TRAINER_DB_PATH,
-    gen_four_const.ITEM_DB_PATH,
-    gen_four_const.MOVE_DB_PATH,
-    gen_four_const.TYPE_INFO_PATH,
-    gen_four_const.FIGHTS_INFO_PATH,
-    "",
-    const.SOUL_SILVER_VERSION
-)
\ No newline at end of file
+def create_gen_four_platinum() -> GenFour:
+    return GenFour(
+        gen_four_const.PLATINUM_POKEMON_PATH,
+        gen_four_const.PLATINUM_TRAINER_DB_PATH,
+        gen_four_const.ITEM_DB_PATH,
+        gen_four_const.MOVE_DB_PATH,
+        gen_four_const.TYPE_INFO_PATH,
+        gen_four_const.FIGHTS_INFO_PATH,
+        "",
+        const.PLATINUM_VERSION
+    )
+
+def create_gen_four_diamond() -> GenFour:
+    return GenFour(
+        gen_four_const.DP_POKEMON_PATH,
+        gen_four_const.DP_TRAINER_DB_PATH,
+        gen_four_const.ITEM_DB_PATH,
+        gen_four_const.MOVE_DB_PATH,
+        gen_four_const.TYPE_INFO_PATH,
+        gen_four_const.FIGHTS_INFO_PATH,
+        "",
+        const.DIAMOND_VERSION
+    )
+
+def create_gen_four_pearl() -> GenFour:
+    return GenFour(
+        gen_four_const.DP_POKEMON_PATH,
+        gen_four_const.DP_TRAINER_DB_PATH,
+        gen_four_const.ITEM_DB_PATH,
+        gen_four_const.MOVE_DB_PATH,
+        gen_four_const.TYPE_INFO_PATH,
+        gen_four_const.FIGHTS_INFO_PATH,
+        "",
+        const.PEARL_VERSION
+    )
+
+def create_gen_four_heartgold() -> GenFour:
+    return GenFour(
+        gen_four_const.HGSS_POKEMON_PATH,
+        gen_four_const.HGSS_TRAINER_DB_PATH,
+        gen_four_const.ITEM_DB_PATH,
+        gen_four_const.MOVE_DB_PATH,
+        gen_four_const.TYPE_INFO_PATH,
+        gen_four_const.FIGHTS_INFO_PATH,
+        "",
+        const.HEART_GOLD_VERSION
+    )
+def create_gen_four_soulsilver() -> GenFour:
+    return GenFour(
+        gen_four_const.HGSS_POKEMON_PATH,
+        gen_four_const.HGSS_TRAINER_DB_PATH,
+        gen_four_const.ITEM_DB_PATH,
+        gen_four_const.MOVE_DB_PATH,
+        gen_four_const.TYPE_INFO_PATH,
+        gen_four_const.FIGHTS_INFO_PATH,
+        "",
+        const.SOUL_SILVER_VERSION
+    )
\ No newline at end of file
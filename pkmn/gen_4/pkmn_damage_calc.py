@@ -314,22 +314,22 @@ def calculate_gen_four_damage(
         return damage_calc.DamageRange({x:1 for x in range(1, psywave_upper_limit)})
     
     if attacking_stage_modifiers is None:
-        attacking_stage_modifiers = universal_data_objects.StageModifiers()
+        attacking_stage_modifiers = universal_data_objects.NEUTRAL_STAGE_MODIFIERS
     if defending_stage_modifiers is None:
-        defending_stage_modifiers = universal_data_objects.StageModifiers()
+        defending_stage_modifiers = universal_data_objects.NEUTRAL_STAGE_MODIFIERS
 
     # when a crit occurs, always ignore negative modifiers for the attacking pokemon, and always ignore positive modifiers for the defensive pokemon
     if is_crit:
         if move.category == const.CATEGORY_PHYSICAL:
             if attacking_stage_modifiers.special_attack_stage < 0:
-                attacking_stage_modifiers = universal_data_objects.StageModifiers()
+                attacking_stage_modifiers = universal_data_objects.NEUTRAL_STAGE_MODIFIERS
             if defending_stage_modifiers.special_defense_stage > 0:
-                defending_stage_modifiers = universal_data_objects.StageModifiers()
+                defending_stage_modifiers = universal_data_objects.NEUTRAL_STAGE_MODIFIERS
         else:
             if attacking_stage_modifiers.attack_stage < 0:
-                attacking_stage_modifiers = universal_data_objects.StageModifiers()
+                attacking_stage_modifiers = universal_data_objects.NEUTRAL_STAGE_MODIFIERS
             if defending_stage_modifiers.defense_stage > 0:
-                defending_stage_modifiers = universal_data_objects.StageModifiers()
+                defending_stage_modifiers = universal_data_objects.NEUTRAL_STAGE_MODIFIERS
 
     if attacking_battle_stats is None:
         attacking_battle_stats = attacking_pkmn.get_battle_stats(attacking_stage_modifiers, mon_field=attacking_field)
@@ -738,15 +738,7 @@ def calculate_gen_four_damage(
         damage_vals[temp] = 1
         result = damage_calc.DamageRange(damage_vals)
     else:
-        for numerator in range(MIN_RANGE, MAX_RANGE + 1):
-            cur_damage = max(math.floor((temp * numerator) / MAX_RANGE), 1)
-
-            if cur_damage not in damage_vals:
-                damage_vals[cur_damage] = 0
-            
-            damage_vals[cur_damage] += 1
-        
-        result = damage_calc.DamageRange(damage_vals)
+        result = damage_calc.roll_damage_range(temp, MIN_RANGE, MAX_RANGE)
         if multi_hit_multiplier > 1:
             if is_crit:
                 # Currently forcing "crit" calculations to assume only one crit out of all strikes
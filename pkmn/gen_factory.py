@@ -1,9 +1,11 @@
 import os
 import json
-from typing import Dict, List, Tuple
+import threading
+from typing import Callable, Dict, List, Tuple, Union
 import logging
 
 from utils.constants import const
+from pkmn import damage_cache, gen_snapshot
 from pkmn.pkmn_info import CurrentGen
 
 logger = logging.getLogger(__name__)
@@ -11,23 +13,95 @@ logger = logging.getLogger(__name__)
 
 class GenFactory:
     def __init__(self):
-        self._all_gens:Dict[str, CurrentGen] = {}
-        self._custom_gens = {}
+        # NOTE: every registered version is in _all_gens, but versions that haven't been loaded yet map to their loader instead
+        self._all_gens:Dict[str, Union[CurrentGen, Callable[[], CurrentGen]]] = {}
+        self._gen_load_locks:Dict[str, threading.Lock] = {}
+        self._gen_loaders:Dict[str, Callable[[], CurrentGen]] = {}
+        # NOTE: custom gens are only loaded (and validated) on first use. Until then, only their metadata is read
+        self._custom_gen_info:Dict[str, Tuple[str, str]] = {}
+        self._custom_gens:Dict[str, Tuple[Tuple, CurrentGen]] = {}
+        self._custom_gen_lock = threading.Lock()
         self._cur_gen = None
         self._cur_version = None
     
-    def register_gen(self, gen:CurrentGen, gen_name:str) -> None:
+    def register_gen(self, gen:Union[CurrentGen, Callable[[], CurrentGen]], gen_name:str) -> None:
+        # gen can also be a function that creates the gen, which won't be called until the version is first needed
         if gen_name in self._all_gens:
             raise ValueError(f"Gen already present: {gen_name}")
         self._all_gens[gen_name] = gen
+        self._gen_load_locks[gen_name] = threading.Lock()
+        if not isinstance(gen, CurrentGen):
+            self._gen_loaders[gen_name] = gen
     
+    def _get_base_gen(self, version_name) -> CurrentGen:
+        result = self._all_gens.get(version_name)
+        if result is None or isinstance(result, CurrentGen):
+            return result
+
+        # NOTE: locked per version, so that a version being loaded in the background doesn't block loading a different one
+        with self._gen_load_locks[version_name]:
+            # check again, in case another thread finished loading this version while we were waiting
+            result = self._all_gens[version_name]
+            if not isinstance(result, CurrentGen):
+                logger.info(f"Loading version: {version_name}")
+                result = gen_snapshot.load_gen(version_name, result)
+                self._all_gens[version_name] = result
+
+        return result
+
+    def load_all_gens_in_background(self):
+        threading.Thread(target=self._load_all_gens, daemon=True).start()
+
+    def _load_all_gens(self):
+        for cur_version in list(self._all_gens.keys()):
+            try:
+                self._get_base_gen(cur_version)
+            except Exception as e:
+                # not fatal here. The same error will be raised again if the version is actually used
+                logger.error(f"Failed to load version in background: {cur_version}")
+                logger.exception(e)
+    
+    def rebuild_all_snapshots(self):
+        # always loads from the source files, rather than trusting any existing snapshots
+        for cur_version, cur_loader in self._gen_loaders.items():
+            logger.info(f"Rebuilding snapshot for version: {cur_version}")
+            gen_snapshot.write_snapshot(cur_version, cur_loader())
+
+    def _get_custom_gen(self, version_name) -> CurrentGen:
+        custom_gen_info = self._custom_gen_info.get(version_name)
+        if custom_gen_info is None:
+            return None
+
+        custom_gen_path, base_version = custom_gen_info
+        with self._custom_gen_lock:
+            # keyed on the mtimes of the files in the custom gen folder, so that edits made while the app is open get picked up
+            cache_key = _get_folder_mtimes(custom_gen_path)
+            cached = self._custom_gens.get(version_name)
+            if cached is not None and cached[0] == cache_key:
+                return cached[1]
+
+            logger.info(f"Loading custom version: {version_name}")
+            try:
+                result = self._get_base_gen(base_version).load_custom_gen(version_name, custom_gen_path)
+            except Exception as e:
+                logger.error(f"Failed to load custom gen with path: {custom_gen_path}")
+                logger.exception(e)
+                raise ValueError(f"Error loading custom gen: {version_name}, error: {e}")
+
+            if cached is not None:
+                # cached damage calcs are keyed on the version name, which now points to different data
+                damage_cache.clear_caches()
+            self._custom_gens[version_name] = (cache_key, result)
+
+        return result
+
     def current_gen_info(self) -> CurrentGen:
         return self._cur_gen
     
     def get_specific_version(self, version_name) -> CurrentGen:
-        new_gen = self._all_gens.get(version_name)
+        new_gen = self._get_base_gen(version_name)
         if new_gen is None:
-            new_gen = self._custom_gens.get(version_name)
+            new_gen = self._get_custom_gen(version_name)
         
         return new_gen
     
@@ -49,28 +123,31 @@ class GenFactory:
         if real_gens:
             result.extend([x for x in self._all_gens.keys()])
         if custom_gens:
-            result.extend([x for x in self._custom_gens.keys()])
+            result.extend([x for x in self._custom_gen_info.keys()])
 
         return result
     
     def reload_all_custom_gens(self):
         # NOTE: assumes all base versions have been registered already
+        # only the metadata is read here, so this doesn't get any slower as more custom gens are installed
+        # cached damage calcs are keyed on the version name, which may now point to different data
+        damage_cache.clear_caches()
         invalid_custom_gens = []
-        self._custom_gens = {}
+        custom_gen_info = {}
         for cur_path, cur_base_version, cur_custom_gen_name in self.get_all_custom_gen_info():
-            try:
-                base_gen = self._all_gens.get(cur_base_version)
-                if base_gen == None:
-                    raise ValueError(f"Invalid base gen specified: {cur_base_version}")
-                self._custom_gens[cur_custom_gen_name] = base_gen.load_custom_gen(
-                    cur_custom_gen_name,
-                    cur_path
-                )
+            if cur_base_version not in self._all_gens:
+                logger.error(f"Invalid base gen for custom gen with path: {cur_path}")
+                invalid_custom_gens.append((cur_custom_gen_name, f"Invalid base gen specified: {cur_base_version}"))
+                continue
+            custom_gen_info[cur_custom_gen_name] = (cur_path, cur_base_version)
 
-            except Exception as e:
-                logger.error(f"Failed to load custom gen with path: {cur_path}")
-                logger.exception(e)
-                invalid_custom_gens.append((cur_custom_gen_name, str(e)))
+        with self._custom_gen_lock:
+            # already loaded custom gens are kept, as long as they still point to the same place
+            self._custom_gens = {
+                cur_name: cur_cached for cur_name, cur_cached in self._custom_gens.items()
+                if custom_gen_info.get(cur_name) == self._custom_gen_info.get(cur_name)
+            }
+            self._custom_gen_info = custom_gen_info
         
         if len(invalid_custom_gens) > 0:
             err_msg = "\n".join([f"Custom gen: {x[0]}, error: {x[1]}" for x in invalid_custom_gens])
@@ -103,6 +180,14 @@ class GenFactory:
         return result
 
 
+def _get_folder_mtimes(folder_path) -> Tuple:
+    result = []
+    for cur_file in sorted(os.listdir(folder_path)):
+        file_stats = os.stat(os.path.join(folder_path, cur_file))
+        result.append((cur_file, file_stats.st_mtime_ns, file_stats.st_size))
+    return tuple(result)
+
+
 _gen_factory = GenFactory()
 
 #####
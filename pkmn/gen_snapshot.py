@@ -0,0 +1,137 @@
+import copyreg
+import hashlib
+import logging
+import mmap
+import os
+import pickle
+from typing import Callable, List, Tuple
+
+from pkmn import pkmn_db
+from pkmn.pkmn_info import CurrentGen
+from utils.constants import const
+
+logger = logging.getLogger(__name__)
+
+# NOTE: bump this whenever the layout of the snapshot files changes
+_SNAPSHOT_FORMAT = 1
+_code_version = None
+
+
+def _get_code_version() -> str:
+    # snapshots store the validated gen objects as-is, so any change to the classes being pickled invalidates them
+    # frozen builds don't ship the source files, but every release has a new app version anyway
+    global _code_version
+    if _code_version is None:
+        hasher = hashlib.sha1(f"{_SNAPSHOT_FORMAT}:{const.APP_VERSION}".encode())
+        pkmn_root = os.path.dirname(os.path.abspath(__file__))
+        for cur_dir, _, cur_files in sorted(os.walk(pkmn_root)):
+            for cur_file in sorted(cur_files):
+                if cur_file.endswith(".py"):
+                    hasher.update(pkmn_db.get_file_digest(os.path.join(cur_dir, cur_file)).encode())
+        _code_version = hasher.hexdigest()
+
+    return _code_version
+
+
+def _get_path_digest(path) -> str:
+    if os.path.isdir(path):
+        # the min battles DB only keeps track of which routes are in its folder, so the listing is all that matters
+        return hashlib.sha1("\n".join(sorted(os.listdir(path))).encode()).hexdigest()
+    if os.path.isfile(path):
+        return pkmn_db.get_file_digest(path)
+    return None
+
+
+def _to_stored_path(path) -> str:
+    # paths within the app are stored relative to it, as frozen builds are unpacked to a different temp folder every run
+    if not path:
+        return path
+    path = os.path.abspath(path)
+    if path.startswith(const.SOURCE_ROOT_PATH + os.sep):
+        return os.path.relpath(path, const.SOURCE_ROOT_PATH)
+    return path
+
+
+def _from_stored_path(path) -> str:
+    if not path:
+        return path
+    return os.path.join(const.SOURCE_ROOT_PATH, path)
+
+
+def _get_source_digests(gen:CurrentGen) -> List[Tuple[str, str]]:
+    source_paths = gen.get_source_files() + [gen.min_battles_db().get_dir()]
+    return [(_to_stored_path(x), _get_path_digest(x)) for x in source_paths]
+
+
+def _reduce_db(db):
+    # shared DBs are restored through the pkmn_db registry, so versions loaded from snapshots still share them
+    key = pkmn_db.get_shared_db_key(db)
+    if key is None:
+        return db.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+    return (pkmn_db.restore_shared_db, (key, type(db), db.__dict__))
+
+
+_snapshot_dispatch_table = copyreg.dispatch_table.copy()
+for _db_type in (pkmn_db.PkmnDB, pkmn_db.TrainerDB, pkmn_db.ItemDB, pkmn_db.MoveDB, pkmn_db.EncounterDB):
+    _snapshot_dispatch_table[_db_type] = _reduce_db
+
+
+def _get_snapshot_path(version_name) -> str:
+    return os.path.join(const.GEN_SNAPSHOT_DIR, f"{version_name}.pickle")
+
+
+def write_snapshot(version_name, gen:CurrentGen):
+    snapshot_path = _get_snapshot_path(version_name)
+    temp_path = f"{snapshot_path}.{os.getpid()}.tmp"
+    os.makedirs(const.GEN_SNAPSHOT_DIR, exist_ok=True)
+
+    # the header is a separate pickle, so that a stale snapshot can be rejected without loading the whole gen
+    with open(temp_path, 'wb') as f:
+        pickle.dump((_get_code_version(), _get_source_digests(gen)), f, protocol=pickle.HIGHEST_PROTOCOL)
+        gen_pickler = pickle.Pickler(f, protocol=pickle.HIGHEST_PROTOCOL)
+        gen_pickler.dispatch_table = _snapshot_dispatch_table
+        gen_pickler.dump(gen)
+
+    # write then rename, so that a partially written snapshot is never picked up
+    os.replace(temp_path, snapshot_path)
+
+
+def _load_snapshot(version_name) -> CurrentGen:
+    snapshot_path = _get_snapshot_path(version_name)
+    if not os.path.exists(snapshot_path):
+        return None
+
+    with open(snapshot_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as snapshot:
+        code_version, source_digests = pickle.load(snapshot)
+        if code_version != _get_code_version():
+            logger.info(f"Snapshot for version {version_name} is from a different app version")
+            return None
+
+        for cur_path, cur_digest in source_digests:
+            if _get_path_digest(_from_stored_path(cur_path)) != cur_digest:
+                logger.info(f"Snapshot for version {version_name} is outdated, source file changed: {cur_path}")
+                return None
+
+        return pickle.load(snapshot)
+
+
+def load_gen(version_name, create_gen:Callable[[], CurrentGen]) -> CurrentGen:
+    # Loads the version from its snapshot if none of its source files have changed, which skips parsing and validation
+    # Otherwise, the version is created from scratch, and the snapshot is rewritten for next time
+    try:
+        result = _load_snapshot(version_name)
+        if result is not None:
+            return result
+    except Exception as e:
+        # not fatal, just fall back to loading from the source files
+        logger.error(f"Failed to load snapshot for version: {version_name}")
+        logger.exception(e)
+
+    result = create_gen()
+    try:
+        write_snapshot(version_name, result)
+    except Exception as e:
+        logger.error(f"Failed to write snapshot for version: {version_name}")
+        logger.exception(e)
+
+    return result
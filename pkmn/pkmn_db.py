@@ -1,12 +1,87 @@
 from __future__ import annotations
+import hashlib
 import os
-from typing import Dict, List, Tuple
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Set, Tuple
 
 from utils.constants import const
 from pkmn import universal_data_objects
+from pkmn.search_index import NameSearchIndex
 from utils.io_utils import sanitize_string
 
 
+# NOTE: weak, so that DBs which are no longer used by any gen (e.g. from a custom gen that was since edited) can be freed
+_shared_dbs = weakref.WeakValueDictionary()
+_shared_db_keys = weakref.WeakKeyDictionary()
+_shared_db_locks:Dict[Tuple, threading.Lock] = {}
+_shared_db_lock = threading.Lock()
+_file_digests:Dict[Tuple[str, int, int], str] = {}
+
+
+def get_file_digest(path) -> str:
+    # keyed on the contents rather than the path, so that a custom gen which hasn't changed a file still shares it
+    # the digest itself is only recalculated when the file changes on disk
+    file_stats = os.stat(path)
+    digest_key = (os.path.abspath(path), file_stats.st_mtime_ns, file_stats.st_size)
+    result = _file_digests.get(digest_key)
+    if result is None:
+        with open(path, 'rb') as f:
+            result = hashlib.sha1(f.read()).hexdigest()
+        _file_digests[digest_key] = result
+
+    return result
+
+
+def _get_loader_arg_key(loader_arg):
+    # DBs passed to a loader are keyed on what they were loaded from, rather than the object itself
+    # this keeps keys the same across processes, which lets DBs restored from a gen snapshot be shared too
+    if isinstance(loader_arg, (PkmnDB, TrainerDB, ItemDB, MoveDB)):
+        return _shared_db_keys.get(loader_arg, loader_arg)
+    return loader_arg
+
+
+def load_shared_db(db_type:type, loader_fn:Callable, path:str, *loader_args:Any):
+    # Creates db_type(loader_fn(path, *loader_args)), unless an identical DB has already been loaded, in which case it's shared
+    # Any extra loader args (e.g. the PkmnDB used to create a TrainerDB) are part of the key too, so they must be hashable
+    # NOTE: DBs are never modified after they've been loaded, which is what makes them safe to share between versions
+    key = (db_type, loader_fn, get_file_digest(path), tuple([_get_loader_arg_key(x) for x in loader_args]))
+    result = _shared_dbs.get(key)
+    if result is not None:
+        return result
+
+    # lock per DB, so that loading gens in the background doesn't block loading an unrelated DB
+    with _shared_db_lock:
+        cur_lock = _shared_db_locks.setdefault(key, threading.Lock())
+
+    with cur_lock:
+        result = _shared_dbs.get(key)
+        if result is None:
+            result = db_type(loader_fn(path, *loader_args))
+            _shared_dbs[key] = result
+            _shared_db_keys[result] = key
+
+    return result
+
+
+def get_shared_db_key(db) -> Tuple:
+    # returns None for DBs that weren't created through load_shared_db
+    return _shared_db_keys.get(db)
+
+
+def restore_shared_db(key:Tuple, db_type:type, state:dict):
+    # the unpickling counterpart of get_shared_db_key. If the same DB is already loaded, that one is used instead
+    with _shared_db_lock:
+        result = _shared_dbs.get(key)
+        if result is None:
+            result = db_type.__new__(db_type)
+            result.__dict__.update(state)
+            _shared_dbs[key] = result
+            _shared_db_keys[result] = key
+
+    return result
+
+
 class MinBattlesDB:
     def __init__(self, path):
         self._path = path
@@ -25,6 +100,9 @@ class MinBattlesDB:
 class PkmnDB:
     def __init__(self, data:Dict[str, universal_data_objects.PokemonSpecies]):
         self._data = {sanitize_string(x.name): x for x in data.values()}
+        # NOTE: built on first use, since most DBs are never searched
+        self._search_index:NameSearchIndex = None
+        self._growth_rate_masks:Dict[str, int] = {}
     
     def validate_moves(self, move_db:MoveDB):
         invalid_mons = []
@@ -69,15 +147,30 @@ class PkmnDB:
         
         return None
     
+    def _get_search_index(self) -> NameSearchIndex:
+        if self._search_index is None:
+            search_index = NameSearchIndex([x.name for x in self._data.values()])
+            growth_rate_masks = {}
+            for cur_growth_rate in set([x.growth_rate for x in self._data.values()]):
+                growth_rate_masks[cur_growth_rate] = search_index.get_mask([x.name for x in self._data.values() if x.growth_rate == cur_growth_rate])
+
+            self._growth_rate_masks = growth_rate_masks
+            self._search_index = search_index
+
+        return self._search_index
+
     def get_filtered_names(self, filter_val=None, growth_rate=None) -> List[str]:
-        orig_filter_fal = filter_val
         if filter_val is None:
             return self.get_all_names(growth_rate=growth_rate)
-        
-        filter_val = sanitize_string(filter_val)
-        result = [v.name for k, v in self._data.items() if filter_val in k and (v.growth_rate == growth_rate if not growth_rate is None else True)]
+
+        search_index = self._get_search_index()
+        mask = None if growth_rate is None else self._growth_rate_masks.get(growth_rate, 0)
+        result = search_index.search(filter_val, mask=mask)
         if not result:
-            result = [f"No Match: '{orig_filter_fal}'"]
+            # nothing contains the filter, so fall back to the closest names instead (e.g. for typos)
+            result = search_index.fuzzy_search(filter_val, mask=mask)
+        if not result:
+            result = [f"No Match: '{filter_val}'"]
         
         return result
 
@@ -98,6 +191,29 @@ class TrainerDB:
             if trainer_obj.trainer_class not in self.class_oriented_trainers:
                 self.class_oriented_trainers[trainer_obj.trainer_class] = []
             self.class_oriented_trainers[trainer_obj.trainer_class].append(trainer_obj.name)
+
+        # secondary indexes, used to answer trainer queries without scanning every trainer
+        # each index is a sorted list of positions in _trainer_list (so results always come back in the same order as the DB),
+        # along with the same positions as a set, for intersecting against
+        self._trainer_list:List[universal_data_objects.Trainer] = list(self._data.values())
+        self._all_idxs:List[int] = list(range(len(self._trainer_list)))
+        self._loc_idxs:Dict[str, Tuple[List[int], Set[int]]] = {}
+        self._class_idxs:Dict[str, Tuple[List[int], Set[int]]] = {}
+        self._non_rematch_idxs:Tuple[List[int], Set[int]] = ([], set())
+        self._multi_battle_idxs:Tuple[List[int], Set[int]] = ([], set())
+        for trainer_idx, trainer_obj in enumerate(self._trainer_list):
+            cur_indexes = [
+                self._loc_idxs.setdefault(trainer_obj.location, ([], set())),
+                self._class_idxs.setdefault(trainer_obj.trainer_class, ([], set())),
+            ]
+            if not trainer_obj.rematch:
+                cur_indexes.append(self._non_rematch_idxs)
+            if len(trainer_obj.pkmn) <= 3:
+                cur_indexes.append(self._multi_battle_idxs)
+
+            for idx_list, idx_set in cur_indexes:
+                idx_list.append(trainer_idx)
+                idx_set.add(trainer_idx)
     
     def validate_trainers(self, pkmn_db:PkmnDB, move_db:MoveDB):
         invalid_trainers = []
@@ -132,34 +248,44 @@ class TrainerDB:
             return False
         return len(temp.pkmn) <= 3
     
+    def query_trainers(self, trainer_class=None, trainer_loc=None, defeated_trainers=None, show_rematches=True, multi_only=False) -> List[universal_data_objects.Trainer]:
+        # intersects the relevant indexes, starting from the smallest one
+        # results are in the same order as the DB (which is the order in which the trainers are found in game)
+        matching_idxs = []
+        if trainer_class is not None and trainer_class != const.ALL_TRAINERS:
+            matching_idxs.append(self._class_idxs.get(trainer_class, ([], set())))
+        if trainer_loc is not None and trainer_loc != const.ALL_TRAINERS:
+            matching_idxs.append(self._loc_idxs.get(trainer_loc, ([], set())))
+        if not show_rematches:
+            matching_idxs.append(self._non_rematch_idxs)
+        if multi_only:
+            matching_idxs.append(self._multi_battle_idxs)
+
+        if not matching_idxs:
+            result_idxs = self._all_idxs
+        else:
+            matching_idxs.sort(key=lambda x: len(x[0]))
+            result_idxs = matching_idxs[0][0]
+            if len(matching_idxs) > 1:
+                other_idx_sets = [x[1] for x in matching_idxs[1:]]
+                result_idxs = [x for x in result_idxs if all(x in cur_set for cur_set in other_idx_sets)]
+
+        if not defeated_trainers:
+            return [self._trainer_list[x] for x in result_idxs]
+        return [self._trainer_list[x] for x in result_idxs if self._trainer_list[x].name not in defeated_trainers]
+
     def get_valid_trainers(self, trainer_class=None, trainer_loc=None, defeated_trainers=None, show_rematches=True, custom_name_fn=None, multi_only=False):
-        if trainer_class == const.ALL_TRAINERS:
-            trainer_class = None
-        if trainer_loc == const.ALL_TRAINERS:
-            trainer_loc = None
-        if defeated_trainers is None:
-            defeated_trainers = []
-        if custom_name_fn is None:
-            def simple_name(trainer_obj:universal_data_objects.Trainer):
-                return trainer_obj.name
-            custom_name_fn = simple_name
+        valid_trainers = self.query_trainers(
+            trainer_class=trainer_class,
+            trainer_loc=trainer_loc,
+            defeated_trainers=defeated_trainers,
+            show_rematches=show_rematches,
+            multi_only=multi_only,
+        )
 
-        valid_trainers = []
-        for cur_trainer in self._data.values():
-            if trainer_class is not None and cur_trainer.trainer_class != trainer_class:
-                continue
-            elif trainer_loc is not None and cur_trainer.location != trainer_loc:
-                continue
-            elif cur_trainer.name in defeated_trainers:
-                continue
-            elif not show_rematches and cur_trainer.rematch:
-                continue
-            elif multi_only and len(cur_trainer.pkmn) > 3:
-                continue
-
-            valid_trainers.append(custom_name_fn(cur_trainer))
-        
-        return valid_trainers
+        if custom_name_fn is None:
+            return [x.name for x in valid_trainers]
+        return [custom_name_fn(x) for x in valid_trainers]
 
 
 class ItemDB:
@@ -185,6 +311,11 @@ class ItemDB:
                 if mart not in self.mart_items:
                     self.mart_items[mart] = []
                 self.mart_items[mart].append(cur_base_item.name)
+
+        # NOTE: built on first use, since most DBs are never searched
+        self._search_index:NameSearchIndex = None
+        self._item_type_masks:Dict[str, int] = {}
+        self._mart_masks:Dict[str, int] = {}
     
     def validate_tms_hms(self, move_db:MoveDB):
         invalid_tms_hms = []
@@ -210,26 +341,31 @@ class ItemDB:
         
         return self._data.get(item_name)
     
+    def _get_search_index(self) -> NameSearchIndex:
+        if self._search_index is None:
+            search_index = NameSearchIndex([x.name for x in self._data.values()])
+            self._item_type_masks = {
+                const.ITEM_TYPE_KEY_ITEMS: search_index.get_mask(self.key_items),
+                const.ITEM_TYPE_TM: search_index.get_mask(self.tms),
+                const.ITEM_TYPE_OTHER: search_index.get_mask(self.other_items),
+            }
+            self._mart_masks = {k: search_index.get_mask(v) for k, v in self.mart_items.items()}
+            self._search_index = search_index
+
+        return self._search_index
+
     def get_filtered_names(self, item_type=const.ITEM_TYPE_ALL_ITEMS, source_mart=const.ITEM_TYPE_ALL_ITEMS, name_filter=None):
-        result = []
-
-        if item_type == const.ITEM_TYPE_ALL_ITEMS:
-            base_list = [x.name for x in self._data.values()]
-        elif item_type == const.ITEM_TYPE_KEY_ITEMS:
-            base_list = self.key_items
-        elif item_type == const.ITEM_TYPE_TM:
-            base_list = self.tms
-        else:
-            base_list = self.other_items
-        
-        for cur_test in base_list:
-            if (
-                (source_mart == const.ITEM_TYPE_ALL_ITEMS or cur_test in self.mart_items[source_mart]) and
-                (name_filter is None or sanitize_string(name_filter) in sanitize_string(cur_test))
-            ):
-                result.append(cur_test)
-        
-        return result
+        search_index = self._get_search_index()
+
+        mask = None
+        if item_type != const.ITEM_TYPE_ALL_ITEMS:
+            # anything that isn't a key item or TM/HM falls into other items
+            mask = self._item_type_masks.get(item_type, self._item_type_masks[const.ITEM_TYPE_OTHER])
+        if source_mart != const.ITEM_TYPE_ALL_ITEMS:
+            mart_mask = self._mart_masks.get(source_mart, 0)
+            mask = mart_mask if mask is None else (mask & mart_mask)
+
+        return search_index.search(name_filter, mask=mask)
 
 
 class MoveDB:
@@ -274,6 +410,9 @@ class MoveDB:
         for cur_move in self._data.values():
             if cur_move.has_field_effect:
                 self.field_moves[sanitize_string(cur_move.name)] = cur_move
+
+        # NOTE: built on first use, since most DBs are never searched
+        self._search_index:NameSearchIndex = None
     
     def validate_move_types(self, supported_types):
         invalid_moves = []
@@ -299,15 +438,17 @@ class MoveDB:
         
         return None
     
+    def _get_search_index(self) -> NameSearchIndex:
+        if self._search_index is None:
+            self._search_index = NameSearchIndex([x.name for x in self._data.values()])
+        return self._search_index
+
     def get_filtered_names(self, filter=None, include_delete_move=False):
-        if filter is None:
-            result = [x.name for x in self._data.values()]
-        else:
-            result = []
-            filter = sanitize_string(filter)
-            for test_name, test_move in self._data.items():
-                if filter in test_name.lower():
-                    result.append(test_move.name)
+        search_index = self._get_search_index()
+        result = search_index.search(filter)
+        if len(result) == 0 and filter is not None:
+            # nothing contains the filter, so fall back to the closest names instead (e.g. for typos)
+            result = search_index.fuzzy_search(filter)
         
         if len(result) == 0:
             if include_delete_move:
@@ -315,7 +456,7 @@ class MoveDB:
             else:
                 result.append(const.NO_MOVE)
         elif include_delete_move:
-            if filter in sanitize_string(const.DELETE_MOVE):
+            if filter is None or sanitize_string(filter) in sanitize_string(const.DELETE_MOVE):
                 result.append(const.DELETE_MOVE)
         
         return result
@@ -323,3 +464,40 @@ class MoveDB:
     def get_stat_mod(self, move_name) -> List[Tuple[str, int]]:
         return self.stat_mod_moves.get(sanitize_string(move_name), [])
 
+
+
+class EncounterDB:
+    def __init__(self, data:Dict[str, Dict[str, universal_data_objects.EncounterTable]]):
+        # map name -> encounter method -> table. Maps and methods are kept in the order they're found in the source data
+        self._data = {sanitize_string(x): y for x, y in data.items()}
+        self._map_names = [next(iter(x.values())).map_name for x in data.values() if x]
+        self._method_lookup:Dict[str, List[universal_data_objects.EncounterTable]] = {}
+        for cur_tables in self._data.values():
+            for cur_method, cur_table in cur_tables.items():
+                self._method_lookup.setdefault(cur_method, []).append(cur_table)
+
+    def validate_encounters(self, pkmn_db:PkmnDB):
+        invalid_encounters = []
+
+        for cur_tables in self._data.values():
+            for cur_table in cur_tables.values():
+                for cur_slot in cur_table.slots:
+                    if pkmn_db.get_pkmn(cur_slot.pkmn_name) is None:
+                        invalid_encounters.append((cur_table.map_name, cur_table.method, cur_slot.pkmn_name))
+
+        if len(invalid_encounters) > 0:
+            raise ValueError(f"Invalid encounters found with invalid mons: {invalid_encounters}")
+
+    def is_empty(self) -> bool:
+        return len(self._data) == 0
+
+    def get_all_maps(self, method=None) -> List[str]:
+        if method is None:
+            return list(self._map_names)
+        return [x.map_name for x in self._method_lookup.get(method, [])]
+
+    def get_methods(self, map_name) -> List[str]:
+        return list(self._data.get(sanitize_string(map_name), {}).keys())
+
+    def get_table(self, map_name, method) -> universal_data_objects.EncounterTable:
+        return self._data.get(sanitize_string(map_name), {}).get(method)
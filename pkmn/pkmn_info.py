@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Dict, Tuple, List
 from pkmn import universal_data_objects
 from pkmn.damage_calc import DamageRange
-from pkmn.pkmn_db import ItemDB, MinBattlesDB, MoveDB, PkmnDB, TrainerDB
+from pkmn.pkmn_db import EncounterDB, ItemDB, MinBattlesDB, MoveDB, PkmnDB, TrainerDB
 import routing.state_objects
 from route_recording.recorder import RecorderController, RecorderGameHookClient
 from utils.constants import const
@@ -33,6 +33,12 @@ class CurrentGen:
     
     def min_battles_db(self) -> MinBattlesDB:
         raise NotImplementedError()
+
+    def encounter_db(self) -> EncounterDB:
+        raise NotImplementedError()
+
+    def get_source_files(self) -> List[str]:
+        raise NotImplementedError()
     
     def get_recorder_client(self, recorder_controller:RecorderController) -> RecorderGameHookClient:
         raise NotImplementedError()
@@ -0,0 +1,98 @@
+import bisect
+from typing import Dict, Iterable, List
+
+from utils.io_utils import sanitize_string
+
+
+# sorts after any character that can be in a sanitized name
+_MAX_CHAR = chr(0x10FFFF)
+
+
+def _get_trigrams(normalized_name:str) -> List[str]:
+    return [normalized_name[i:i + 3] for i in range(len(normalized_name) - 2)]
+
+
+class NameSearchIndex:
+    # Search index over a fixed list of names, for the filtered name lookups of the various DBs
+    # Names are matched on their sanitized form. Results are always ranked as: exact matches, then prefix matches, then
+    # any other substring matches, keeping the original order of the names within each group
+    # Filters (e.g. growth rate) are passed in as bitsets over the name positions, see get_mask()
+    def __init__(self, names:Iterable[str]):
+        self._names = list(names)
+        self._normalized = [sanitize_string(x) for x in self._names]
+        self._name_lookup = {x: idx for idx, x in enumerate(self._names)}
+        self._trigram_idxs:Dict[str, List[int]] = {}
+
+        # prefix lookups are done with a binary search over the sorted names, which is much smaller than a proper trie
+        sorted_names = sorted([(x, idx) for idx, x in enumerate(self._normalized)])
+        self._sorted_normalized = [x[0] for x in sorted_names]
+        self._sorted_idxs = [x[1] for x in sorted_names]
+
+        for name_idx, cur_name in enumerate(self._normalized):
+            for cur_trigram in set(_get_trigrams(cur_name)):
+                self._trigram_idxs.setdefault(cur_trigram, []).append(name_idx)
+
+    def get_mask(self, names:Iterable[str]) -> int:
+        result = 0
+        for cur_name in names:
+            name_idx = self._name_lookup.get(cur_name)
+            if name_idx is not None:
+                result |= 1 << name_idx
+        return result
+
+    def _get_candidate_idxs(self, query:str, mask:int) -> List[int]:
+        if len(query) < 3:
+            candidate_idxs = range(len(self._names))
+        else:
+            # any name containing the query has to contain every trigram of the query
+            posting_lists = sorted([self._trigram_idxs.get(x, []) for x in set(_get_trigrams(query))], key=len)
+            other_idx_sets = [set(x) for x in posting_lists[1:]]
+            candidate_idxs = [x for x in posting_lists[0] if all(x in cur_set for cur_set in other_idx_sets)]
+
+        if mask is None:
+            return candidate_idxs
+        return [x for x in candidate_idxs if (mask >> x) & 1]
+
+    def search(self, query:str=None, mask:int=None) -> List[str]:
+        query = sanitize_string(query) if query is not None else ""
+        candidate_idxs = self._get_candidate_idxs(query, mask)
+        if not query:
+            return [self._names[x] for x in candidate_idxs]
+
+        prefix_start = bisect.bisect_left(self._sorted_normalized, query)
+        prefix_end = bisect.bisect_left(self._sorted_normalized, query + _MAX_CHAR, lo=prefix_start)
+        exact_end = bisect.bisect_right(self._sorted_normalized, query, lo=prefix_start, hi=prefix_end)
+        exact_idxs = sorted(self._sorted_idxs[prefix_start:exact_end])
+        prefix_idxs = sorted(self._sorted_idxs[exact_end:prefix_end])
+        if mask is not None:
+            exact_idxs = [x for x in exact_idxs if (mask >> x) & 1]
+            prefix_idxs = [x for x in prefix_idxs if (mask >> x) & 1]
+
+        prefix_idx_set = set(self._sorted_idxs[prefix_start:prefix_end])
+        other_idxs = [x for x in candidate_idxs if x not in prefix_idx_set and query in self._normalized[x]]
+
+        return [self._names[x] for x in exact_idxs + prefix_idxs + other_idxs]
+
+    def fuzzy_search(self, query:str, mask:int=None, max_results:int=10, min_similarity:float=0.2) -> List[str]:
+        # ranks names by how many trigrams they share with the query, so that typos still find something
+        # similarity is the jaccard index of the two sets of trigrams
+        query_trigrams = set(_get_trigrams(sanitize_string(query) or ""))
+        if not query_trigrams:
+            return []
+
+        shared_counts:Dict[int, int] = {}
+        for cur_trigram in query_trigrams:
+            for cur_idx in self._trigram_idxs.get(cur_trigram, []):
+                shared_counts[cur_idx] = shared_counts.get(cur_idx, 0) + 1
+
+        scored = []
+        for cur_idx, num_shared in shared_counts.items():
+            if mask is not None and not (mask >> cur_idx) & 1:
+                continue
+            num_name_trigrams = len(set(_get_trigrams(self._normalized[cur_idx])))
+            similarity = num_shared / (len(query_trigrams) + num_name_trigrams - num_shared)
+            if similarity >= min_similarity:
+                scored.append((-similarity, cur_idx))
+
+        scored.sort()
+        return [self._names[x[1]] for x in scored[:max_results]]
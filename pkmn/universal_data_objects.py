@@ -70,6 +70,10 @@ class Nature(Enum):
 
 
 class BadgeList:
+    # NOTE: badge lists are never changed in place (awarding a badge returns a new object),
+    # so subclasses are expected to be hashable, for use in cache keys
+    __slots__ = ()
+
     def award_badge(self, trainer_name):
         raise NotImplementedError()
 
@@ -98,6 +102,13 @@ class BadgeList:
         raise NotImplementedError()
 
 class StageModifiers:
+    # these get copied for every stat-modifying move in every battle, so skip the per-instance dict
+    __slots__ = (
+        "attack_stage", "defense_stage", "speed_stage", "special_attack_stage", "special_defense_stage",
+        "accuracy_stage", "evasion_stage",
+        "attack_badge_boosts", "defense_badge_boosts", "speed_badge_boosts", "special_badge_boosts",
+    )
+
     def __init__(self,
         attack=0, defense=0, speed=0, special_attack=0, special_defense=0, accuracy=0, evasion=0,
         attack_bb=0, defense_bb=0, speed_bb=0, special_bb=0
@@ -132,6 +143,14 @@ class StageModifiers:
         )
     
     def clear_badge_boosts(self) -> StageModifiers:
+        if (
+            self.attack_badge_boosts == 0 and
+            self.defense_badge_boosts == 0 and
+            self.speed_badge_boosts == 0 and
+            self.special_badge_boosts == 0
+        ):
+            return self
+
         result = self._copy_constructor()
 
         result.attack_badge_boosts = 0
@@ -214,6 +233,13 @@ class StageModifiers:
             self.accuracy_stage == other.accuracy_stage and
             self.evasion_stage == other.evasion_stage
         )
+
+    def __hash__(self):
+        return hash((
+            self.attack_stage, self.defense_stage, self.speed_stage, self.special_attack_stage, self.special_defense_stage,
+            self.accuracy_stage, self.evasion_stage,
+            self.attack_badge_boosts, self.defense_badge_boosts, self.speed_badge_boosts, self.special_badge_boosts,
+        ))
     
     def __repr__(self):
         return f"""
@@ -227,7 +253,53 @@ class StageModifiers:
         """
 
 
+# StageModifiers are never changed in place (every modification returns a new object),
+# so the neutral stages can be shared rather than allocated for every damage calc
+NEUTRAL_STAGE_MODIFIERS = StageModifiers()
+
+
+# The gen specific stat calcs are memoized, as the same stats get recalculated constantly
+# (e.g. the solo mon on every route event, and both mons for every matchup in a battle summary)
+# NOTE: the cache is just cleared when full, since any one route only needs a small working set
+_MAX_STAT_CACHE_SIZE = 20000
+
+
+def _get_stat_cache_key(val):
+    # stat blocks are keyed on their values, since base stats can be edited in place (see calculate_speed_tiers.py)
+    # everything else passed to a stat calc is hashable, and never changed in place
+    if isinstance(val, StatBlock):
+        return (val.hp, val.attack, val.defense, val.special_attack, val.special_defense, val.speed)
+    return val
+
+
+def cached_stat_calc(calc_fn):
+    # must wrap StatBlock.calc_level_stats or StatBlock.calc_battle_stats, in a StatBlock subclass
+    cache = {}
+
+    def wrapper(self:StatBlock, *args, **kwargs):
+        key = (
+            _get_stat_cache_key(self),
+            tuple([_get_stat_cache_key(x) for x in args]),
+            tuple([(x, _get_stat_cache_key(y)) for x, y in kwargs.items()]),
+        )
+        cached = cache.get(key)
+        if cached is not None:
+            # callers always get a new object, since battle stats are sometimes modified in place
+            return cached[0](*cached[1])
+
+        result = calc_fn(self, *args, **kwargs)
+        if len(cache) >= _MAX_STAT_CACHE_SIZE:
+            cache.clear()
+        cache[key] = (type(result), _get_stat_cache_key(result))
+        return result
+
+    return wrapper
+
+
 class StatBlock:
+    # one of these is allocated for every stat calc and every defeated pkmn, so skip the per-instance dict
+    __slots__ = ("_is_stat_xp", "hp", "attack", "defense", "speed", "special_attack", "special_defense")
+
     def __init__(self, hp, attack, defense, special_attack, special_defense, speed, is_stat_xp=False):
         # NOTE: StatBlock subclasses must implement stat_xp/EV caps as necessary
         self._is_stat_xp = is_stat_xp
@@ -277,6 +349,9 @@ class StatBlock:
             self.special_defense == other.special_defense
         )
 
+    def __hash__(self):
+        return hash((self.hp, self.attack, self.defense, self.special_attack, self.special_defense, self.speed))
+
     def serialize(self):
         return {
             const.HP: self.hp,
@@ -448,6 +523,25 @@ class BaseItem:
         self.move_name = move_name
 
 
+class EncounterSlot:
+    def __init__(self, pkmn_name:str, level:int, rate:int):
+        self.pkmn_name = pkmn_name
+        self.level = level
+        # percent chance of this slot being picked, for any given encounter
+        self.rate = rate
+
+
+class EncounterTable:
+    def __init__(self, map_name:str, method:str, base_rate:int, slots:List[EncounterSlot]):
+        self.map_name = map_name
+        self.method = method
+        self.base_rate = base_rate
+        self.slots = slots
+
+    def __str__(self):
+        return f"{self.map_name} ({self.method})"
+
+
 class Move:
     def __init__(
         self,
@@ -541,6 +635,22 @@ class FieldStatus:
         self.worry_seed = worry_seed
         self.gastro_acid = gastro_acid
         self.slow_start = slow_start
+
+    def _as_tuple(self):
+        return (
+            self.light_screen, self.reflect, self.gravity, self.magnet_rise, self.miracle_eye, self.power_trick,
+            self.roost, self.tailwind, self.trick_room, self.worry_seed, self.gastro_acid, self.slow_start,
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, FieldStatus):
+            return False
+
+        return self._as_tuple() == other._as_tuple()
+
+    def __hash__(self):
+        # like StageModifiers, these are never changed in place (apply_move returns a new object)
+        return hash(self._as_tuple())
     
     def _copy(self):
         return FieldStatus(
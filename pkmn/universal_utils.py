@@ -1,8 +1,9 @@
 
+import bisect
 import math
 import logging
-from typing import List
-from pkmn.universal_data_objects import EnemyPkmn, Trainer, TrainerTimingStats
+from typing import List, Tuple
+from pkmn.universal_data_objects import EncounterSlot, EncounterTable, EnemyPkmn, StatBlock, Trainer, TrainerTimingStats
 
 from utils.constants import const
 
@@ -99,21 +100,18 @@ class LevelLookup:
         return self.thresholds[target_level - 1]
     
     def get_level_info(self, cur_xp):
-        did_break = False
-        for cur_level, req_exp in enumerate(self.thresholds):
-            if cur_xp < req_exp:
-                # list indices are 0-index, levels are 1-index
-                # so breaking out like this means cur_level is the correct level of the pokemon
-                did_break = True
-                break
-        
-        if not did_break:
-            cur_level = 100
-        
-        if cur_level == 100:
+        # thresholds are sorted, so the index of the first threshold above cur_xp is the current level
+        # list indices are 0-index, levels are 1-index, so that index is the correct level of the pokemon
+        cur_level = bisect.bisect_right(self.thresholds, cur_xp)
+
+        if cur_level >= 100:
             return 100, 0
 
-        return cur_level, req_exp - cur_xp
+        return cur_level, self.thresholds[cur_level] - cur_xp
+
+    def get_level_info_batch(self, all_xp:List[int]) -> List[Tuple[int, int]]:
+        # convenience for scripts that need the levels of many pkmn at once (e.g. speed tier sweeps)
+        return [self.get_level_info(cur_xp) for cur_xp in all_xp]
 
 level_lookups = {
     const.GROWTH_RATE_FAST: LevelLookup(const.GROWTH_RATE_FAST),
@@ -132,3 +130,75 @@ def experience_per_second(timing_obj:TrainerTimingStats, pmkn_list:List[EnemyPkm
     )
     result = round(result)
     return str(result)
+
+
+def get_possible_encounters(encounter_table:EncounterTable, repel_level:int=None) -> List[EncounterSlot]:
+    # a repel stops any encounter with a wild pkmn lower level than the lead pkmn
+    # blocked encounters just don't happen, so the remaining slots are what every actual encounter is picked from
+    if repel_level is None:
+        return list(encounter_table.slots)
+    return [x for x in encounter_table.slots if x.level >= repel_level]
+
+
+def calc_expected_encounter_yield(gen, encounter_table:EncounterTable, repel_level:int=None) -> Tuple[float, StatBlock]:
+    # returns the average xp and stat xp gained per wild battle, when fighting whatever shows up from the encounter table
+    # gen is the CurrentGen the table comes from. Returns None if nothing can be encountered at all
+    possible_encounters = get_possible_encounters(encounter_table, repel_level=repel_level)
+    total_rate = sum([x.rate for x in possible_encounters])
+    if total_rate <= 0:
+        return None
+
+    expected_xp = 0
+    expected_stat_xp = [0, 0, 0, 0, 0, 0]
+    for cur_slot in possible_encounters:
+        chance = cur_slot.rate / total_rate
+        expected_xp += chance * calc_xp_yield(gen.pkmn_db().get_pkmn(cur_slot.pkmn_name).base_xp, cur_slot.level, False)
+
+        stat_xp_yield = gen.get_stat_xp_yield(cur_slot.pkmn_name, 1, None)
+        for stat_idx, stat_val in enumerate([
+            stat_xp_yield.hp,
+            stat_xp_yield.attack,
+            stat_xp_yield.defense,
+            stat_xp_yield.special_attack,
+            stat_xp_yield.special_defense,
+            stat_xp_yield.speed,
+        ]):
+            expected_stat_xp[stat_idx] += chance * stat_val
+
+    return expected_xp, StatBlock(*expected_stat_xp, is_stat_xp=True)
+
+
+def get_expected_encounters(encounter_table:EncounterTable, quantity:int, repel_level:int=None) -> List[EncounterSlot]:
+    # Turns the encounter table into a fixed list of quantity encounters, matching the encounter rates as closely as possible
+    # Slots are allocated by largest remainder, and then interleaved (smooth weighted round robin) rather than grouped,
+    # so that level ups part way through the grind happen around the same point they would in game
+    possible_encounters = {}
+    for cur_slot in get_possible_encounters(encounter_table, repel_level=repel_level):
+        # the same mon at the same level can show up in multiple slots, which are all equivalent
+        slot_key = (cur_slot.pkmn_name, cur_slot.level)
+        if slot_key in possible_encounters:
+            possible_encounters[slot_key].rate += cur_slot.rate
+        else:
+            possible_encounters[slot_key] = EncounterSlot(cur_slot.pkmn_name, cur_slot.level, cur_slot.rate)
+
+    slots = list(possible_encounters.values())
+    total_rate = sum([x.rate for x in slots])
+    if quantity <= 0 or total_rate <= 0:
+        return []
+
+    counts = [(x.rate * quantity) // total_rate for x in slots]
+    remainders = sorted(range(len(slots)), key=lambda x: -((slots[x].rate * quantity) % total_rate))
+    for slot_idx in remainders[:quantity - sum(counts)]:
+        counts[slot_idx] += 1
+
+    result = []
+    cur_weights = [0 for _ in slots]
+    for _ in range(quantity):
+        for slot_idx, cur_count in enumerate(counts):
+            cur_weights[slot_idx] += cur_count
+        next_idx = max(range(len(slots)), key=lambda x: cur_weights[x])
+        cur_weights[next_idx] -= quantity
+        result.append(slots[next_idx])
+
+    return result
+
@@ -146,10 +146,12 @@ class RecorderController:
         to_delete = []
 
         # find the save points
-        test_obj:routing.route_events.EventGroup = self._controller.get_previous_event()
-        while test_obj is not None and test_obj.event_definition.save is None:
-            to_delete.append(test_obj.group_id)
-            test_obj = self._controller.get_previous_event(test_obj.group_id)
+        test_obj:routing.route_events.EventGroup = None
+        for cur_event in self._controller.iter_events(reverse=True, enabled_only=True):
+            if cur_event.event_definition.save is not None:
+                test_obj = cur_event
+                break
+            to_delete.append(cur_event.group_id)
 
         logger.info(f"Cleaning up {len(to_delete)} events for reset")
         self._controller.delete_events(to_delete)
@@ -175,11 +177,12 @@ class RecorderController:
     def lost_trainer_battle(self, trainer_name):
         # If we initiate a trainer battle, lose to that trainer, and _don't_ reset
         # Need to remove the event representing that trainer fight
-        last_obj = test_obj = self._controller.get_previous_event()
-        while not self.is_trainer_event(test_obj, trainer_name):
-            if test_obj is None:
+        last_obj = self._controller.get_previous_event()
+        test_obj = None
+        for cur_event in self._controller.iter_events(reverse=True, enabled_only=True):
+            if self.is_trainer_event(cur_event, trainer_name):
+                test_obj = cur_event
                 break
-            test_obj = self._controller.get_previous_event(test_obj.group_id)
         
         if test_obj is None:
             msg = f"{const.RECORDING_ERROR_FRAGMENT} Could not find trainer event {trainer_name} to remove after losing to them"
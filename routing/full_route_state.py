@@ -4,7 +4,6 @@ import pkmn.universal_utils
 import pkmn.universal_data_objects
 import pkmn.gen_factory
 from routing.state_objects import Inventory, SoloPokemon
-from copy import copy
 
 from pkmn.gen_factory import current_gen_info
 
@@ -114,7 +113,7 @@ def _take_vitamin(cur_pkmn:SoloPokemon, vit_name, badges, force=False):
     vit_result_cap = pkmn.gen_factory.current_gen_info().get_vitamin_value_cap()
     vit_boost = pkmn.gen_factory.current_gen_info().get_vitamin_amount()
 
-    final_realized_stat_xp = copy(cur_pkmn.unrealized_stat_xp)
+    final_realized_stat_xp = cur_pkmn.unrealized_stat_xp
     for boosted_stat in pkmn.gen_factory.current_gen_info().get_stats_boosted_by_vitamin(vit_name):
         if boosted_stat == const.HP:
             if cur_pkmn.unrealized_stat_xp.hp >= vit_use_cap and not force:
@@ -210,6 +209,7 @@ class RouteState:
         self.solo_pkmn = solo_pkmn
         self.badges = badges
         self.inventory = inventory
+        self._hash = None
 
     def __eq__(self, other):
         if not isinstance(other, RouteState):
@@ -221,6 +221,12 @@ class RouteState:
             self.inventory == other.inventory
         )
 
+    def __hash__(self):
+        # cheap fingerprint of the state, used to quickly rule out states that can't be equal
+        if self._hash is None:
+            self._hash = hash((self.solo_pkmn, self.badges.num_badges(), self.inventory))
+        return self._hash
+
     def serialize(self):
         return {
             const.SOLO_MON_KEY: self.solo_pkmn.serialize(),
@@ -12,6 +12,13 @@ from pkmn.pkmn_db import sanitize_string
 logger = logging.getLogger(__name__)
 
 event_id_counter = 0
+# event items don't take ids from the counter. Their ids come from their group and position instead, so that
+# re-applying a group gives its items the same ids as before. Always negative, so they never collide with group ids
+_MAX_ITEMS_PER_GROUP = 1 << 20
+
+
+def get_event_item_id(group_id, item_idx):
+    return -(group_id * _MAX_ITEMS_PER_GROUP + item_idx + 1)
 
 
 class InventoryEventDefinition:
@@ -129,6 +136,27 @@ class WildPkmnEventDefinition:
         return f"{prefix} {self.name}, LV: {self.level}"
 
 
+class EncounterGrindEventDefinition:
+    def __init__(self, map_name, method, quantity, repel_level=None):
+        self.map_name = map_name
+        self.method = method
+        self.quantity = quantity
+        self.repel_level = repel_level
+
+    def serialize(self):
+        return [self.map_name, self.method, self.quantity, self.repel_level]
+
+    @staticmethod
+    def deserialize(raw_val):
+        if not raw_val:
+            return None
+        return EncounterGrindEventDefinition(raw_val[0], raw_val[1], raw_val[2], repel_level=raw_val[3])
+
+    def __str__(self):
+        repel_str = f", Repel LV: {self.repel_level}" if self.repel_level else ""
+        return f"Grind {self.map_name} ({self.method}) x{self.quantity}{repel_str}"
+
+
 class LearnMoveEventDefinition:
     def __init__(self, move_to_learn, destination, source, level=const.LEVEL_ANY, mon=None):
         self.move_to_learn = move_to_learn
@@ -377,7 +405,7 @@ class EvolutionEventDefinition:
 
 
 class EventDefinition:
-    def __init__(self, enabled=True, rare_candy=None, vitamin=None, trainer_def=None, wild_pkmn_info=None, item_event_def=None, learn_move=None, hold_item=None, save=None, heal=None, blackout=None, evolution=None, notes="", tags=None):
+    def __init__(self, enabled=True, rare_candy=None, vitamin=None, trainer_def=None, wild_pkmn_info=None, item_event_def=None, learn_move=None, hold_item=None, save=None, heal=None, blackout=None, evolution=None, encounter_grind=None, notes="", tags=None):
         self.enabled = enabled
         self.rare_candy:RareCandyEventDefinition = rare_candy
         self.vitamin:VitaminEventDefinition = vitamin
@@ -386,6 +414,8 @@ class EventDefinition:
         self._second_trainer_obj = None
         self.wild_pkmn_info:WildPkmnEventDefinition = wild_pkmn_info
         self._wild_pkmn = None
+        self.encounter_grind:EncounterGrindEventDefinition = encounter_grind
+        self._encounter_grind_pkmn = None
         self.item_event_def:InventoryEventDefinition = item_event_def
         self.learn_move:LearnMoveEventDefinition = learn_move
         self.hold_item:HoldItemEventDefinition = hold_item
@@ -421,7 +451,29 @@ class EventDefinition:
                 self._wild_pkmn = current_gen_info().create_wild_pkmn(self.wild_pkmn_info.name, self.wild_pkmn_info.level)
         return self._wild_pkmn
 
+    def get_encounter_grind_pkmn(self):
+        if self._encounter_grind_pkmn is None and self.encounter_grind is not None:
+            encounter_table = current_gen_info().encounter_db().get_table(self.encounter_grind.map_name, self.encounter_grind.method)
+            if encounter_table is None:
+                raise ValueError(f"Could not find encounter table for map: '{self.encounter_grind.map_name}' ({self.encounter_grind.method}), from encounter_db for version: {current_gen_info().version_name()}")
+
+            # same as wild pkmn, each unique mon is only created once, and then referenced as many times as it's fought
+            created_pkmn = {}
+            self._encounter_grind_pkmn = []
+            for cur_slot in universal_utils.get_expected_encounters(encounter_table, self.encounter_grind.quantity, repel_level=self.encounter_grind.repel_level):
+                slot_key = (cur_slot.pkmn_name, cur_slot.level)
+                if slot_key not in created_pkmn:
+                    created_pkmn[slot_key] = current_gen_info().create_wild_pkmn(cur_slot.pkmn_name, cur_slot.level)
+                self._encounter_grind_pkmn.append(created_pkmn[slot_key])
+        return self._encounter_grind_pkmn
+
     def get_pokemon_list(self, definition_order=False, include_definition_idx=False):
+        encounter_grind_pkmn = self.get_encounter_grind_pkmn()
+        if encounter_grind_pkmn is not None:
+            if include_definition_idx:
+                return list(enumerate(encounter_grind_pkmn))
+            return list(encounter_grind_pkmn)
+
         wild_pkmn = self.get_wild_pkmn()
         if wild_pkmn is not None:
             # NOTE: technically bad, it's just multiple references to the same object
@@ -485,6 +537,8 @@ class EventDefinition:
             return const.TASK_VITAMIN
         elif self.wild_pkmn_info is not None:
             return const.TASK_FIGHT_WILD_PKMN
+        elif self.encounter_grind is not None:
+            return const.TASK_GRIND_ENCOUNTERS
         elif self.trainer_def is not None:
             return const.TASK_TRAINER_BATTLE
         elif self.item_event_def is not None:
@@ -520,6 +574,8 @@ class EventDefinition:
             return f"Vitamin: {self.vitamin.vitamin} x1"
         elif self.wild_pkmn_info is not None:
             return str(self.wild_pkmn_info)
+        elif self.encounter_grind is not None:
+            return str(self.encounter_grind)
         elif self.trainer_def is not None:
             trainer = self.get_first_trainer_obj()
             second_trainer = self.get_second_trainer_obj()
@@ -552,6 +608,8 @@ class EventDefinition:
             return str(self.vitamin)
         elif self.wild_pkmn_info is not None:
             return str(self.wild_pkmn_info)
+        elif self.encounter_grind is not None:
+            return str(self.encounter_grind)
         elif self.trainer_def is not None:
             trainer = self.get_first_trainer_obj()
             second_trainer = self.get_second_trainer_obj()
@@ -604,6 +662,10 @@ class EventDefinition:
 
         return True
 
+    def get_search_entry(self):
+        # the event type, and the (lower-cased) text that do_render() searches through
+        return (self.get_event_type(), (self.get_item_label().lower(), self.notes.lower()))
+
     def toggle_highlight(self):
         if const.HIGHLIGHT_LABEL in self.tags:
             self.tags.remove(const.HIGHLIGHT_LABEL)
@@ -626,6 +688,8 @@ class EventDefinition:
             result.update({const.TASK_TRAINER_BATTLE: self.trainer_def.serialize()})
         elif self.wild_pkmn_info is not None:
             result.update({const.TASK_FIGHT_WILD_PKMN: self.wild_pkmn_info.serialize()})
+        elif self.encounter_grind is not None:
+            result.update({const.TASK_GRIND_ENCOUNTERS: self.encounter_grind.serialize()})
         elif self.item_event_def is not None:
             result.update({const.INVENTORY_EVENT_DEFINITON: self.item_event_def.serialize()})
         elif self.learn_move is not None:
@@ -661,6 +725,7 @@ class EventDefinition:
             heal=HealEventDefinition.deserialize(raw_val.get(const.TASK_HEAL)),
             blackout=BlackoutEventDefinition.deserialize(raw_val.get(const.TASK_BLACKOUT)),
             evolution=EvolutionEventDefinition.deserialize(raw_val.get(const.TASK_EVOLUTION)),
+            encounter_grind=EncounterGrindEventDefinition.deserialize(raw_val.get(const.TASK_GRIND_ENCOUNTERS)),
         )
         if result.wild_pkmn_info is not None:
             result.trainer_def = None
@@ -671,10 +736,8 @@ class EventItem:
     """
     This class effectively functions as the conversion layer between EventDefinitions and the RouteState object.
     """
-    def __init__(self, parent, event_definition:EventDefinition, to_defeat_mon=None, cur_state=None, exp_split_num=1, pay_day_amount=0, defeating_trainer=False):
-        global event_id_counter
-        self.group_id = event_id_counter
-        event_id_counter += 1
+    def __init__(self, parent, event_definition:EventDefinition, item_idx, to_defeat_mon=None, cur_state=None, exp_split_num=1, pay_day_amount=0, defeating_trainer=False):
+        self.group_id = get_event_item_id(parent.group_id, item_idx)
 
         self._enabled = True
         self.parent = parent
@@ -695,6 +758,24 @@ class EventItem:
     def contains_id(self, id_val):
         return self.group_id == id_val
 
+    def can_reuse(self, event_definition:EventDefinition, cur_state:RouteState, to_defeat_mon=None, exp_split_num=1, pay_day_amount=0, defeating_trainer=False):
+        # whether applying an item with these inputs would produce exactly this item again
+        # definitions are compared by identity, as edited definitions are always replaced rather than modified
+        # the only exception is the enabled flag, which gets toggled in place
+        if (
+            self.event_definition is not event_definition or
+            self._enabled != event_definition.enabled or
+            self.exp_split_num != exp_split_num or
+            self.pay_day_amount != pay_day_amount or
+            self.defeating_trainer != defeating_trainer or
+            not (self.to_defeat_mon is to_defeat_mon or self.to_defeat_mon == to_defeat_mon)
+        ):
+            return False
+
+        if self.init_state is cur_state:
+            return True
+        return self.init_state is not None and hash(self.init_state) == hash(cur_state) and self.init_state == cur_state
+
     def apply(self, cur_state):
         self.init_state = cur_state
         self._enabled = self.event_definition.enabled
@@ -714,6 +795,9 @@ class EventItem:
                 else:
                     defeated_trainer_name = None
                 render_trainer_name = self.event_definition.trainer_def.trainer_name
+            elif None is not self.event_definition.encounter_grind:
+                defeated_trainer_name = None
+                render_trainer_name = "WildPkmn"
             else:
                 defeated_trainer_name = None
                 render_trainer_name = "TrainerPkmn" if self.event_definition.wild_pkmn_info.trainer_pkmn else "WildPkmn"
@@ -874,11 +958,36 @@ class EventGroup:
         self.error_messages = []
         self.level_up_learn_event_defs = []
 
+        # definitions for the items that don't just use the event definition, created once so that those items can be reused too
+        self._empty_item_definition = EventDefinition()
+        self._learn_move_item_definitions:Dict[int, EventDefinition] = {}
+        self._prev_event_items:List[EventItem] = []
+
+    def _get_learn_move_item_definition(self, learn_move:LearnMoveEventDefinition) -> EventDefinition:
+        result = self._learn_move_item_definitions.get(id(learn_move))
+        if result is None or result.learn_move is not learn_move:
+            result = EventDefinition(learn_move=learn_move)
+            self._learn_move_item_definitions[id(learn_move)] = result
+        return result
+
+    def _add_event_item(self, event_definition:EventDefinition, cur_state:RouteState, **kwargs) -> EventItem:
+        # reuse the item previously calculated at the same position, if its inputs haven't changed
+        item_idx = len(self.event_items)
+        if item_idx < len(self._prev_event_items) and self._prev_event_items[item_idx].can_reuse(event_definition, cur_state, **kwargs):
+            result = self._prev_event_items[item_idx]
+        else:
+            result = EventItem(self, event_definition, item_idx, cur_state=cur_state, **kwargs)
+
+        self.event_items.append(result)
+        return result
+
     def apply(self, cur_state:RouteState, level_up_learn_event_defs=None):
         try:
             self.name = self.event_definition.get_label()
             self.init_state = cur_state
             self.pkmn_after_levelups = []
+            if self.event_items:
+                self._prev_event_items = self.event_items
             self.event_items = []
             self._enabled = self.event_definition.enabled
 
@@ -893,17 +1002,25 @@ class EventGroup:
             else:
                 self.level_up_learn_event_defs = level_up_learn_event_defs
 
-            if self.event_definition.trainer_def is not None or self.event_definition.wild_pkmn_info is not None:
+            if (
+                self.event_definition.trainer_def is not None or
+                self.event_definition.wild_pkmn_info is not None or
+                self.event_definition.encounter_grind is not None
+            ):
                 pkmn_counter = {}
                 pkmn_to_fight = self.event_definition.get_pokemon_list(include_definition_idx=True)
+                is_wild_battle = self.event_definition.trainer_def is None
+                if len(pkmn_to_fight) == 0:
+                    # e.g. grinding with a repel that blocks every encounter. Same as an empty rare candy event
+                    self._add_event_item(self._empty_item_definition, cur_state)
                 for order_idx, (definition_idx, cur_pkmn) in enumerate(pkmn_to_fight):
-                    if self.event_definition.wild_pkmn_info is not None or not self.event_definition.trainer_def.exp_split:
+                    if is_wild_battle or not self.event_definition.trainer_def.exp_split:
                         exp_split = 1
                     else:
                         exp_split = self.event_definition.trainer_def.exp_split[definition_idx]
 
                     if (
-                        self.event_definition.wild_pkmn_info is not None or
+                        is_wild_battle or
                         not isinstance(self.event_definition.trainer_def.pay_day_amount, int) or
                         order_idx != (len(pkmn_to_fight) - 1)
                     ):
@@ -912,7 +1029,7 @@ class EventGroup:
                         pay_day_amount = self.event_definition.trainer_def.pay_day_amount
 
                     defeating_trainer = order_idx == (len(pkmn_to_fight) - 1)
-                    self.event_items.append(EventItem(self, self.event_definition, to_defeat_mon=cur_pkmn, cur_state=cur_state, exp_split_num=exp_split, pay_day_amount=pay_day_amount, defeating_trainer=defeating_trainer))
+                    self._add_event_item(self.event_definition, cur_state, to_defeat_mon=cur_pkmn, exp_split_num=exp_split, pay_day_amount=pay_day_amount, defeating_trainer=defeating_trainer)
                     pkmn_counter[cur_pkmn.name] = pkmn_counter.get(cur_pkmn.name, 0) + 1
 
                     next_state = self.event_items[-1].final_state
@@ -921,7 +1038,7 @@ class EventGroup:
                         # learn moves, if needed
                         for learn_move in self.level_up_learn_event_defs:
                             if learn_move.level == next_state.solo_pkmn.cur_level:
-                                self.event_items.append(EventItem(self, EventDefinition(learn_move=learn_move), cur_state=next_state))
+                                self._add_event_item(self._get_learn_move_item_definition(learn_move), next_state)
                                 next_state = self.event_items[-1].final_state
                         # keep track of pkmn coming out
                         if order_idx + 1 < len(pkmn_to_fight):
@@ -935,28 +1052,28 @@ class EventGroup:
             elif self.event_definition.rare_candy is not None:
                 if self.event_definition.rare_candy.amount <= 0:
                     #  if there are no candies, create a dummy empty notes event just to keep things happy
-                    self.event_items.append(EventItem(self, EventDefinition(), cur_state=cur_state))
+                    self._add_event_item(self._empty_item_definition, cur_state)
 
                 for _ in range(self.event_definition.rare_candy.amount):
-                    self.event_items.append(EventItem(self, self.event_definition, cur_state=cur_state))
+                    self._add_event_item(self.event_definition, cur_state)
                     # TODO: duplicated logic for handling level up moves. How can this be unified?
                     next_state = self.event_items[-1].final_state
                     if next_state.solo_pkmn.cur_level != cur_state.solo_pkmn.cur_level:
                         for learn_move in self.level_up_learn_event_defs:
                             if learn_move.level == next_state.solo_pkmn.cur_level:
-                                self.event_items.append(EventItem(self, EventDefinition(learn_move=learn_move), cur_state=next_state))
+                                self._add_event_item(self._get_learn_move_item_definition(learn_move), next_state)
                                 next_state = self.event_items[-1].final_state
                     cur_state = next_state
             elif self.event_definition.vitamin is not None:
                 for _ in range(self.event_definition.vitamin.amount):
-                    self.event_items.append(EventItem(self, self.event_definition, cur_state=cur_state))
+                    self._add_event_item(self.event_definition, cur_state)
                     cur_state = self.event_items[-1].final_state
             else:
                 # assumption: can only have at most one level up per event group of non-trainer battle types
                 # This allows us to simplify the level up move learn checks
-                self.event_items.append(EventItem(self, self.event_definition, cur_state=cur_state))
+                self._add_event_item(self.event_definition, cur_state)
                 if self.level_up_learn_event_defs:
-                    self.event_items.append(EventItem(self, EventDefinition(learn_move=self.level_up_learn_event_defs[0]), cur_state=self.event_items[0].final_state))
+                    self._add_event_item(self._get_learn_move_item_definition(self.level_up_learn_event_defs[0]), self.event_items[0].final_state)
 
             if len(self.event_items) == 0:
                 raise ValueError(f"Something went wrong generating event group: {self.event_definition}")
@@ -1055,6 +1172,13 @@ class EventGroup:
 
         return self.event_definition.do_render(search=search, filter_types=filter_types)
 
+    def get_search_entries(self):
+        # everything do_render() checks, starting with the main definition
+        result = [self.event_definition.get_search_entry()]
+        for learn_move in self.level_up_learn_event_defs:
+            result.append(EventDefinition(learn_move=learn_move).get_search_entry())
+        return result
+
     def get_tags(self):
         if self.has_errors():
             return [const.EVENT_TAG_ERRORS]
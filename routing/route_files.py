@@ -0,0 +1,68 @@
+import json
+import os
+import zlib
+
+from utils.constants import const
+
+# NOTE: bump this whenever the layout of compact route files changes
+_COMPACT_FORMAT = 1
+_COMPACT_MAGIC = b"PKXR"
+# routes get saved constantly while recording, so this is a middle ground between speed and size
+_COMPRESSION_LEVEL = 6
+
+
+def is_compact_route_path(route_path) -> bool:
+    return os.path.splitext(route_path)[1] == const.COMPACT_ROUTE_EXTENSION
+
+
+def encode_route(raw_route:dict) -> bytes:
+    # minified json, compressed. Nearly all of the size of a route comes from the same keys and names
+    # being repeated for every event, and the compression stores each repeat as a short back-reference
+    # which ends up a lot smaller (and faster) than interning the strings ourselves
+    minified = json.dumps(raw_route, separators=(",", ":")).encode("utf-8")
+    return _COMPACT_MAGIC + bytes([_COMPACT_FORMAT]) + zlib.compress(minified, _COMPRESSION_LEVEL)
+
+
+def decode_route(data:bytes) -> dict:
+    if not data.startswith(_COMPACT_MAGIC):
+        raise ValueError("Not a compact route file")
+
+    format_version = data[len(_COMPACT_MAGIC)]
+    if format_version != _COMPACT_FORMAT:
+        raise ValueError(f"Unsupported compact route format: {format_version}")
+
+    return json.loads(zlib.decompress(data[len(_COMPACT_MAGIC) + 1:]).decode("utf-8"))
+
+
+def read_route(route_path) -> dict:
+    # reads the raw (i.e. serialized) route, in either format
+    if is_compact_route_path(route_path):
+        with open(route_path, 'rb') as f:
+            return decode_route(f.read())
+
+    with open(route_path, 'r') as f:
+        return json.load(f)
+
+
+def write_route(route_path, raw_route:dict):
+    # the format is picked based on the extension of the path
+    if is_compact_route_path(route_path):
+        with open(route_path, 'wb') as f:
+            f.write(encode_route(raw_route))
+    else:
+        with open(route_path, 'w') as f:
+            json.dump(raw_route, f, indent=4)
+
+
+def convert_route(route_path, dest_path=None) -> str:
+    # converts between the json and compact formats. Without a destination, the route is written next to the original,
+    # with the extension of the other format
+    if dest_path is None:
+        base_path = os.path.splitext(route_path)[0]
+        if is_compact_route_path(route_path):
+            dest_path = base_path + const.ROUTE_EXTENSION
+        else:
+            dest_path = base_path + const.COMPACT_ROUTE_EXTENSION
+
+    write_route(dest_path, read_route(route_path))
+    return dest_path
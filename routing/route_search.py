@@ -0,0 +1,200 @@
+from collections import Counter
+from typing import Dict, List, Set
+
+from utils.constants import const
+from routing import route_events
+
+# searches are matched against every substring of this length, anything shorter just checks every event
+_NGRAM_SIZE = 3
+
+
+def _get_ngrams(text) -> Set[str]:
+    return {text[idx:idx + _NGRAM_SIZE] for idx in range(len(text) - _NGRAM_SIZE + 1)}
+
+
+class RouteSearchResults:
+    # Which events are shown for a single search string and set of filter types
+    # folders are shown as long as any event inside of them (at any depth) matches
+    def __init__(self, key=None, matching_ids:Set[int]=None, folder_match_counts:Dict[int, int]=None):
+        # no key means there is no search or filter at all, so everything is shown
+        self.key = key
+        self.matching_ids = matching_ids
+        self.folder_match_counts = folder_match_counts
+
+    def do_render(self, event_obj):
+        if self.key is None:
+            return True
+
+        if isinstance(event_obj, route_events.EventFolder):
+            return self.folder_match_counts.get(event_obj.group_id, 0) > 0
+
+        return event_obj.group_id in self.matching_ids
+
+
+class RouteSearchIndex:
+    # Inverted index over the labels, notes, event types, and error status of every event group in the route
+    # Changed groups are only re-indexed once a search actually needs them, and only the groups that could possibly match
+    # a search are checked against it, using the same rules as EventGroup.do_render()
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._groups:Dict[int, route_events.EventGroup] = {}
+        self._entries:Dict[int, list] = {}
+        self._error_ids = set()
+        self._type_lookup:Dict[str, Set[int]] = {}
+        self._ngram_lookup:Dict[str, Set[int]] = {}
+
+        # groups which have changed since they were last indexed
+        self._changed_groups:Dict[int, route_events.EventGroup] = {}
+        # the most recent results, valid until the index changes
+        self._results:RouteSearchResults = None
+
+    def mark_changed(self, event_group:route_events.EventGroup):
+        self._changed_groups[event_group.group_id] = event_group
+
+    def remove_group(self, group_id):
+        self._changed_groups.pop(group_id, None)
+        if group_id in self._groups:
+            self._unindex_group(group_id)
+            self._results = None
+
+    def clear_results(self):
+        # for events being moved to a different folder, which changes the folder match counts
+        self._results = None
+
+    def _index_group(self, event_group:route_events.EventGroup, entries, has_errors):
+        group_id = event_group.group_id
+        self._groups[group_id] = event_group
+        self._entries[group_id] = entries
+        if has_errors:
+            self._error_ids.add(group_id)
+
+        for event_type, texts in entries:
+            self._type_lookup.setdefault(event_type, set()).add(group_id)
+            for cur_text in texts:
+                for cur_ngram in _get_ngrams(cur_text):
+                    self._ngram_lookup.setdefault(cur_ngram, set()).add(group_id)
+
+    def _unindex_group(self, group_id):
+        del self._groups[group_id]
+        self._error_ids.discard(group_id)
+
+        for event_type, texts in self._entries.pop(group_id):
+            self._discard_from_lookup(self._type_lookup, event_type, group_id)
+            for cur_text in texts:
+                for cur_ngram in _get_ngrams(cur_text):
+                    self._discard_from_lookup(self._ngram_lookup, cur_ngram, group_id)
+
+    @staticmethod
+    def _discard_from_lookup(lookup:Dict[str, Set[int]], key, group_id):
+        cur_ids = lookup.get(key)
+        if cur_ids is None:
+            return
+
+        cur_ids.discard(group_id)
+        if not cur_ids:
+            del lookup[key]
+
+    def _sync(self):
+        # most re-calculated groups end up with the same labels and errors, and don't invalidate anything
+        for group_id, event_group in self._changed_groups.items():
+            entries = event_group.get_search_entries()
+            has_errors = event_group.has_errors()
+            if self._entries.get(group_id) == entries and (group_id in self._error_ids) == has_errors:
+                continue
+
+            if group_id in self._groups:
+                self._unindex_group(group_id)
+            self._index_group(event_group, entries, has_errors)
+            self._results = None
+
+        self._changed_groups = {}
+
+    def get_results(self, search=None, filter_types:List[str]=None) -> RouteSearchResults:
+        if search is None and filter_types is None:
+            return RouteSearchResults()
+
+        self._sync()
+        if search is not None:
+            search = search.lower()
+        if filter_types is not None:
+            filter_types = frozenset(filter_types)
+
+        key = (search, filter_types)
+        prev_results = self._results
+        if prev_results is not None and prev_results.key == key:
+            return prev_results
+
+        candidate_ids = self._get_candidate_ids(search, filter_types)
+        # while typing, each search contains the previous one, so it can only match a subset of the same events
+        if (
+            prev_results is not None and
+            prev_results.key[1] == filter_types and
+            prev_results.key[0] is not None and
+            search is not None and
+            prev_results.key[0] in search
+        ):
+            if candidate_ids is None:
+                candidate_ids = prev_results.matching_ids
+            else:
+                candidate_ids &= prev_results.matching_ids
+
+        if search is None:
+            # the type and error lookups are exact, so there's nothing left to check
+            matching_ids = candidate_ids
+        else:
+            if candidate_ids is None:
+                candidate_ids = self._entries.keys()
+            matching_ids = set(x for x in candidate_ids if self._is_match(x, search, filter_types))
+
+        self._results = RouteSearchResults(key, matching_ids, self._get_folder_match_counts(matching_ids))
+        return self._results
+
+    def _get_candidate_ids(self, search, filter_types) -> Set[int]:
+        # returns None when neither the search nor the filters rule anything out
+        result = None
+        if filter_types is not None:
+            result = set()
+            for cur_type in filter_types:
+                result |= self._type_lookup.get(cur_type, set())
+            if const.ERROR_SEARCH in filter_types:
+                result |= self._error_ids
+
+        if search is not None and len(search) >= _NGRAM_SIZE:
+            ngram_matches = sorted([self._ngram_lookup.get(x, set()) for x in _get_ngrams(search)], key=len)
+            if result is None:
+                result = set(ngram_matches[0])
+            else:
+                result &= ngram_matches[0]
+            for cur_ids in ngram_matches[1:]:
+                if not result:
+                    break
+                result &= cur_ids
+
+        return result
+
+    def _is_match(self, group_id, search, filter_types) -> bool:
+        entries = self._entries[group_id]
+        if filter_types is not None and const.ERROR_SEARCH in filter_types and group_id in self._error_ids:
+            # same workaround as EventGroup.do_render(), events with errors only have to match the search string
+            entries = entries[:1]
+            filter_types = None
+
+        for event_type, texts in entries:
+            if filter_types is not None and event_type not in filter_types:
+                continue
+            for cur_text in texts:
+                if search in cur_text:
+                    return True
+
+        return False
+
+    def _get_folder_match_counts(self, matching_ids:Set[int]) -> Dict[int, int]:
+        # count the matches directly inside each folder first, so that each folder is only walked up from once
+        result = {}
+        for cur_folder, num_matches in Counter(self._groups[x].parent for x in matching_ids).items():
+            while cur_folder is not None:
+                result[cur_folder.group_id] = result.get(cur_folder.group_id, 0) + num_matches
+                cur_folder = cur_folder.parent
+        return result
@@ -1,7 +1,6 @@
 import os
-import json
 import logging
-from typing import Dict, Tuple, List
+from typing import Dict, Iterator, Tuple, List
 
 from utils.constants import const
 from pkmn import universal_data_objects
@@ -9,11 +8,68 @@ from pkmn.gen_factory import current_gen_info, change_version
 from utils.io_utils import sanitize_string
 from utils import io_utils
 from routing import route_events
+from routing import route_files
+from routing import route_search
 from routing import full_route_state
 
 logger = logging.getLogger(__name__)
 
 
+class RouteChanges:
+    # Which events (by id) have changed since the changes were last collected, so that views of the route
+    # only need to update the affected events, rather than re-drawing the whole thing
+    # once a full refresh is needed (e.g. a new route was loaded), individual changes aren't tracked anymore
+    def __init__(self, full_refresh=False):
+        self.full_refresh = full_refresh
+        self.inserted_ids = set()
+        self.removed_ids = set()
+        # events which are now in a different position, or a different folder
+        self.moved_ids = set()
+        # events whose own contents changed: states, labels, tags, enabled status, etc.
+        self.updated_ids = set()
+
+    def is_empty(self):
+        return not (self.full_refresh or self.inserted_ids or self.removed_ids or self.moved_ids or self.updated_ids)
+
+    def set_full_refresh(self):
+        self.full_refresh = True
+        self.inserted_ids = set()
+        self.removed_ids = set()
+        self.moved_ids = set()
+        self.updated_ids = set()
+
+    def record_inserted(self, event_id):
+        if not self.full_refresh:
+            self.inserted_ids.add(event_id)
+
+    def record_removed(self, event_id):
+        if not self.full_refresh:
+            self.inserted_ids.discard(event_id)
+            self.moved_ids.discard(event_id)
+            self.updated_ids.discard(event_id)
+            self.removed_ids.add(event_id)
+
+    def record_moved(self, event_id):
+        if not self.full_refresh:
+            self.moved_ids.add(event_id)
+
+    def record_updated(self, event_id):
+        if not self.full_refresh:
+            self.updated_ids.add(event_id)
+
+    def merge(self, other):
+        if other.full_refresh:
+            self.set_full_refresh()
+        if self.full_refresh:
+            return
+
+        for cur_id in other.removed_ids:
+            self.record_removed(cur_id)
+        self.inserted_ids |= other.inserted_ids
+        self.moved_ids |= other.moved_ids
+        self.updated_ids |= other.updated_ids
+
+
 class Router:
     def __init__(self):
         self.init_route_state = None
@@ -25,6 +81,21 @@ class Router:
 
         self.level_up_move_defs:Dict[Tuple[str, int, str], route_events.LearnMoveEventDefinition] = {}
         self.defeated_trainers = set()
+
+        # ids of events whose definitions have changed since the last recalc
+        self._dirty_event_ids = set()
+        # ids of folders whose children have changed since the last recalc
+        self._modified_folder_ids = set()
+        self._full_recalc_needed = True
+
+        # every event group in the route, in order, along with the position of each one
+        # single groups being added or removed update it in place, anything else just rebuilds it the next time it's needed
+        self._linear_groups:List[route_events.EventGroup] = []
+        self._linear_idx_lookup:Dict[int, int] = {}
+        self._linear_groups_valid = True
+
+        self._changes = RouteChanges(full_refresh=True)
+        self._search_index = route_search.RouteSearchIndex()
     
     def _reset_events(self):
         self.root_folder = route_events.EventFolder(None, const.ROOT_FOLDER_NAME)
@@ -33,6 +104,25 @@ class Router:
         self.event_item_lookup = {}
 
         self.defeated_trainers = set()
+        self._dirty_event_ids = set()
+        self._modified_folder_ids = set()
+        self._full_recalc_needed = True
+
+        self._linear_groups = []
+        self._linear_idx_lookup = {}
+        self._linear_groups_valid = True
+
+        self._changes.set_full_refresh()
+        self._search_index.reset()
+
+    def pop_changes(self) -> RouteChanges:
+        # returns everything that has changed since the last call
+        result = self._changes
+        self._changes = RouteChanges()
+        return result
+
+    def get_search_results(self, search=None, filter_types=None) -> route_search.RouteSearchResults:
+        return self._search_index.get_results(search=search, filter_types=filter_types)
 
     def _change_version(self, new_version):
         self.pkmn_version = new_version
@@ -116,6 +206,7 @@ class Router:
             # TODO: should double check loaded moves against expected moves from DB, and complain if something doesn't match
             self.level_up_move_defs = {x.get_level_up_key(): x for x in level_up_moves}
         
+        self._mark_dirty()
         self._recalc()
     
     def _add_level_up_moves_for_mon(self, pkmn_base:universal_data_objects.PokemonSpecies):
@@ -140,30 +231,194 @@ class Router:
             self.init_route_state.badges,
             self.init_route_state.inventory
         )
+        self._mark_dirty()
         self._recalc()
+
+    def _invalidate_linear_groups(self):
+        self._linear_groups_valid = False
+
+    def _get_linear_groups(self) -> List[route_events.EventGroup]:
+        if not self._linear_groups_valid:
+            self._linear_groups = []
+            self._add_linear_groups_recursive(self.root_folder)
+            self._linear_idx_lookup = {}
+            self._reindex_linear_groups(0)
+            self._linear_groups_valid = True
+
+        return self._linear_groups
+
+    def _add_linear_groups_recursive(self, cur_folder:route_events.EventFolder):
+        for cur_obj in cur_folder.children:
+            if isinstance(cur_obj, route_events.EventFolder):
+                self._add_linear_groups_recursive(cur_obj)
+            else:
+                self._linear_groups.append(cur_obj)
+
+    def _reindex_linear_groups(self, start_idx):
+        for cur_idx in range(start_idx, len(self._linear_groups)):
+            self._linear_idx_lookup[self._linear_groups[cur_idx].group_id] = cur_idx
+
+    def _get_last_group(self, obj):
+        # the last event group contained in the object (including the object itself), if any
+        if isinstance(obj, route_events.EventGroup):
+            return obj
+
+        for cur_child in reversed(obj.children):
+            result = self._get_last_group(cur_child)
+            if result is not None:
+                return result
+        return None
+
+    def _insert_linear_group(self, event_group:route_events.EventGroup):
+        if not self._linear_groups_valid:
+            return
+
+        # find the closest event group before the new one, by walking back through its siblings, then its parents' siblings, etc.
+        prev_group = None
+        cur_obj = event_group
+        while prev_group is None and cur_obj.parent is not None:
+            siblings = cur_obj.parent.children
+            # most events are added to the end of a folder, so check there before searching the whole folder
+            cur_idx = len(siblings) - 1 if siblings[-1] is cur_obj else siblings.index(cur_obj)
+            for test_obj in reversed(siblings[:cur_idx]):
+                prev_group = self._get_last_group(test_obj)
+                if prev_group is not None:
+                    break
+            cur_obj = cur_obj.parent
+
+        insert_idx = 0 if prev_group is None else self._linear_idx_lookup[prev_group.group_id] + 1
+        self._linear_groups.insert(insert_idx, event_group)
+        self._reindex_linear_groups(insert_idx)
+
+    def _swap_linear_groups(self, moved_obj, displaced_obj):
+        # moving an object within its folder just swaps it with its neighbor
+        if moved_obj is displaced_obj:
+            return
+        if not isinstance(moved_obj, route_events.EventGroup) or not isinstance(displaced_obj, route_events.EventGroup):
+            self._invalidate_linear_groups()
+            return
+        if not self._linear_groups_valid:
+            return
+
+        moved_idx = self._linear_idx_lookup[moved_obj.group_id]
+        displaced_idx = self._linear_idx_lookup[displaced_obj.group_id]
+        self._linear_groups[moved_idx] = displaced_obj
+        self._linear_groups[displaced_idx] = moved_obj
+        self._linear_idx_lookup[moved_obj.group_id] = displaced_idx
+        self._linear_idx_lookup[displaced_obj.group_id] = moved_idx
+
+    def _remove_linear_group(self, event_group:route_events.EventGroup):
+        if not self._linear_groups_valid:
+            return
+
+        remove_idx = self._linear_idx_lookup.pop(event_group.group_id)
+        del self._linear_groups[remove_idx]
+        self._reindex_linear_groups(remove_idx)
+
+    def iter_event_groups(self, start_after_id=None, reverse=False, enabled_only=False) -> Iterator[route_events.EventGroup]:
+        # Iterates over the event groups of the route in order (or in reverse order), skipping over folders
+        # If an id is provided, starts with the event right after (or before) that one. Nothing is returned for ids that aren't event groups
+        # NOTE: don't add or remove events while iterating, collect what needs to change first
+        linear_groups = self._get_linear_groups()
+        step = -1 if reverse else 1
+        if start_after_id is None:
+            cur_idx = len(linear_groups) - 1 if reverse else 0
+        elif start_after_id in self._linear_idx_lookup:
+            cur_idx = self._linear_idx_lookup[start_after_id] + step
+        else:
+            return
+
+        while 0 <= cur_idx < len(linear_groups):
+            cur_group = linear_groups[cur_idx]
+            cur_idx += step
+            if enabled_only and not cur_group.is_enabled():
+                continue
+            yield cur_group
+
+    def _mark_dirty(self, event_obj=None):
+        # Flag an event (or folder) as needing to be re-applied on the next recalc, regardless of its cached states
+        # If no event is provided, the entire route will be recalculated
+        if event_obj is None:
+            self._full_recalc_needed = True
+        else:
+            self._dirty_event_ids.add(event_obj.group_id)
+
+    def _mark_folder_modified(self, folder_obj:route_events.EventFolder):
+        # Flag a folder whose children have been added, removed or re-ordered
+        # the children don't necessarily need to be re-applied, but the folder can't be skipped during the next recalc
+        self._modified_folder_ids.add(folder_obj.group_id)
     
     def _recalc(self):
-        self.event_item_lookup = {}
+        # NOTE: only events which are dirty, or whose starting state has changed, are actually re-applied
+        # Everything before the first changed event keeps its cached states. Once all modifications have been processed,
+        # and a re-applied event produces the same state that the next event was previously calculated from,
+        # the rest of the route (including all of its event items) is left exactly as-is
+        pending_ids = set(
+            x for x in (self._dirty_event_ids | self._modified_folder_ids)
+            if x in self.event_lookup or x == self.root_folder.group_id
+        )
+        self._recursive_recalc(self.root_folder, self.init_route_state, pending_ids, force=self._full_recalc_needed)
 
-        # TODO: only recalc what's necessary, based on a passed-in index
-        # TODO: wrapper for recursive function currently does nothing, may want to remove later
-        self._recursive_recalc(self.root_folder, self.init_route_state)
+        self._dirty_event_ids = set()
+        self._modified_folder_ids = set()
+        self._full_recalc_needed = False
 
-    def _recursive_recalc(self, obj, cur_state):
-        obj.init_state = cur_state
+    def _recursive_recalc(self, obj, cur_state, pending_ids:set, force=False):
+        # returns True once the remainder of the route is known to be unchanged, and thus can be skipped entirely
+        # dirty folders force all of their children to be re-applied too
+        # since things like the enabled status of a folder are inherited by its children
+        force = force or obj.group_id in self._dirty_event_ids
 
         if isinstance(obj, route_events.EventGroup):
+            pending_ids.discard(obj.group_id)
+            if not force and self._is_cached_state_valid(obj, cur_state):
+                return len(pending_ids) == 0
+
             self._calc_single_event(obj, cur_state)
-        else:
-            obj.child_errors = False
-            for inner_obj in obj.children:
-                self._recursive_recalc(inner_obj, cur_state)
-                cur_state = inner_obj.final_state
-                if inner_obj.has_errors():
-                    obj.child_errors = True
-            obj.final_state = cur_state
+            return False
+
+        prev_child_errors = obj.child_errors
+        obj.init_state = cur_state
+        obj.child_errors = False
+        for inner_obj in obj.children:
+            if self._recursive_recalc(inner_obj, cur_state, pending_ids, force=force):
+                # the remaining children are untouched, so the final state of the folder is as well
+                # but any child could have changed its error status
+                obj.child_errors = any(x.has_errors() for x in obj.children)
+                self._record_folder_recalc(obj, prev_child_errors, force)
+                return True
+
+            cur_state = inner_obj.final_state
+            if inner_obj.has_errors():
+                obj.child_errors = True
+
+        obj.final_state = cur_state
+        pending_ids.discard(obj.group_id)
+        self._record_folder_recalc(obj, prev_child_errors, force)
+        return False
+
+    def _record_folder_recalc(self, folder_obj:route_events.EventFolder, prev_child_errors, force):
+        # most folders are passed through on every recalc, but only a few things about them can actually change
+        if folder_obj is self.root_folder:
+            return
+        if force or folder_obj.child_errors != prev_child_errors or folder_obj.group_id in self._modified_folder_ids:
+            self._changes.record_updated(folder_obj.group_id)
+
+    def _is_cached_state_valid(self, event_group:route_events.EventGroup, cur_state:full_route_state.RouteState):
+        # the cached results of an event group are still valid as long as they were calculated from an identical starting state
+        if event_group.init_state is None or event_group.final_state is None:
+            return False
+
+        if event_group.init_state is cur_state:
+            return True
+
+        # compare the (cached) hashes first, so most mismatches can be caught without a full comparison
+        return hash(event_group.init_state) == hash(cur_state) and event_group.init_state == cur_state
 
     def _calc_single_event(self, event_group:route_events.EventGroup, prev_state:full_route_state.RouteState):
+        for cur_item in event_group.event_items:
+            self.event_item_lookup.pop(cur_item.group_id, None)
+
         # kind of ugly, we're going to double-calculate some events this way
         # but basically, need to run once, and see if a particular event causes a level up that results in a new move
         event_group.apply(prev_state)
@@ -189,9 +444,11 @@ class Router:
         
         if to_learn:
             event_group.apply(prev_state, level_up_learn_event_defs=to_learn)
-        
+
         for cur_item in event_group.event_items:
             self.event_item_lookup[cur_item.group_id] = cur_item
+        self._changes.record_updated(event_group.group_id)
+        self._search_index.mark_changed(event_group)
     
     def add_area(self, area_name, insert_after=None, dest_folder_name=const.ROOT_FOLDER_NAME, include_rematches=False):
         trainers_to_add = current_gen_info().trainer_db().get_valid_trainers(trainer_loc=area_name, defeated_trainers=self.defeated_trainers, show_rematches=include_rematches)
@@ -271,6 +528,11 @@ class Router:
         
         self.event_lookup[new_obj.group_id] = new_obj
         parent_obj.insert_child_after(new_obj, after_obj=self.get_event_obj(insert_after), before_obj=self.get_event_obj(insert_before))
+        if isinstance(new_obj, route_events.EventGroup):
+            self._insert_linear_group(new_obj)
+        self._mark_dirty(new_obj)
+        self._mark_folder_modified(parent_obj)
+        self._changes.record_inserted(new_obj.group_id)
         if recalc:
             self._recalc()
         
@@ -295,8 +557,19 @@ class Router:
             if cur_event.event_definition.trainer_def.second_trainer_name in self.defeated_trainers:
                 self.defeated_trainers.remove(cur_event.event_definition.trainer_def.second_trainer_name)
         
+        if isinstance(cur_event, route_events.EventGroup):
+            self._remove_linear_group(cur_event)
+        else:
+            self._invalidate_linear_groups()
+
+        self._mark_folder_modified(cur_event.parent)
         cur_event.parent.remove_child(cur_event)
         del self.event_lookup[cur_event.group_id]
+        self._changes.record_removed(cur_event.group_id)
+        if isinstance(cur_event, route_events.EventGroup):
+            self._search_index.remove_group(cur_event.group_id)
+            for cur_item in cur_event.event_items:
+                self.event_item_lookup.pop(cur_item.group_id, None)
 
         # once we've successfully removed the event, forget the lookup if it was a folder
         if isinstance(cur_event, route_events.EventFolder):
@@ -311,7 +584,12 @@ class Router:
         # NOTE: can only move within a folder. To change folders, need to call a separate function
         try:
             obj_to_move = self.get_event_obj(event_id)
+            orig_idx = obj_to_move.parent.children.index(obj_to_move)
             obj_to_move.parent.move_child(obj_to_move, move_up_flag)
+            self._mark_folder_modified(obj_to_move.parent)
+            self._swap_linear_groups(obj_to_move, obj_to_move.parent.children[orig_idx])
+            self._changes.record_moved(obj_to_move.group_id)
+            self._changes.record_moved(obj_to_move.parent.children[orig_idx].group_id)
             self._recalc()
         except Exception as e:
             logger.error(f"Failed to move event object: {event_id}")
@@ -324,6 +602,7 @@ class Router:
             obj_to_highlight = self.get_event_obj(event_id)
             if isinstance(obj_to_highlight, route_events.EventGroup):
                 obj_to_highlight.event_definition.toggle_highlight()
+                self._changes.record_updated(obj_to_highlight.group_id)
         except Exception as e:
             logger.error(f"Failed to toggle highlight for event: {event_id}")
             logger.exception(e)
@@ -361,11 +640,20 @@ class Router:
                 raise ValueError(f"Cannot transfer a folder into itself or a child folder")
 
         # now that we know everything is valid, actualy make the updates
+        self._invalidate_linear_groups()
+        self._search_index.clear_results()
         for cur_event_id in event_id_list:
             cur_event = self.event_lookup.get(cur_event_id)
             dest_folder = self.folder_lookup.get(dest_folder_name)
+            was_enabled = cur_event.is_enabled()
+            self._mark_folder_modified(cur_event.parent)
             cur_event.parent.remove_child(cur_event)
             dest_folder.insert_child_after(cur_event, after_obj=None)
+            self._mark_folder_modified(dest_folder)
+            self._changes.record_moved(cur_event.group_id)
+            # changes to the starting state are picked up automatically, but inherited enabled status is not
+            if cur_event.is_enabled() != was_enabled:
+                self._mark_dirty(cur_event)
 
         self._recalc()
     
@@ -378,6 +666,7 @@ class Router:
             if new_event_def.get_event_type() != const.TASK_NOTES_ONLY:
                 raise ValueError(f"Can only assign notes to EventFolders")
             event_group_obj.event_definition = new_event_def
+            self._mark_dirty(event_group_obj)
 
         elif isinstance(event_group_obj, route_events.EventItem):
             # TODO: kinda gross, we allow updating some items (just levelup learn moves)
@@ -392,6 +681,7 @@ class Router:
                 raise ValueError(f"Invalid level up move: {level_up_key}")
             else:
                 self.level_up_move_defs[level_up_key] = new_event_def.learn_move
+                self._mark_dirty()
 
         else:
             if event_group_obj.event_definition.trainer_def is not None:
@@ -402,11 +692,13 @@ class Router:
                 self.defeated_trainers.add(new_event_def.trainer_def.trainer_name)
 
             event_group_obj.event_definition = new_event_def
+            self._mark_dirty(event_group_obj)
 
         self._recalc()
 
     def replace_levelup_move_event(self, new_event_def:route_events.LearnMoveEventDefinition):
         self.level_up_move_defs[new_event_def.get_level_up_key()] = new_event_def
+        self._mark_dirty()
         self._recalc()
 
     def is_valid_levelup_move(self, new_event_def:route_events.LearnMoveEventDefinition):
@@ -417,6 +709,7 @@ class Router:
         folder_obj.name = new_name
         del self.folder_lookup[cur_name]
         self.folder_lookup[new_name] = folder_obj
+        self._changes.record_updated(folder_obj.group_id)
 
     def serialize_metadata(self, deep=False):
         return self.root_folder.serialize_metadata(deep=deep)
@@ -432,15 +725,16 @@ class Router:
             const.EVENTS: [self.root_folder.serialize()]
         }
 
-    def save(self, name):
+    def save(self, name, compact=False):
         if not os.path.exists(const.SAVED_ROUTES_DIR):
             os.mkdir(const.SAVED_ROUTES_DIR)
 
-        final_path = os.path.join(const.SAVED_ROUTES_DIR, f"{name}.json")
-        io_utils.backup_file_if_exists(final_path)
+        # back up the route in either format, so that switching formats doesn't leave two copies of the same route around
+        for cur_ext in const.ALL_ROUTE_EXTENSIONS:
+            io_utils.backup_file_if_exists(os.path.join(const.SAVED_ROUTES_DIR, f"{name}{cur_ext}"))
 
-        with open(final_path, 'w') as f:
-            json.dump(self.serialize(), f, indent=4)
+        final_ext = const.COMPACT_ROUTE_EXTENSION if compact else const.ROUTE_EXTENSION
+        route_files.write_route(os.path.join(const.SAVED_ROUTES_DIR, f"{name}{final_ext}"), self.serialize())
 
     def new_route(self, solo_mon, base_route_path=None, pkmn_version=const.YELLOW_VERSION, custom_dvs=None, custom_ability_idx=None, custom_nature=None):
         self._change_version(pkmn_version)
@@ -451,11 +745,16 @@ class Router:
             self.load(base_route_path, load_events_only=True)
     
     def load(self, route_path, load_events_only=False):
+        for _ in self.iter_load(route_path, load_events_only=load_events_only, chunk_size=None):
+            pass
+
+    def iter_load(self, route_path, load_events_only=False, chunk_size=const.ROUTE_LOAD_CHUNK_SIZE):
+        # Loads the route a chunk of events at a time, and yields the number of events loaded so far after each chunk
+        # each chunk is recalculated before yielding, so the part of the route loaded so far is fully usable while the rest loads
+        # previously loaded chunks keep their cached states, so nothing gets applied more than once
         # if we're using a template, we're going to path the full path in
         # otherwise, the name should exist in one of the two save dirs
-        with open(route_path, 'r') as f:
-            result = json.load(f)
-        
+        result = route_files.read_route(route_path)
         self._reset_events()
 
         if not load_events_only:
@@ -478,12 +777,20 @@ class Router:
                 custom_nature=result.get(const.NATURE_KEY),
             )
         
+        num_loaded = 0
         if len(result[const.EVENTS]) > 0:
-            self._load_events_recursive(self.root_folder, result[const.EVENTS][0])
+            for _ in self._load_events_recursive(self.root_folder, result[const.EVENTS][0]):
+                num_loaded += 1
+                if chunk_size and num_loaded % chunk_size == 0:
+                    self._recalc()
+                    yield num_loaded
 
-        self._recalc()
+        if num_loaded == 0 or not chunk_size or num_loaded % chunk_size != 0:
+            self._recalc()
+            yield num_loaded
     
     def _load_events_recursive(self, parent_folder:route_events.EventFolder, json_obj):
+        # yields after each event is added, folders included
         for event_json in json_obj[const.EVENTS]:
             if const.EVENT_FOLDER_NAME in event_json:
                 self.add_event_object(
@@ -494,14 +801,16 @@ class Router:
                     folder_expanded=event_json.get(const.EXPANDED_KEY, True),
                     folder_enabled=event_json.get(const.ENABLED_KEY, True),
                 )
+                yield
                 inner_parent = self.folder_lookup[event_json[const.EVENT_FOLDER_NAME]]
-                self._load_events_recursive(inner_parent, event_json)
+                yield from self._load_events_recursive(inner_parent, event_json)
             else:
                 self.add_event_object(
                     event_def=route_events.EventDefinition.deserialize(event_json),
                     dest_folder_name=parent_folder.name,
                     recalc=False
                 )
+                yield
     
     def export_notes(self, name):
         dest_path = os.path.join(const.SAVED_ROUTES_DIR, f"{name}_notes.txt")
@@ -10,6 +10,8 @@ logger = logging.getLogger(__name__)
 
 
 class BagItem:
+    # NOTE: BagItems are shared between inventory snapshots, so they should never be modified after creation.
+    # Changing the count of an item in the bag means replacing the BagItem instead
     def __init__(self, base_item, num):
         self.base_item:pkmn.universal_data_objects.BaseItem = base_item
         self.num = num
@@ -35,6 +37,8 @@ class Inventory:
         self._bag_limit = bag_limit
         self._item_lookup = dict()
         self._reindex_lookup()
+        # NOTE: calculated lazily, since inventories are frequently modified right after being copied
+        self._hash = None
 
     def serialize(self):
         return {
@@ -51,10 +55,21 @@ class Inventory:
         self._item_lookup = {x.base_item.name: idx for idx, x in enumerate(self.cur_items)}
 
     def _copy(self):
-        return Inventory(cur_money=self.cur_money, cur_items=self.cur_items, bag_limit=self._bag_limit)
+        # copies share the bag with the original, since most state changes (e.g. money from a trainer) don't touch it
+        # anything that needs to change the bag should call _copy_bag() on the result first
+        result = Inventory(cur_money=self.cur_money, bag_limit=self._bag_limit)
+        result.cur_items = self.cur_items
+        result._item_lookup = self._item_lookup
+        return result
+
+    def _copy_bag(self):
+        # only the list and lookup are copied, the individual BagItems are still shared
+        self.cur_items = list(self.cur_items)
+        self._item_lookup = dict(self._item_lookup)
 
     def add_item(self, base_item:pkmn.universal_data_objects.BaseItem, num, is_purchase=False, force=False):
         result = self._copy()
+        result._copy_bag()
         if is_purchase:
             total_cost = num * base_item.purchase_price
             if total_cost > result.cur_money and not force:
@@ -66,7 +81,8 @@ class Inventory:
             if base_item.is_key_item and not force:
                 raise ValueError(f"Cannot have multiple of the same key item: {base_item.name}")
 
-            result.cur_items[result._item_lookup[base_item.name]].num += num
+            item_idx = result._item_lookup[base_item.name]
+            result.cur_items[item_idx] = BagItem(base_item, result.cur_items[item_idx].num + num)
         elif self._bag_limit is not None and len(result.cur_items) >= self._bag_limit and not force:
             raise ValueError(f"Cannot add more than {self._bag_limit} items to bag")
         elif self._bag_limit is not None and len(result.cur_items) < self._bag_limit:
@@ -94,15 +110,18 @@ class Inventory:
         if base_item.is_key_item and is_sale and not force:
             raise ValueError(f"Cannot sell key item: {base_item.name}")
 
-        result = self._copy()
-        bag_item = result.cur_items[result._item_lookup[base_item.name]]
+        item_idx = self._item_lookup[base_item.name]
+        bag_item = self.cur_items[item_idx]
         if bag_item.num < num and not force:
             raise ValueError(f"Cannot sell/use {num} {base_item.name} when you only have {bag_item.num}")
 
-        bag_item.num -= num
-        if bag_item.num <= 0:
-            del result.cur_items[result._item_lookup[base_item.name]]
+        result = self._copy()
+        result._copy_bag()
+        if bag_item.num - num <= 0:
+            del result.cur_items[item_idx]
             result._reindex_lookup()
+        else:
+            result.cur_items[item_idx] = BagItem(base_item, bag_item.num - num)
 
         if is_sale:
             result.cur_money += (base_item.sell_price * num)
@@ -116,15 +135,25 @@ class Inventory:
         if self.cur_money != other.cur_money:
             return False
 
+        if self.cur_items is other.cur_items:
+            return True
+
         if len(self.cur_items) != len(other.cur_items):
             return False
 
         for cur_idx in range(len(self.cur_items)):
+            if self.cur_items[cur_idx] is other.cur_items[cur_idx]:
+                continue
             if self.cur_items[cur_idx] != other.cur_items[cur_idx]:
                 return False
 
         return True
 
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash((self.cur_money, tuple((x.base_item.name, x.num) for x in self.cur_items)))
+        return self._hash
+
 class SoloPokemon:
     """
     This is not considered a mutable object!!!
@@ -192,22 +221,22 @@ class SoloPokemon:
             realized_stat_xp._is_stat_xp = True
         self.realized_stat_xp = realized_stat_xp
 
+        # NOTE: stat xp blocks are never modified in place, so they can be shared between snapshots
         if unrealized_stat_xp is None:
-            unrealized_stat_xp = copy(self.realized_stat_xp)
+            unrealized_stat_xp = self.realized_stat_xp
         self.unrealized_stat_xp = unrealized_stat_xp
 
-        if gained_stat_xp is None:
-            gained_stat_xp = copy(self._empty_stat_block)
-
         if const.DEBUG_MODE:
             logger.info(f"Gaining {gained_xp}, was at {self.cur_xp}, now at {self.cur_xp + gained_xp}. Before gain, needed {self.xp_to_next_level} TNL")
         self.cur_xp += gained_xp
+        # stat xp is collected the same way regardless of leveling up, so only build a new block when there's something to add
+        if gained_stat_xp is not None:
+            self.unrealized_stat_xp = self.unrealized_stat_xp.add(gained_stat_xp)
 
         if gained_xp < self.xp_to_next_level:
             # gained xp did not cause a level up
             # just keep collecting unrealized stat xp, and keep track of new XP
             self.xp_to_next_level -= gained_xp
-            self.unrealized_stat_xp = self.unrealized_stat_xp.add(gained_stat_xp)
             if const.DEBUG_MODE:
                 logger.info(f"NO level up ocurred, still need {self.xp_to_next_level} TNL")
         else:
@@ -221,14 +250,12 @@ class SoloPokemon:
                 # keep track of stat xp, but have to rely on vitamins to "realize" them
                 self.cur_xp = pkmn.universal_utils.level_lookups[self.species_def.growth_rate].get_xp_for_level(100)
                 self.xp_to_next_level = 0
-                self.unrealized_stat_xp = self.unrealized_stat_xp.add(gained_stat_xp)
                 if const.DEBUG_MODE:
                     logger.info(f"At level 100")
             else:
                 # gained xp DID cause a level up
                 # realize ALL stat XP into new stats, reset unrealized stat XP, and then update level metadata
-                self.unrealized_stat_xp = self.unrealized_stat_xp.add(gained_stat_xp)
-                self.realized_stat_xp = copy(self.unrealized_stat_xp)
+                self.realized_stat_xp = self.unrealized_stat_xp
                 self.xp_to_next_level = level_info[1]
                 if const.DEBUG_MODE:
                     logger.info(f"Now level {self.cur_level}, {self.xp_to_next_level} TNL")
@@ -245,6 +272,7 @@ class SoloPokemon:
             self.percent_xp_to_next_level = int((self.xp_to_next_level / (self.cur_xp + self.xp_to_next_level - last_level_xp)) * 100)
             self.percent_xp_to_next_level_str = f"{self.percent_xp_to_next_level} %"
         self.cur_stats = self.species_def.stats.calc_level_stats(self.cur_level, self.dvs, self.realized_stat_xp, badges, nature, self.held_item)
+        self._hash = None
 
     def serialize(self):
         return {
@@ -287,6 +315,18 @@ class SoloPokemon:
 
         return True
 
+    def __hash__(self):
+        # NOTE: only needs to be consistent with __eq__, so skip the fields that are derived from the others
+        if self._hash is None:
+            self._hash = hash((
+                self.species_def.name,
+                self.cur_xp,
+                self.held_item,
+                self.unrealized_stat_xp,
+                tuple(self.move_list),
+            ))
+        return self._hash
+
     def get_net_gain_from_stat_xp(self, badges):
         if badges is None:
             badges = pkmn.universal_data_objects.BadgeList()
@@ -305,7 +345,7 @@ class SoloPokemon:
     def get_pkmn_obj(self, badges, stage_modifiers=None):
         # allow badge boosting, and also normal stat boosting
         if stage_modifiers is None:
-            stage_modifiers = pkmn.universal_data_objects.StageModifiers()
+            stage_modifiers = pkmn.universal_data_objects.NEUTRAL_STAGE_MODIFIERS
 
         battle_stats = self.species_def.stats.calc_battle_stats(self.cur_level, self.dvs, self.realized_stat_xp, stage_modifiers, badges, self.nature, self.held_item)
 
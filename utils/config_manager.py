@@ -23,6 +23,10 @@ class Config:
     DEFAULT_IGNORE_ACCURACY = False
     DEFAULT_FORCE_FULL_SEARCH = False
     DEFAULT_DAMAGE_SEARCH_DEPTH = 20
+    DEFAULT_BATTLE_SUMMARY_WORKERS = 0
+    DEFAULT_DAMAGE_CACHE_SIZE = 8192
+    DEFAULT_COMPACT_ROUTES = False
+    DEFAULT_VIRTUAL_ROUTE_LIST = False
     DEFAULT_DEBUG_MODE = False
     DEFAULT_AUTO_SWITCH = True
     DEFAULT_NOTES_VISIBILITY = False
@@ -62,6 +66,10 @@ class Config:
         self._ignore_accuracy = raw.get(const.IGNORE_ACCURACY_IN_DAMAGE_CALCS, self.DEFAULT_IGNORE_ACCURACY)
         self._damage_search_depth = raw.get(const.DAMAGE_SEARCH_DEPTH, self.DEFAULT_DAMAGE_SEARCH_DEPTH)
         self._force_full_search = raw.get(const.FORCE_FULL_SEARCH, self.DEFAULT_FORCE_FULL_SEARCH)
+        self._battle_summary_workers = raw.get(const.BATTLE_SUMMARY_WORKERS, self.DEFAULT_BATTLE_SUMMARY_WORKERS)
+        self._damage_cache_size = raw.get(const.DAMAGE_CACHE_SIZE, self.DEFAULT_DAMAGE_CACHE_SIZE)
+        self._compact_routes = raw.get(const.COMPACT_ROUTES_KEY, self.DEFAULT_COMPACT_ROUTES)
+        self._virtual_route_list = raw.get(const.VIRTUAL_ROUTE_LIST_KEY, self.DEFAULT_VIRTUAL_ROUTE_LIST)
 
         self._custom_font_name = raw.get(const.CUSTOM_FONT_NAME_KEY, self.DEFAULT_FONT_NAME)
         self._debug_mode = raw.get(const.DEBUG_MODE_KEY, self.DEFAULT_DEBUG_MODE)
@@ -93,6 +101,10 @@ class Config:
                 const.IGNORE_ACCURACY_IN_DAMAGE_CALCS: self._ignore_accuracy,
                 const.DAMAGE_SEARCH_DEPTH: self._damage_search_depth,
                 const.FORCE_FULL_SEARCH: self._force_full_search,
+                const.BATTLE_SUMMARY_WORKERS: self._battle_summary_workers,
+                const.DAMAGE_CACHE_SIZE: self._damage_cache_size,
+                const.COMPACT_ROUTES_KEY: self._compact_routes,
+                const.VIRTUAL_ROUTE_LIST_KEY: self._virtual_route_list,
                 const.DEBUG_MODE_KEY: self._debug_mode,
                 const.AUTO_SWITCH_KEY: self._auto_switch,
                 const.NOTES_VISIBILITY_KEY: self._notes_visibility,
@@ -178,6 +190,22 @@ class Config:
         self._force_full_search = do_force
         self._save()
 
+    def set_battle_summary_workers(self, num_workers):
+        self._battle_summary_workers = num_workers
+        self._save()
+
+    def set_damage_cache_size(self, cache_size):
+        self._damage_cache_size = cache_size
+        self._save()
+
+    def set_compact_routes(self, use_compact_routes):
+        self._compact_routes = use_compact_routes
+        self._save()
+
+    def set_virtual_route_list(self, use_virtual_route_list):
+        self._virtual_route_list = use_virtual_route_list
+        self._save()
+
     def set_debug_mode(self, is_debug_mode):
         self._debug_mode = is_debug_mode
         self._save()
@@ -251,6 +279,26 @@ class Config:
     def do_force_full_search(self):
         return self._force_full_search
     
+    def get_battle_summary_workers(self):
+        # 0 means all battle summary calculations are run directly, without any worker processes
+        result = self._battle_summary_workers
+        if not isinstance(result, int) or result < 0:
+            result = self.DEFAULT_BATTLE_SUMMARY_WORKERS
+        return result
+    
+    def get_damage_cache_size(self):
+        # max number of entries in each of the damage calc caches. 0 disables caching entirely
+        result = self._damage_cache_size
+        if not isinstance(result, int) or result < 0:
+            result = self.DEFAULT_DAMAGE_CACHE_SIZE
+        return result
+    
+    def use_compact_routes(self):
+        return self._compact_routes
+    
+    def use_virtual_route_list(self):
+        return self._virtual_route_list
+    
     def do_ignore_accuracy(self):
         return self._ignore_accuracy
     
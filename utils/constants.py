@@ -18,6 +18,7 @@ class Constants:
         self.SOURCE_ROOT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
         self.GLOBAL_CONFIG_DIR = os.path.realpath(appdirs.user_data_dir(appname=self.APP_NAME, appauthor=self.APP_NAME))
         self.GLOBAL_CONFIG_FILE = os.path.join(self.GLOBAL_CONFIG_DIR, "config.json")
+        self.GEN_SNAPSHOT_DIR = os.path.join(self.GLOBAL_CONFIG_DIR, "gen_snapshots")
         self.POKEMON_RAW_DATA = os.path.join(self.SOURCE_ROOT_PATH, "raw_pkmn_data")
         self.ASSETS_PATH = os.path.join(self.SOURCE_ROOT_PATH, "assets")
 
@@ -31,6 +32,9 @@ class Constants:
         self.OUTDATED_ROUTES_DIR = None
         self.CUSTOM_GENS_DIR = None
         self.ALL_USER_DATA_PATHS = []
+        self.ROUTE_EXTENSION = ".json"
+        self.COMPACT_ROUTE_EXTENSION = ".jsonz"
+        self.ALL_ROUTE_EXTENSIONS = [self.ROUTE_EXTENSION, self.COMPACT_ROUTE_EXTENSION]
 
         self.CUSTOM_GEN_META_FILE_NAME = "custom_gen.json"
         self.CUSTOM_GEN_NAME_KEY = "custom_gen_name"
@@ -57,6 +61,27 @@ class Constants:
         self.TYPE_INFO_FILE_NAME = "type_info.json"
         self.FIGHTS_INFO_FILE_NAME = "fights_info.json"
 
+        self.ENCOUNTER_TABLES_KEY = "encounter_tables"
+        self.ENCOUNTER_MAP_NAME_KEY = "map_name"
+        self.ENCOUNTER_BASE_RATE_KEY = "base_rate"
+        self.ENCOUNTERS_KEY = "encounters"
+        self.ENCOUNTER_PKMN_KEY = "pkmn"
+        self.ENCOUNTER_LEVEL_KEY = "level"
+        self.ENCOUNTER_RATE_KEY = "rate"
+
+        self.ENCOUNTER_GRASS = "grass_cave"
+        self.ENCOUNTER_SURF = "surfing"
+        self.ENCOUNTER_OLD_ROD = "old_rod"
+        self.ENCOUNTER_GOOD_ROD = "good_rod"
+        self.ENCOUNTER_SUPER_ROD = "super_rod"
+        self.ENCOUNTER_METHODS = [
+            self.ENCOUNTER_GRASS,
+            self.ENCOUNTER_SURF,
+            self.ENCOUNTER_OLD_ROD,
+            self.ENCOUNTER_GOOD_ROD,
+            self.ENCOUNTER_SUPER_ROD,
+        ]
+
         self.SPECIES_KEY = "species"
         self.NAME_KEY = "name"
         self.STATS_KEY = "stats"
@@ -210,6 +235,7 @@ class Constants:
         self.TASK_RARE_CANDY = "Use Rare Candy"
         self.TASK_VITAMIN = "Use Vitamin"
         self.TASK_FIGHT_WILD_PKMN = "Fight Wild Pkmn"
+        self.TASK_GRIND_ENCOUNTERS = "Grind Wild Encounters"
         self.TASK_GET_FREE_ITEM = "Acquire Item"
         self.TASK_PURCHASE_ITEM = "Purchase Item"
         self.TASK_USE_ITEM = "Use/Drop Item"
@@ -235,6 +261,7 @@ class Constants:
         self.ROUTE_EVENT_TYPES = [
             self.TASK_TRAINER_BATTLE,
             self.TASK_FIGHT_WILD_PKMN,
+            self.TASK_GRIND_ENCOUNTERS,
             self.TASK_LEARN_MOVE_LEVELUP,
             self.TASK_LEARN_MOVE_TM,
             self.TASK_HOLD_ITEM,
@@ -272,6 +299,7 @@ class Constants:
         self.NO_POKEMON = "No Valid Pokemon"
         self.NO_ITEM = "No Valid Items"
         self.NO_MOVE = "No Valid Moves"
+        self.NO_ENCOUNTERS = "No Encounter Data"
         self.UNUSED_TRAINER_LOC = "Unused"
         self.EVENTS = "events"
         self.ENABLED_KEY = "Enabled"
@@ -318,6 +346,10 @@ class Constants:
         self.IGNORE_ACCURACY_IN_DAMAGE_CALCS = "ignore_accuracy_in_damage_calcs"
         self.DAMAGE_SEARCH_DEPTH = "damage_search_depth"
         self.FORCE_FULL_SEARCH = "force_full_search"
+        self.BATTLE_SUMMARY_WORKERS = "battle_summary_workers"
+        self.DAMAGE_CACHE_SIZE = "damage_cache_size"
+        self.COMPACT_ROUTES_KEY = "compact_routes"
+        self.VIRTUAL_ROUTE_LIST_KEY = "virtual_route_list"
 
         self.CUSTOM_FONT_NAME_KEY = "custom_font_name"
         self.DEBUG_MODE_KEY = "debug_mode"
@@ -339,6 +371,9 @@ class Constants:
         self.BADGE_BOOST_LABEL = "Badge Boost Calculator"
 
         self.ROOT_FOLDER_NAME = "ROOT"
+        self.ROUTE_LOAD_CHUNK_SIZE = 200
+        # number of extra rows kept above and below the visible part of a virtualized route list
+        self.VIRTUAL_ROUTE_LIST_BUFFER = 100
         self.FORCE_QUIT_EVENT = "<<PkmnXpForceQuit>>"
         self.ROUTE_LIST_REFRESH_EVENT = "<<RouteListRefresh>>"
         self.BATTLE_SUMMARY_SHOWN_EVENT = "<<BattleSummaryShown>>"
@@ -34,15 +34,17 @@ def get_safe_path_no_collision(base_folder, name, ext=""):
 
 
 def get_existing_route_path(route_name) -> str:
-    result = os.path.join(const.SAVED_ROUTES_DIR, f"{route_name}.json")
-    if not os.path.exists(result):
-        result = os.path.join(const.OUTDATED_ROUTES_DIR, f"{route_name}.json")
+    for cur_dir in (const.SAVED_ROUTES_DIR, const.OUTDATED_ROUTES_DIR):
+        for cur_ext in const.ALL_ROUTE_EXTENSIONS:
+            result = os.path.join(cur_dir, f"{route_name}{cur_ext}")
+            if os.path.exists(result):
+                return result
     
-    return result
+    return os.path.join(const.OUTDATED_ROUTES_DIR, f"{route_name}{const.ROUTE_EXTENSION}")
 
 
 def get_existing_route_names(filter_text="", load_backups=False):
-    loaded_routes = []
+    loaded_routes = set()
     filter_text = filter_text.lower()
 
     if os.path.exists(const.SAVED_ROUTES_DIR):
@@ -50,9 +52,9 @@ def get_existing_route_names(filter_text="", load_backups=False):
             name, ext = os.path.splitext(fragment)
             if filter_text not in name.lower():
                 continue
-            if ext != ".json":
+            if ext not in const.ALL_ROUTE_EXTENSIONS:
                 continue
-            loaded_routes.append(name)
+            loaded_routes.add(name)
     
     if load_backups:
         if os.path.exists(const.OUTDATED_ROUTES_DIR):
@@ -60,9 +62,9 @@ def get_existing_route_names(filter_text="", load_backups=False):
                 name, ext = os.path.splitext(fragment)
                 if filter_text not in name.lower():
                     continue
-                if ext != ".json":
+                if ext not in const.ALL_ROUTE_EXTENSIONS:
                     continue
-                loaded_routes.append(name)
+                loaded_routes.add(name)
 
     return sorted(loaded_routes, key=str.casefold)
 
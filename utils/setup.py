@@ -44,24 +44,24 @@ def route_startup_check_for_upgrade(main_app:Tk):
 
 
 def init_base_generations():
-    gen_factory._gen_factory.register_gen(gen_one_object.gen_one_red, const.RED_VERSION)
-    gen_factory._gen_factory.register_gen(gen_one_object.gen_one_blue, const.BLUE_VERSION)
-    gen_factory._gen_factory.register_gen(gen_one_object.gen_one_yellow, const.YELLOW_VERSION)
+    gen_factory._gen_factory.register_gen(gen_one_object.create_gen_one_red, const.RED_VERSION)
+    gen_factory._gen_factory.register_gen(gen_one_object.create_gen_one_blue, const.BLUE_VERSION)
+    gen_factory._gen_factory.register_gen(gen_one_object.create_gen_one_yellow, const.YELLOW_VERSION)
 
-    gen_factory._gen_factory.register_gen(gen_two_object.gen_two_gold, const.GOLD_VERSION)
-    gen_factory._gen_factory.register_gen(gen_two_object.gen_two_silver, const.SILVER_VERSION)
-    gen_factory._gen_factory.register_gen(gen_two_object.gen_two_crystal, const.CRYSTAL_VERSION)
+    gen_factory._gen_factory.register_gen(gen_two_object.create_gen_two_gold, const.GOLD_VERSION)
+    gen_factory._gen_factory.register_gen(gen_two_object.create_gen_two_silver, const.SILVER_VERSION)
+    gen_factory._gen_factory.register_gen(gen_two_object.create_gen_two_crystal, const.CRYSTAL_VERSION)
 
-    gen_factory._gen_factory.register_gen(gen_three_object.gen_three_ruby, const.RUBY_VERSION)
-    gen_factory._gen_factory.register_gen(gen_three_object.gen_three_sapphire, const.SAPPHIRE_VERSION)
-    gen_factory._gen_factory.register_gen(gen_three_object.gen_three_emerald, const.EMERALD_VERSION)
-    gen_factory._gen_factory.register_gen(gen_three_object.gen_three_fire_red, const.FIRE_RED_VERSION)
-    gen_factory._gen_factory.register_gen(gen_three_object.gen_three_leaf_green, const.LEAF_GREEN_VERSION)
+    gen_factory._gen_factory.register_gen(gen_three_object.create_gen_three_ruby, const.RUBY_VERSION)
+    gen_factory._gen_factory.register_gen(gen_three_object.create_gen_three_sapphire, const.SAPPHIRE_VERSION)
+    gen_factory._gen_factory.register_gen(gen_three_object.create_gen_three_emerald, const.EMERALD_VERSION)
+    gen_factory._gen_factory.register_gen(gen_three_object.create_gen_three_fire_red, const.FIRE_RED_VERSION)
+    gen_factory._gen_factory.register_gen(gen_three_object.create_gen_three_leaf_green, const.LEAF_GREEN_VERSION)
 
-    gen_factory._gen_factory.register_gen(gen_four_object.gen_four_platinum, const.PLATINUM_VERSION)
-    gen_factory._gen_factory.register_gen(gen_four_object.gen_four_diamond, const.DIAMOND_VERSION)
-    gen_factory._gen_factory.register_gen(gen_four_object.gen_four_pearl, const.PEARL_VERSION)
-    gen_factory._gen_factory.register_gen(gen_four_object.gen_four_heartgold, const.HEART_GOLD_VERSION)
-    gen_factory._gen_factory.register_gen(gen_four_object.gen_four_soulsilver, const.SOUL_SILVER_VERSION)
+    gen_factory._gen_factory.register_gen(gen_four_object.create_gen_four_platinum, const.PLATINUM_VERSION)
+    gen_factory._gen_factory.register_gen(gen_four_object.create_gen_four_diamond, const.DIAMOND_VERSION)
+    gen_factory._gen_factory.register_gen(gen_four_object.create_gen_four_pearl, const.PEARL_VERSION)
+    gen_factory._gen_factory.register_gen(gen_four_object.create_gen_four_heartgold, const.HEART_GOLD_VERSION)
+    gen_factory._gen_factory.register_gen(gen_four_object.create_gen_four_soulsilver, const.SOUL_SILVER_VERSION)
 
     gen_factory.change_version(const.YELLOW_VERSION)
\ No newline at end of file
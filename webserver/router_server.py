@@ -111,10 +111,17 @@ def create_new_route():
 def load_route():
     _controller.load_route(
         parse_str("full_path_to_route", optional=False),
+        parse_bool_int("incremental", default=False),
     )
     return {}
 
 
+@_server.route("/continue_route_load", methods=["POST"])
+def continue_route_load():
+    _controller.continue_route_load()
+    return {}
+
+
 @_server.route("/customize_innate_stats", methods=["POST"])
 def customize_innate_stats():
     _controller.customize_innate_stats(
@@ -453,6 +460,11 @@ def is_record_mode_active():
     return simple_result(_controller.is_record_mode_active())
 
 
+@_server.route("/is_route_loading", methods=["GET"])
+def is_route_loading():
+    return simple_result(_controller.is_route_loading())
+
+
 @_server.route("/get_move_idx", methods=["GET"])
 def get_move_idx():
     return simple_result(